@@ -2,7 +2,7 @@ from neo.Network.Mixins import InventoryMixin
 from neo.Network.InventoryType import InventoryType
 from neo.Core.BlockBase import BlockBase
 from neo.Core.TX.Transaction import Transaction, TransactionType
-from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.IO.BinaryWriter import BinaryWriter
 from neo.IO.MemoryStream import StreamManager
 from neo.Core.Cryptography.MerkleTree import MerkleTree
@@ -204,15 +204,14 @@ class Block(BlockBase, InventoryMixin):
         Deserialize a block from raw bytes.
 
         Args:
-            byts:
+            byts (bytes, bytearray, memoryview):
 
         Returns:
             Block:
         """
         block = Block()
         block.__is_trimmed = True
-        ms = StreamManager.GetStream(byts)
-        reader = BinaryReader(ms)
+        reader = BufferReader(byts)
 
         block.DeserializeUnsigned(reader)
         reader.ReadByte()
@@ -220,22 +219,16 @@ class Block(BlockBase, InventoryMixin):
         witness.Deserialize(reader)
         block.Script = witness
 
-        bc = GetBlockchain()
-        tx_list = []
-        for tx_hash in reader.ReadHashes():
-            tx = bc.GetTransaction(tx_hash)[0]
-            if not tx:
-                raise Exception(
-                    "Could not find transaction!\n Are you running code against a valid Blockchain instance?\n Tests that accesses transactions or size of a block but inherit from NeoTestCase instead of BlockchainFixtureTestCase will not work.")
-            tx_list.append(tx)
+        tx_list = GetBlockchain().GetTransactions(reader.ReadHashes())
+        if any(tx is None for tx in tx_list):
+            raise Exception(
+                "Could not find transaction!\n Are you running code against a valid Blockchain instance?\n Tests that accesses transactions or size of a block but inherit from NeoTestCase instead of BlockchainFixtureTestCase will not work.")
 
         if len(tx_list) < 1:
             raise Exception("Invalid block, no transactions found for block %s " % block.Index)
 
         block.Transactions = tx_list
 
-        StreamManager.ReleaseStream(ms)
-
         return block
 
     def GetHashCode(self):
@@ -284,7 +277,7 @@ class Block(BlockBase, InventoryMixin):
         Returns a byte array that contains only the block header and transaction hash.
 
         Returns:
-            bytes:
+            bytes: not hexlified
         """
         ms = StreamManager.GetStream()
         writer = BinaryWriter(ms)
@@ -293,6 +286,6 @@ class Block(BlockBase, InventoryMixin):
         self.Script.Serialize(writer)
 
         writer.WriteHashes([tx.Hash.ToBytes() for tx in self.Transactions])
-        retVal = ms.ToArray()
+        retVal = ms.getvalue()
         StreamManager.ReleaseStream(ms)
         return retVal
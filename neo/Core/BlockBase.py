@@ -1,7 +1,6 @@
 from .Mixins import VerifiableMixin
 from neo.Core.Cryptography.Helper import bin_dbl_sha256
 from neo.Core.Cryptography.Crypto import Crypto
-import binascii
 from neo.Core.Helper import Helper
 from neo.Blockchain import GetBlockchain, GetGenesis
 from neo.Core.Witness import Witness
@@ -35,9 +34,7 @@ class BlockBase(VerifiableMixin):
             UInt256: containing the hash of the data.
         """
         if not self.__hash:
-            hashdata = self.RawData()
-            ba = bytearray(binascii.unhexlify(hashdata))
-            hash = bin_dbl_sha256(ba)
+            hash = bin_dbl_sha256(self.GetRawHashData())
             self.__hash = UInt256(data=hash)
 
         return self.__hash
@@ -60,6 +57,15 @@ class BlockBase(VerifiableMixin):
         """
         return Helper.GetHashData(self)
 
+    def GetRawHashData(self):
+        """
+        Get the data used for hashing as raw bytes.
+
+        Returns:
+            bytes:
+        """
+        return Helper.GetRawHashData(self)
+
     @property
     def Scripts(self):
         """
@@ -5,6 +5,8 @@ import struct
 import traceback
 import os
 import json
+import threading
+from collections import OrderedDict
 from neo.VM.VMState import VMStateStr
 from contextlib import suppress
 from neo.VM import InteropService
@@ -19,6 +21,8 @@ from neo.Core.TX.Transaction import TransactionOutput
 from neo.Core.AssetType import AssetType
 from neo.Core.Cryptography.Crypto import Crypto
 from neo.Core.Header import Header
+from neo.Core.HeaderIndex import HeaderIndex
+from neo.Core.Helper import Helper
 from neo.Core.TX.RegisterTransaction import RegisterTransaction
 from neo.Core.TX.MinerTransaction import MinerTransaction
 from neo.Core.TX.IssueTransaction import IssueTransaction
@@ -33,14 +37,13 @@ from neo.Core.State.SpentCoinState import SpentCoinState, SpentCoinItem, SpentCo
 from neo.Core.State.AssetState import AssetState
 from neo.Core.State.ValidatorState import ValidatorState
 from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from neo.logging import log_manager
 from neo.Settings import settings
 from neo.Core.Fixed8 import Fixed8
 from neo.Core.Cryptography.ECCurve import ECDSA
 from neo.Core.UInt256 import UInt256
 from neo.Core.UInt160 import UInt160
-from neo.Core.IO.BinaryWriter import BinaryWriter
 
 from neo.SmartContract.StateMachine import StateMachine
 from neo.SmartContract.Contract import Contract
@@ -89,7 +92,7 @@ class Blockchain:
 
     _verify_blocks = False
 
-    _header_index = []
+    _header_index = HeaderIndex()
 
     _block_cache = {}
 
@@ -102,12 +105,36 @@ class Blockchain:
 
     BlockSearchTries = 0
 
-    _sysversion = b'schema v.0.8.5'
+    # v.0.9.2 stores raw (not hexlified) values and raw 32 byte block and transaction hashes in keys
+    _sysversion = b'schema v.0.9.2'
+    _legacy_sysversion = b'schema v.0.8.5'
 
     CACHELIM = 4000
     CMISSLIM = 5
     LOOPTIME = .1
 
+    # write the changes of multiple blocks at once when catching up
+    CATCHUP_DISTANCE = 1000
+    CATCHUP_FLUSH_BLOCKS = 500
+    CATCHUP_FLUSH_BYTES = 64 * 1024 * 1024
+
+    _coalesced_blocks = 0
+
+    # snapshot of the header index in the database directory, written at shutdown and every
+    # HEADER_INDEX_CHECKPOINT headers so the IX_HeaderHashList records do not have to be replayed at startup
+    HEADER_INDEX_FILE = 'header_index.bin'
+    HEADER_INDEX_CHECKPOINT = 100000
+
+    _header_index_path = None
+    _header_index_saved = 0
+
+    # blocks read by `GetBlockByHash`, least recently used first, bounded by their total number of transactions
+    RECENT_BLOCKS_MAX_TRANSACTIONS = 20000
+
+    _recent_blocks = OrderedDict()
+    _recent_blocks_size = 0
+    _recent_blocks_lock = threading.Lock()
+
     PersistCompleted = Events()
 
     Notify = Events()
@@ -117,10 +144,17 @@ class Blockchain:
 
     def __init__(self, db, skip_version_check=False, skip_header_check=False):
         self._db = db
-        self._header_index = []
+        self._header_index = HeaderIndex()
+        self._recent_blocks = OrderedDict()
+        self._recent_blocks_size = 0
+        self._recent_blocks_lock = threading.Lock()
 
         self._header_index.append(Blockchain.GenesisBlock().Header.Hash.ToBytes())
 
+        db_path = getattr(self._db, 'path', None)
+        if db_path:
+            self._header_index_path = os.path.join(db_path, self.HEADER_INDEX_FILE)
+
         self.TXProcessed = 0
         version = self._db.get(DBPrefix.SYS_Version)
 
@@ -135,39 +169,37 @@ class Blockchain:
             if not skip_header_check:
                 ba = bytearray(self._db.get(DBPrefix.SYS_CurrentHeader, 0))
                 current_header_height = int.from_bytes(ba[-4:], 'little')
-                current_header_hash = bytes(ba[:64].decode('utf-8'), encoding='utf-8')
+                current_header_hash = binascii.hexlify(ba[:32])
 
-                hashes = []
-                try:
-                    with self._db.openIter(DBProperties(DBPrefix.IX_HeaderHashList)) as it:
-                        for key, value in it:
-                            ms = StreamManager.GetStream(value)
-                            reader = BinaryReader(ms)
-                            hlist = reader.Read2000256List()
-                            key = int.from_bytes(key[-4:], 'little')
-                            hashes.append({'k': key, 'v': hlist})
-                            StreamManager.ReleaseStream(ms)
-                except Exception as e:
-                    logger.info("Could not get stored header hash list: %s " % e)
-
-                if len(hashes):
-                    hashes.sort(key=lambda x: x['k'])
-                    genstr = Blockchain.GenesisBlock().Hash.ToBytes()
-                    for hlist in hashes:
+                snapshot_loaded = self.LoadHeaderIndexSnapshot(current_header_hash, current_header_height)
 
-                        for hash in hlist['v']:
-                            if hash != genstr:
-                                self._header_index.append(hash)
-                            self._stored_header_count += 1
+                if not snapshot_loaded:
+                    hashes = []
+                    try:
+                        with self._db.openIter(DBProperties(DBPrefix.IX_HeaderHashList)) as it:
+                            for key, value in it:
+                                hashes.append((int.from_bytes(key[-4:], 'little'), value))
+                    except Exception as e:
+                        logger.info("Could not get stored header hash list: %s " % e)
+
+                    if len(hashes):
+                        hashes.sort(key=lambda x: x[0])
+                        genesis_hash = bytes(Blockchain.GenesisBlock().Hash.Data)
+                        for key, value in hashes:
+                            # the raw hashes are added as is, the genesis hash is already in the index
+                            if value[:HeaderIndex.HASH_SIZE] == genesis_hash:
+                                self._header_index.ExtendRaw(value[HeaderIndex.HASH_SIZE:])
+                            else:
+                                self._header_index.ExtendRaw(value)
+                            self._stored_header_count += len(value) // HeaderIndex.HASH_SIZE
 
-                if self._stored_header_count == 0:
+                if self._stored_header_count == 0 and not snapshot_loaded:
                     logger.info("Current stored headers empty, re-creating from stored blocks...")
                     headers = []
                     logger.info('Recreate headers')
                     with self._db.openIter(DBProperties(DBPrefix.DATA_Block)) as it:
                         for key, value in it:
-                            dbhash = bytearray(value)[8:]
-                            headers.append(Header.FromTrimmedData(binascii.unhexlify(dbhash), 0))
+                            headers.append(Header.FromTrimmedData(memoryview(value)[8:], 0))
 
                     headers.sort(key=lambda h: h.Index)
                     for h in headers:
@@ -199,6 +231,8 @@ class Blockchain:
             logger.error("\n\n")
             logger.warning("Database schema has changed from %s to %s.\n" % (version, self._sysversion))
             logger.warning("You must either resync from scratch, or use the np-bootstrap command to bootstrap the chain.")
+            if version == Blockchain._legacy_sysversion:
+                logger.warning("Alternatively, use the np-migrate-db command to convert your current database.")
 
             res = prompt("Type 'continue' to erase your current database and sync from new. Otherwise this program will exit:\n> ")
             if res == 'continue':
@@ -410,19 +444,93 @@ class Blockchain:
 
         with self._db.getBatch() as wb:
             while header.Index - 2000 >= self._stored_header_count:
-                ms = StreamManager.GetStream()
-                w = BinaryWriter(ms)
-                headers_to_write = self._header_index[self._stored_header_count:self._stored_header_count + 2000]
-                w.Write2000256List(headers_to_write)
-                out = ms.ToArray()
-                StreamManager.ReleaseStream(ms)
+                out = self._header_index.GetRaw(self._stored_header_count, self._stored_header_count + 2000)
                 wb.put(DBPrefix.IX_HeaderHashList + self._stored_header_count.to_bytes(4, 'little'), out)
 
                 self._stored_header_count += 2000
 
-            if self._db.get(DBPrefix.DATA_Block + hHash) is None:
-                wb.put(DBPrefix.DATA_Block + hHash, bytes(8) + header.ToArray())
-            wb.put(DBPrefix.SYS_CurrentHeader, hHash + header.Index.to_bytes(4, 'little'))
+            block_key = DBPrefix.DATA_Block + binascii.unhexlify(hHash)
+            if self._db.get(block_key) is None:
+                wb.put(block_key, bytes(8) + Helper.ToStream(header))
+            wb.put(DBPrefix.SYS_CurrentHeader, binascii.unhexlify(hHash) + header.Index.to_bytes(4, 'little'))
+
+        if len(self._header_index) - self._header_index_saved >= self.HEADER_INDEX_CHECKPOINT:
+            self.SaveHeaderIndexSnapshot()
+
+    def SaveHeaderIndexSnapshot(self):
+        """
+        Write the header index to the snapshot file in the database directory.
+
+        Returns:
+            bool: True if the snapshot was written.
+        """
+        if not self._header_index_path:
+            return False
+
+        try:
+            self._header_index.WriteFile(self._header_index_path)
+            self._header_index_saved = len(self._header_index)
+            return True
+        except Exception as e:
+            logger.warning("Could not write header index snapshot: %s " % e)
+
+        return False
+
+    def LoadHeaderIndexSnapshot(self, current_header_hash, current_header_height):
+        """
+        Load the header index from the snapshot file, if it is consistent with the database.
+
+        The last hash of the snapshot has to be the current header, or a stored header at the same height. Hashes of
+        `IX_HeaderHashList` records written after the snapshot are appended to it.
+
+        Args:
+            current_header_hash (bytes): the (hex) hash of the current header stored in the database.
+            current_header_height (int): the height of the current header stored in the database.
+
+        Returns:
+            bool: True if the header index and stored header count were loaded.
+        """
+        if not self._header_index_path or not os.path.isfile(self._header_index_path):
+            return False
+
+        try:
+            index = HeaderIndex.FromFile(self._header_index_path)
+
+            height = len(index) - 1
+            if height < 0 or height > current_header_height or index[0] != self._header_index[0]:
+                raise ValueError("snapshot does not match the chain")
+
+            if height == current_header_height:
+                if index[height] != current_header_hash:
+                    raise ValueError("snapshot does not match the current header")
+            else:
+                value = self._db.get(DBPrefix.DATA_Block + binascii.unhexlify(index[height]))
+                if value is None or Header.FromTrimmedData(memoryview(value)[8:], 0).Index != height:
+                    raise ValueError("snapshot does not match the stored headers")
+
+            stored_count = len(index) // 2000 * 2000
+            while stored_count and self._db.get(DBPrefix.IX_HeaderHashList + (stored_count - 2000).to_bytes(4, 'little')) is None:
+                stored_count -= 2000
+
+            while True:
+                value = self._db.get(DBPrefix.IX_HeaderHashList + stored_count.to_bytes(4, 'little'))
+                if not value:
+                    break
+
+                count = len(value) // HeaderIndex.HASH_SIZE
+                known = len(index) - stored_count
+                if known < count:
+                    index.ExtendRaw(value[known * HeaderIndex.HASH_SIZE:])
+                stored_count += count
+
+        except Exception as e:
+            logger.info("Could not use header index snapshot: %s " % e)
+            return False
+
+        self._header_index = index
+        self._stored_header_count = stored_count
+        self._header_index_saved = height + 1
+        return True
 
     @property
     def BlockRequests(self):
@@ -540,18 +648,64 @@ class Blockchain:
         return False
 
     def ContainsTransaction(self, hash):
-        tx = self._db.get(DBPrefix.DATA_Transaction + hash.ToBytes())
+        tx = self._db.get(DBPrefix.DATA_Transaction + binascii.unhexlify(hash.ToBytes()))
         return True if tx is not None else False
 
+    @staticmethod
+    def _GetInputHashes(block):
+        """
+        Get the (sorted) hashes of the transactions referenced by the inputs of `block`, excluding the transactions of
+        the block itself.
+        """
+        own_hashes = set()
+        prev_hashes = set()
+        for tx in block.Transactions:
+            own_hashes.add(tx.Hash.ToBytes())
+            for input in tx.inputs:
+                prev_hashes.add(input.PrevHash.ToBytes())
+
+        return sorted(prev_hashes - own_hashes)
+
+    def WarmBlockInputs(self, block):
+        """
+        Read the transactions referenced by the inputs of `block`, such that they are in the database caches by the
+        time the block is persisted.
+
+        Only performs raw database reads, so it can be called from a worker thread while another block is persisted.
+
+        Args:
+            block (neo.Core.Block.Block):
+        """
+        for prev_hash in self._GetInputHashes(block):
+            self._db.get(DBPrefix.DATA_Transaction + binascii.unhexlify(prev_hash))
+
+    def GetInputTransactions(self, block):
+        """
+        Read and decode, in key order, each transaction referenced by the inputs of `block` once.
+
+        Args:
+            block (neo.Core.Block.Block):
+
+        Returns:
+            dict: {hash (bytes): (Transaction, height)} for all referenced transactions found in the database.
+        """
+        keys = {DBPrefix.DATA_Transaction + binascii.unhexlify(prev_hash): prev_hash for prev_hash in self._GetInputHashes(block)}
+        values = self._db.getMany(keys)
+
+        prev_txs = {}
+        for key, prev_hash in keys.items():
+            out = values.get(key, None)
+            if out is not None:
+                prev_txs[prev_hash] = (Transaction.DeserializeFromBufer(memoryview(out)[4:], 0), int.from_bytes(out[:4], 'little'))
+        return prev_txs
+
     def GetHeader(self, hash):
         if isinstance(hash, UInt256):
             hash = hash.ToString().encode()
 
         try:
-            out = bytearray(self._db.get(DBPrefix.DATA_Block + hash))
-            out = out[8:]
-            outhex = binascii.unhexlify(out)
-            return Header.FromTrimmedData(outhex, 0)
+            out = self._db.get(DBPrefix.DATA_Block + binascii.unhexlify(hash))
+            return Header.FromTrimmedData(memoryview(out)[8:], 0)
         except TypeError as e2:
             pass
         except Exception as e:
@@ -621,7 +775,7 @@ class Blockchain:
         if type(hash) is UInt256:
             hash = hash.ToBytes()
         try:
-            value = self._db.get(DBPrefix.DATA_Block + hash)[0:8]
+            value = self._db.get(DBPrefix.DATA_Block + binascii.unhexlify(hash))[0:8]
             amount = struct.unpack("<d", value)[0]
             return amount
         except Exception as e:
@@ -643,7 +797,66 @@ class Blockchain:
             return self.GetBlockByHash(hash)
 
     def GetBlock(self, height_or_hash):
+        hash = self._GetBlockHashOf(height_or_hash)
+        if hash is not None:
+            return self.GetBlockByHash(hash)
+
+        return None
+
+    def GetRawBlock(self, height_or_hash):
+        """
+        Get the serialized form of a block, without deserializing it. It is assembled from the stored trimmed block
+        (header and transaction hashes) and the stored serialized transactions.
+
+        Args:
+            height_or_hash (int|bytes|str): the block height or the hex encoded block hash (optionally prefixed with 0x).
+
+        Returns:
+            bytes: the serialized block, or None if it could not be found.
+        """
+        hash = self._GetBlockHashOf(height_or_hash)
+        if hash is None:
+            return None
+
+        out = self._db.get(DBPrefix.DATA_Block + binascii.unhexlify(hash))
+        if out is None:
+            return None
+
+        # skip the system fee amount
+        trimmed = memoryview(out)[8:]
+        reader = BufferReader(trimmed)
+        # skip Version, PrevHash, MerkleRoot, Timestamp, Index, ConsensusData, NextConsensus and the script count
+        reader.seek(4 + 32 + 32 + 4 + 4 + 8 + 20 + 1)
+        for script in range(2):
+            length = reader.ReadVarInt()
+            reader.seek(reader.tell() + length)
+
+        # a trimmed block ends with the transaction hashes instead of the transactions, both prefixed with the count
+        count = reader.ReadVarInt()
+        hashes_start = reader.tell()
+        if count == 0:
+            # only the header is stored so far (see `OnAddHeader`), every block has at least a MinerTransaction
+            return None
+        if hashes_start + count * 32 != len(trimmed):
+            logger.info("Could not get raw block %s: invalid stored block" % hash)
+            return None
+
+        keys = [DBPrefix.DATA_Transaction + bytes(trimmed[offset:offset + 32])[::-1]
+                for offset in range(hashes_start, hashes_start + count * 32, 32)]
+        values = self._db.getMany(keys)
+
+        parts = [trimmed[:hashes_start]]
+        for key in keys:
+            value = values.get(key, None)
+            if value is None:
+                logger.info("Could not get raw block %s: missing transaction" % hash)
+                return None
+            # skip the block height
+            parts.append(memoryview(value)[4:])
+
+        return b''.join(parts)
 
+    def _GetBlockHashOf(self, height_or_hash):
         hash = None
 
         intval = None
@@ -667,21 +880,52 @@ class Blockchain:
         elif intval is not None and self.GetBlockHash(intval) is not None:
             hash = self.GetBlockHash(intval)
 
-        if hash is not None:
-            return self.GetBlockByHash(hash)
-
-        return None
+        return hash
 
     def GetBlockByHash(self, hash):
+        """
+        Get a block. Recently read blocks are kept in a LRU cache and shared between callers, so the returned block
+        must not be changed.
+
+        Args:
+            hash (bytes|str): the hex encoded block hash.
+
+        Returns:
+            Block: the block, or None if it could not be found.
+        """
         try:
-            out = bytearray(self._db.get(DBPrefix.DATA_Block + hash))
-            out = out[8:]
-            outhex = binascii.unhexlify(out)
-            return neo.Core.Block.Block.FromTrimmedData(outhex)
+            raw_hash = binascii.unhexlify(hash)
+
+            with self._recent_blocks_lock:
+                block = self._recent_blocks.get(raw_hash, None)
+                if block is not None:
+                    self._recent_blocks.move_to_end(raw_hash)
+                    return block
+
+            out = self._db.get(DBPrefix.DATA_Block + raw_hash)
+            block = neo.Core.Block.Block.FromTrimmedData(memoryview(out)[8:])
+            self._AddRecentBlock(raw_hash, block)
+            return block
         except Exception as e:
             logger.info("Could not get block %s " % e)
         return None
 
+    def _AddRecentBlock(self, raw_hash, block):
+        size = len(block.Transactions)
+        if size > self.RECENT_BLOCKS_MAX_TRANSACTIONS:
+            return
+
+        with self._recent_blocks_lock:
+            if raw_hash in self._recent_blocks:
+                return
+
+            self._recent_blocks[raw_hash] = block
+            self._recent_blocks_size += size
+
+            while self._recent_blocks_size > self.RECENT_BLOCKS_MAX_TRANSACTIONS:
+                _, old_block = self._recent_blocks.popitem(last=False)
+                self._recent_blocks_size -= len(old_block.Transactions)
+
     def GetStates(self, prefix, classref):
         return DBInterface(self._db, prefix, classref)
 
@@ -731,15 +975,36 @@ class Blockchain:
         elif type(hash) is UInt256:
             hash = hash.ToBytes()
 
-        out = self._db.get(DBPrefix.DATA_Transaction + hash)
+        out = self._db.get(DBPrefix.DATA_Transaction + binascii.unhexlify(hash))
         if out is not None:
-            out = bytearray(out)
             height = int.from_bytes(out[:4], 'little')
-            out = out[4:]
-            outhex = binascii.unhexlify(out)
-            return Transaction.DeserializeFromBufer(outhex, 0), height
+            return Transaction.DeserializeFromBufer(memoryview(out)[4:], 0), height
         return None, -1
 
+    def GetTransactions(self, hashes):
+        """
+        Get multiple transactions, e.g. those of a block, reading them from the database in a single pass.
+
+        Args:
+            hashes (list): hex encoded transaction hashes (bytes or str) or UInt256 objects.
+
+        Returns:
+            list: the transaction of each hash, None for the transactions that could not be found.
+        """
+        keys = []
+        for hash in hashes:
+            if type(hash) is UInt256:
+                hash = hash.ToBytes()
+            keys.append(DBPrefix.DATA_Transaction + binascii.unhexlify(hash))
+
+        values = self._db.getMany(keys)
+
+        txs = []
+        for key in keys:
+            out = values.get(key, None)
+            txs.append(None if out is None else Transaction.DeserializeFromBufer(memoryview(out)[4:], 0))
+        return txs
+
     def SearchContracts(self, query):
         res = []
 
@@ -972,6 +1237,9 @@ class Blockchain:
 
         self._persisting_block = block
 
+        # the block is written to the database at once (together with the current block pointer) by `FlushBlockWrites`
+        self._db.beginCoalescedWrites()
+
         snapshot = self._db.createSnapshot()
         snapshot.PersistingBlock = block
 
@@ -979,121 +1247,144 @@ class Blockchain:
         amount_sysfee_bytes = struct.pack("<d", amount_sysfee)
         to_dispatch = []
 
-        with self._db.getBatch() as wb:
-            wb.put(DBPrefix.DATA_Block + block.Hash.ToBytes(), amount_sysfee_bytes + block.Trim())
-
-            for tx_idx, tx in enumerate(block.Transactions):
-                with self._db.getBatch() as tx_wb:
-                    tx_wb.put(DBPrefix.DATA_Transaction + tx.Hash.ToBytes(), block.IndexBytes() + tx.ToArray())
-
-                    # go through all outputs and add unspent coins to them
-
-                    unspentcoinstate = UnspentCoinState.FromTXOutputsConfirmed(tx.outputs)
-                    snapshot.UnspentCoins.Add(tx.Hash.ToBytes(), unspentcoinstate)
-
-                    # go through all the accounts in the tx outputs
-                    for output in tx.outputs:
-                        account = snapshot.Accounts.GetAndChange(output.AddressBytes, lambda: AccountState(output.ScriptHash))
-
-                        if account.HasBalance(output.AssetId):
-                            account.AddToBalance(output.AssetId, output.Value)
-                        else:
-                            account.SetBalanceFor(output.AssetId, output.Value)
-
-                    # go through all tx inputs
-                    unique_tx_input_hashes = []
-                    for input in tx.inputs:
-                        if input.PrevHash not in unique_tx_input_hashes:
-                            unique_tx_input_hashes.append(input.PrevHash)
-                    for txhash in unique_tx_input_hashes:
-                        prevTx, height = self.GetTransaction(txhash.ToBytes())
-                        coin_refs_by_hash = [coinref for coinref in tx.inputs if
-                                             coinref.PrevHash.ToBytes() == txhash.ToBytes()]
-                        for input in coin_refs_by_hash:
-
-                            snapshot.UnspentCoins.GetAndChange(input.PrevHash.ToBytes()).Items[input.PrevIndex] |= CoinState.Spent
-
-                            if prevTx.outputs[input.PrevIndex].AssetId.ToBytes() == Blockchain.SystemShare().Hash.ToBytes():
-                                sc = snapshot.SpentCoins.GetAndChange(input.PrevHash.ToBytes(), lambda: SpentCoinState(input.PrevHash, height, []))
-                                sc.Items.append(SpentCoinItem(input.PrevIndex, block.Index))
-
-                            output = prevTx.outputs[input.PrevIndex]
-                            acct = snapshot.Accounts.GetAndChange(prevTx.outputs[input.PrevIndex].AddressBytes, lambda: AccountState(output.ScriptHash))
-                            assetid = prevTx.outputs[input.PrevIndex].AssetId
-                            acct.SubtractFromBalance(assetid, prevTx.outputs[input.PrevIndex].Value)
-
-                    # do a whole lotta stuff with tx here...
-                    if tx.Type == TransactionType.RegisterTransaction:
-                        asset = AssetState(tx.Hash, tx.AssetType, tx.Name, tx.Amount,
-                                           Fixed8(0), tx.Precision, Fixed8(0),
-                                           Fixed8(0), UInt160(data=bytearray(20)),
-                                           tx.Owner, tx.Admin, tx.Admin,
-                                           block.Index + 2 * 2000000, False)
-
-                        snapshot.Assets.Add(tx.Hash.ToBytes(), asset)
-
-                    elif tx.Type == TransactionType.IssueTransaction:
-
-                        txresults = [result for result in tx.GetTransactionResults() if result.Amount.value < 0]
-                        for result in txresults:
-                            asset = snapshot.Assets.GetAndChange(result.AssetId.ToBytes())
-                            asset.Available = asset.Available - result.Amount
-
-                    elif tx.Type == TransactionType.ClaimTransaction:
-                        for input in tx.Claims:
-
-                            sc = snapshot.SpentCoins.TryGet(input.PrevHash.ToBytes())
-                            if sc and sc.HasIndex(input.PrevIndex):
-                                sc.DeleteIndex(input.PrevIndex)
-                                snapshot.SpentCoins.GetAndChange(input.PrevHash.ToBytes())
-
-                    elif tx.Type == TransactionType.EnrollmentTransaction:
-                        snapshot.Validators.GetAndChange(tx.PublicKey.ToBytes(), lambda: ValidatorState(pub_key=tx.PublicKey))
-                    elif tx.Type == TransactionType.StateTransaction:
-                        # @TODO Implement persistence for State Descriptors
-                        pass
+        prev_txs = self.GetInputTransactions(block)
+        system_share = Blockchain.SystemShare().Hash.ToBytes()
 
-                    elif tx.Type == TransactionType.PublishTransaction:
-                        def create_contract_state():
-                            return ContractState(tx.Code, tx.NeedStorage, tx.Name, tx.CodeVersion,
-                                                 tx.Author, tx.Email, tx.Description)
+        for tx_idx, tx in enumerate(block.Transactions):
+            self._db.write(DBPrefix.DATA_Transaction + bytes(reversed(tx.Hash.Data)), block.IndexBytes() + Helper.ToStream(tx))
+            # later transactions of the block may spend the outputs of this one
+            prev_txs[tx.Hash.ToBytes()] = (tx, block.Index)
 
-                        snapshot.Contracts.GetOrAdd(tx.Code.ScriptHash().ToBytes(), create_contract_state)
-                    elif tx.Type == TransactionType.InvocationTransaction:
+            # go through all outputs and add unspent coins to them
 
-                        engine = ApplicationEngine(TriggerType.Application, tx, snapshot.Clone(), tx.Gas)
-                        engine.LoadScript(tx.Script)
+            unspentcoinstate = UnspentCoinState.FromTXOutputsConfirmed(tx.outputs)
+            snapshot.UnspentCoins.Add(tx.Hash.ToBytes(), unspentcoinstate)
 
-                        try:
-                            success = engine.Execute()
-                            if success:
-                                engine._Service.Commit()
-                                engine._Service.ExecutionCompleted(engine, success)
-                            else:
-                                engine._Service.ExecutionCompleted(engine, False)
+            # go through all the accounts in the tx outputs
+            for output in tx.outputs:
+                account = snapshot.Accounts.GetAndChange(output.AddressBytes, lambda: AccountState(output.ScriptHash))
 
-                        except Exception as e:
-                            traceback.print_exc()
-
-                        to_dispatch = to_dispatch + engine._Service.events_to_dispatch
-                        await asyncio.sleep(0.001)
+                if account.HasBalance(output.AssetId):
+                    account.AddToBalance(output.AssetId, output.Value)
+                else:
+                    account.SetBalanceFor(output.AssetId, output.Value)
+
+            # go through all tx inputs, grouped by the transaction they reference
+            inputs_by_hash = {}
+            for input in tx.inputs:
+                inputs_by_hash.setdefault(input.PrevHash.ToBytes(), []).append(input)
+            for txhash, coin_refs_by_hash in inputs_by_hash.items():
+                prev = prev_txs.get(txhash, None)
+                if prev is None:
+                    prev = self.GetTransaction(txhash)
+                prevTx, height = prev
+                for input in coin_refs_by_hash:
+
+                    snapshot.UnspentCoins.GetAndChange(txhash).Items[input.PrevIndex] |= CoinState.Spent
+
+                    output = prevTx.outputs[input.PrevIndex]
+                    if output.AssetId.ToBytes() == system_share:
+                        sc = snapshot.SpentCoins.GetAndChange(txhash, lambda: SpentCoinState(input.PrevHash, height, []))
+                        sc.Items.append(SpentCoinItem(input.PrevIndex, block.Index))
+
+                    acct = snapshot.Accounts.GetAndChange(output.AddressBytes, lambda: AccountState(output.ScriptHash))
+                    acct.SubtractFromBalance(output.AssetId, output.Value)
+
+            # do a whole lotta stuff with tx here...
+            if tx.Type == TransactionType.RegisterTransaction:
+                asset = AssetState(tx.Hash, tx.AssetType, tx.Name, tx.Amount,
+                                   Fixed8(0), tx.Precision, Fixed8(0),
+                                   Fixed8(0), UInt160(data=bytearray(20)),
+                                   tx.Owner, tx.Admin, tx.Admin,
+                                   block.Index + 2 * 2000000, False)
+
+                snapshot.Assets.Add(tx.Hash.ToBytes(), asset)
+
+            elif tx.Type == TransactionType.IssueTransaction:
+
+                txresults = [result for result in tx.GetTransactionResults() if result.Amount.value < 0]
+                for result in txresults:
+                    asset = snapshot.Assets.GetAndChange(result.AssetId.ToBytes())
+                    asset.Available = asset.Available - result.Amount
+
+            elif tx.Type == TransactionType.ClaimTransaction:
+                for input in tx.Claims:
+
+                    sc = snapshot.SpentCoins.TryGet(input.PrevHash.ToBytes())
+                    if sc and sc.HasIndex(input.PrevIndex):
+                        sc = snapshot.SpentCoins.GetAndChange(input.PrevHash.ToBytes())
+                        sc.DeleteIndex(input.PrevIndex)
+
+            elif tx.Type == TransactionType.EnrollmentTransaction:
+                snapshot.Validators.GetAndChange(tx.PublicKey.ToBytes(), lambda: ValidatorState(pub_key=tx.PublicKey))
+            elif tx.Type == TransactionType.StateTransaction:
+                # @TODO Implement persistence for State Descriptors
+                pass
+
+            elif tx.Type == TransactionType.PublishTransaction:
+                def create_contract_state():
+                    return ContractState(tx.Code, tx.NeedStorage, tx.Name, tx.CodeVersion,
+                                         tx.Author, tx.Email, tx.Description)
+
+                snapshot.Contracts.GetOrAdd(tx.Code.ScriptHash().ToBytes(), create_contract_state)
+            elif tx.Type == TransactionType.InvocationTransaction:
+
+                engine = ApplicationEngine(TriggerType.Application, tx, snapshot.Clone(), tx.Gas)
+                engine.LoadScript(tx.Script)
 
+                try:
+                    success = engine.Execute()
+                    if success:
+                        engine._Service.Commit()
+                        engine._Service.ExecutionCompleted(engine, success)
                     else:
-                        if tx.Type != b'\x00' and tx.Type != b'\x80':
-                            logger.info("TX Not Found %s " % tx.Type)
+                        engine._Service.ExecutionCompleted(engine, False)
+
+                except Exception as e:
+                    traceback.print_exc()
+
+                to_dispatch = to_dispatch + engine._Service.events_to_dispatch
+                await asyncio.sleep(0.001)
+
+            else:
+                if tx.Type != b'\x00' and tx.Type != b'\x80':
+                    logger.info("TX Not Found %s " % tx.Type)
 
-            snapshot.Commit()
-            snapshot.Dispose()
+        snapshot.Commit()
+        snapshot.Dispose()
 
-            wb.put(DBPrefix.SYS_CurrentBlock, block.Hash.ToBytes() + block.IndexBytes())
-            self._current_block_height = block.Index
-            self._persisting_block = None
+        block_hash = bytes(reversed(block.Hash.Data))
+        self._db.write(DBPrefix.DATA_Block + block_hash, amount_sysfee_bytes + block.Trim())
+        self._db.write(DBPrefix.SYS_CurrentBlock, block_hash + block.IndexBytes())
+        self._current_block_height = block.Index
+        self._persisting_block = None
 
-            self.TXProcessed += len(block.Transactions)
+        self.TXProcessed += len(block.Transactions)
+
+        self.FlushBlockWrites(block)
 
         for event in to_dispatch:
             events.emit(event.event_type, event)
 
+    def FlushBlockWrites(self, block=None):
+        """
+        Write the buffered changes of the persisted blocks to the database in a single batch.
+
+        While catching up (the block is at least `CATCHUP_DISTANCE` blocks behind the header height) the changes of up to
+        `CATCHUP_FLUSH_BLOCKS` blocks or `CATCHUP_FLUSH_BYTES` bytes are buffered before they are written. As the current
+        block pointer is part of the same batch, the database always points to the last block that was fully written.
+
+        Args:
+            block (neo.Core.Block.Block): [optional] the block that was just persisted, if omitted the changes are always written.
+        """
+        if block is not None and self.HeaderHeight - block.Index >= self.CATCHUP_DISTANCE:
+            self._coalesced_blocks += 1
+            if self._coalesced_blocks < self.CATCHUP_FLUSH_BLOCKS and self._db.coalescedWriteSize() < self.CATCHUP_FLUSH_BYTES:
+                return
+
+        self._db.endCoalescedWrites()
+        self._coalesced_blocks = 0
+
     async def TryPersist(self, block) -> Tuple[bool, str]:
         distance = self._current_block_height - block.Index
 
@@ -1112,6 +1403,8 @@ class Blockchain:
         return True, ""
 
     def Dispose(self):
+        self.FlushBlockWrites()
+        self.SaveHeaderIndexSnapshot()
         self._db.closeDB()
         self._disposed = True
 
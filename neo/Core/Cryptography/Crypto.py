@@ -1,27 +1,37 @@
 import bitcoin
+from collections import OrderedDict
 from ecdsa import NIST256p, VerifyingKey
 from .Helper import *
 from neo.Core.UInt160 import UInt160
 from .ECCurve import EllipticCurve
 
+# secp256r1 parameters (p, n, a, b, Gx, Gy)
+_SECP256R1 = (
+    int("FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF", 16),
+    int("FFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551", 16),
+    int("FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFC", 16),
+    int("5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B", 16),
+    int("6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296", 16),
+    int("4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5", 16)
+)
+
 
 class Crypto(object):
 
     _Instance = None
 
+    # prepared verifying keys, public key bytes -> VerifyingKey (or None for invalid keys)
+    _verifying_keys = OrderedDict()
+    _verifying_key_hits = 0
+    _verifying_key_misses = 0
+    MaxCachedVerifyingKeys = 4096
+
     @staticmethod
     def SetupSignatureCurve():
         """
         Setup the Elliptic curve parameters.
         """
-        bitcoin.change_curve(
-            int("FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF", 16),
-            int("FFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551", 16),
-            int("FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFC", 16),
-            int("5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B", 16),
-            int("6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296", 16),
-            int("4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5", 16)
-        )
+        bitcoin.change_curve(*_SECP256R1)
 
     @staticmethod
     def Default():
@@ -154,18 +164,88 @@ class Crypto(object):
         elif isinstance(message, str):
             message = message.encode('utf-8')
 
+        vk = Crypto._GetVerifyingKey(public_key)
+        if vk is None:
+            return False
+
+        try:
+            return vk.verify(signature, message, hashfunc=hashlib.sha256)
+        except Exception:
+            pass
+
+        return False
+
+    @staticmethod
+    def _GetVerifyingKey(public_key):
+        """
+        Get the prepared `VerifyingKey` of a public key, from the cache if possible.
+
+        Args:
+            public_key (bytes): 33 byte compressed key or 64 byte raw (uncompressed, without prefix) key.
+
+        Raises:
+            Exception: if a compressed key can't be decompressed.
+
+        Returns:
+            VerifyingKey: or None if `public_key` is not a valid key.
+        """
+        if not isinstance(public_key, (bytes, bytearray)):
+            return Crypto._CreateVerifyingKey(public_key)
+
+        public_key = bytes(public_key)
+        cache = Crypto._verifying_keys
+        if public_key in cache:
+            Crypto._verifying_key_hits += 1
+            cache.move_to_end(public_key)
+            return cache[public_key]
+
+        Crypto._verifying_key_misses += 1
+        vk = Crypto._CreateVerifyingKey(public_key)
+
+        # decompressing depends on the globally configured curve, only cache points decompressed on the NEO curve
+        if len(public_key) != 33 or bitcoin.main.P == _SECP256R1[0]:
+            cache[public_key] = vk
+            if len(cache) > Crypto.MaxCachedVerifyingKeys:
+                cache.popitem(last=False)
+        return vk
+
+    @staticmethod
+    def _CreateVerifyingKey(public_key):
         if len(public_key) == 33:
             public_key = bitcoin.decompress(public_key)
             public_key = public_key[1:]
 
         try:
-            vk = VerifyingKey.from_string(public_key, curve=NIST256p, hashfunc=hashlib.sha256)
-            res = vk.verify(signature, message, hashfunc=hashlib.sha256)
-            return res
+            return VerifyingKey.from_string(public_key, curve=NIST256p, hashfunc=hashlib.sha256)
         except Exception:
-            pass
+            return None
 
-        return False
+    @staticmethod
+    def VerifyingKeyCacheStats():
+        """
+        Get the statistics of the verifying key cache of this process.
+
+        Returns:
+            dict: with the number of cached keys (`size`), `hits`, `misses` and the `hit_rate` (0.0 - 1.0).
+        """
+        hits = Crypto._verifying_key_hits
+        misses = Crypto._verifying_key_misses
+        lookups = hits + misses
+        return {
+            'size': len(Crypto._verifying_keys),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0
+        }
+
+    @staticmethod
+    def ClearVerifyingKeyCache():
+        """
+        Clear the verifying key cache and reset its statistics.
+        """
+        Crypto._verifying_keys.clear()
+        Crypto._verifying_key_hits = 0
+        Crypto._verifying_key_misses = 0
 
 
 class CryptoInstance():
@@ -1,6 +1,5 @@
 from neo.Core.BlockBase import BlockBase
-from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.Witness import Witness
 
 
@@ -66,7 +65,7 @@ class Header(BlockBase):
         Deserialize into a Header object from the provided data.
 
         Args:
-            data (bytes):
+            data (bytes, bytearray, memoryview):
             index: UNUSED
 
         Returns:
@@ -74,9 +73,7 @@ class Header(BlockBase):
         """
         header = Header()
 
-        ms = StreamManager.GetStream(data)
-
-        reader = BinaryReader(ms)
+        reader = BufferReader(data)
         header.DeserializeUnsigned(reader)
         reader.ReadByte()
 
@@ -84,8 +81,6 @@ class Header(BlockBase):
         witness.Deserialize(reader)
         header.Script = witness
 
-        StreamManager.ReleaseStream(ms)
-
         return header
 
     def GetHashCode(self):
@@ -0,0 +1,283 @@
+import binascii
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+
+class HeaderIndex:
+    """
+    Compact index of the header hashes of the chain, ordered by height.
+
+    The hashes are stored back to back as raw 32 byte values (in the reversed byte order used by `IX_HeaderHashList`
+    records) in a single buffer. An open addressing table of 4 byte heights, kept at most 3/4 full, provides constant
+    time hash to height lookups without keeping a Python object per hash. At 1M hashes the index takes about 40MB
+    (32MB of hashes and an 8MB table), against about 106MB for a list of hex encoded hashes.
+
+    Items are exposed as hex encoded hashes (e.g. b'6dd83ed8...'), like the list of hashes it replaces.
+
+    The index can be written to a file with `WriteFile` and read back with `FromFile`. The file holds a fixed size
+    header (magic, number of hashes, lookup table size and a CRC32 checksum) followed by the hash buffer and the lookup
+    table (little endian) as they are kept in memory, so loading it does not require rebuilding anything.
+    """
+
+    HASH_SIZE = 32
+
+    _MIN_TABLE_SIZE = 1024
+
+    # unsigned 32 bit table slots, heights fit easily
+    _TABLE_TYPE = 'I'
+
+    _FILE_MAGIC = b'NEOHIDX\x02'
+    _FILE_HEADER = struct.Struct('<8sQQI4x')
+
+    def __init__(self, hashes=None):
+        """
+        Create an instance.
+
+        Args:
+            hashes (list): [optional] hex encoded hashes to add to the index.
+        """
+        self._data = bytearray()
+        self._count = 0
+        # slots hold `height + 1`, 0 marks an empty slot
+        self._table = array(self._TABLE_TYPE, [0]) * self._MIN_TABLE_SIZE
+
+        if hashes:
+            self.extend(hashes)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("header index out of range")
+
+        offset = index * self.HASH_SIZE
+        return binascii.hexlify(self._data[offset:offset + self.HASH_SIZE][::-1])
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def __contains__(self, hash):
+        return self.IndexOf(hash) >= 0
+
+    def __repr__(self):
+        return "<HeaderIndex %s hashes>" % self._count
+
+    def append(self, hash):
+        """
+        Add a hash to the end of the index.
+
+        Args:
+            hash (bytes|str): the hex encoded hash.
+        """
+        self.AppendRaw(self._ToRaw(hash))
+
+    def extend(self, hashes):
+        """
+        Add hashes to the end of the index.
+
+        Args:
+            hashes (list): hex encoded hashes.
+        """
+        self.ExtendRaw(b''.join(self._ToRaw(hash) for hash in hashes))
+
+    def AppendRaw(self, raw_hash):
+        """
+        Add a raw hash to the end of the index.
+
+        Args:
+            raw_hash (bytes): 32 bytes in `IX_HeaderHashList` byte order.
+
+        Raises:
+            ValueError: if the hash is not 32 bytes.
+        """
+        if raw_hash is None or len(raw_hash) != self.HASH_SIZE:
+            raise ValueError("Invalid header hash")
+
+        self.ExtendRaw(raw_hash)
+
+    def ExtendRaw(self, data):
+        """
+        Add consecutive raw hashes to the end of the index, e.g. the value of an `IX_HeaderHashList` record.
+
+        Args:
+            data (bytes): a multiple of 32 bytes in `IX_HeaderHashList` byte order.
+
+        Raises:
+            ValueError: if the length of `data` is not a multiple of 32.
+        """
+        if len(data) % self.HASH_SIZE:
+            raise ValueError("Invalid header hash list length %s" % len(data))
+
+        start = self._count
+        self._data += data
+        self._count += len(data) // self.HASH_SIZE
+
+        if self._IsOverloaded(self._count, len(self._table)):
+            self._Rehash()
+        else:
+            self._Insert(start, self._count)
+
+    def GetRaw(self, start, stop):
+        """
+        Get the raw hashes of heights `start` up to (not including) `stop`.
+
+        Returns:
+            bytes: the hashes in `IX_HeaderHashList` byte order.
+        """
+        start = max(0, min(start, self._count))
+        stop = max(start, min(stop, self._count))
+        return bytes(self._data[start * self.HASH_SIZE:stop * self.HASH_SIZE])
+
+    def WriteFile(self, path):
+        """
+        Write the index to a file. The file is replaced atomically.
+
+        Args:
+            path (str): full path of the file.
+        """
+        table = self._table
+        if sys.byteorder != 'little':
+            table = array(self._TABLE_TYPE, table)
+            table.byteswap()
+
+        checksum = zlib.crc32(table, zlib.crc32(self._data))
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self._FILE_HEADER.pack(self._FILE_MAGIC, self._count, len(table), checksum))
+            f.write(self._data)
+            f.write(table)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def FromFile(cls, path):
+        """
+        Read an index written with `WriteFile`.
+
+        Args:
+            path (str): full path of the file.
+
+        Raises:
+            OSError: if the file cannot be read.
+            ValueError: if the file is not a valid header index.
+
+        Returns:
+            HeaderIndex: the index.
+        """
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < cls._FILE_HEADER.size:
+                raise ValueError("Invalid header index file")
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                magic, count, table_size, checksum = cls._FILE_HEADER.unpack_from(view)
+
+                data_end = cls._FILE_HEADER.size + count * cls.HASH_SIZE
+                if magic != cls._FILE_MAGIC or table_size < cls._MIN_TABLE_SIZE or table_size & (table_size - 1) \
+                        or cls._IsOverloaded(count, table_size) or size != data_end + table_size * array(cls._TABLE_TYPE).itemsize:
+                    raise ValueError("Invalid header index file")
+
+                data = bytearray(view[cls._FILE_HEADER.size:data_end])
+                table = array(cls._TABLE_TYPE)
+                table.frombytes(view[data_end:])
+
+        if zlib.crc32(table, zlib.crc32(data)) != checksum:
+            raise ValueError("Header index file checksum mismatch")
+
+        if sys.byteorder != 'little':
+            table.byteswap()
+
+        index = cls()
+        index._data = data
+        index._count = count
+        index._table = table
+        return index
+
+    def IndexOf(self, hash):
+        """
+        Get the height of a hash.
+
+        Args:
+            hash (bytes|str|UInt256): the hex encoded hash, or an UInt256.
+
+        Returns:
+            int: the height of the hash. -1 if the hash is not in the index.
+        """
+        try:
+            raw = self._ToRaw(hash)
+        except (ValueError, TypeError, binascii.Error):
+            return -1
+
+        table = self._table
+        data = self._data
+        mask = len(table) - 1
+        slot = int.from_bytes(raw[:8], 'little') & mask
+
+        while True:
+            entry = table[slot]
+            if not entry:
+                return -1
+
+            offset = (entry - 1) * self.HASH_SIZE
+            if data[offset:offset + self.HASH_SIZE] == raw:
+                return entry - 1
+
+            slot = (slot + 1) & mask
+
+    def _Insert(self, start, stop):
+        table = self._table
+        data = self._data
+        mask = len(table) - 1
+        from_bytes = int.from_bytes
+
+        for height in range(start, stop):
+            offset = height * self.HASH_SIZE
+            slot = from_bytes(data[offset:offset + 8], 'little') & mask
+
+            while table[slot]:
+                slot = (slot + 1) & mask
+
+            table[slot] = height + 1
+
+    @staticmethod
+    def _IsOverloaded(count, table_size):
+        # more than 3/4 of the slots in use
+        return count * 4 > table_size * 3
+
+    def _Rehash(self):
+        # grow to a table at most half full
+        size = self._MIN_TABLE_SIZE
+        while size < self._count * 2:
+            size *= 2
+
+        self._table = array(self._TABLE_TYPE, [0]) * size
+        self._Insert(0, self._count)
+
+    @classmethod
+    def _ToRaw(cls, hash):
+        data = getattr(hash, 'Data', None)
+        if data is not None:
+            raw = bytes(data)
+        else:
+            if len(hash) != cls.HASH_SIZE * 2:
+                raise ValueError("Invalid header hash %s" % hash)
+            raw = binascii.unhexlify(hash)[::-1]
+
+        if len(raw) != cls.HASH_SIZE:
+            raise ValueError("Invalid header hash %s" % hash)
+
+        return raw
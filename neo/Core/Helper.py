@@ -39,13 +39,25 @@ class Helper:
             hashable (neo.IO.Mixins.SerializableMixin): object extending SerializableMixin
 
         Returns:
-            bytes:
+            bytes: hex formatted bytes
+        """
+        return binascii.hexlify(Helper.GetRawHashData(hashable))
+
+    @staticmethod
+    def GetRawHashData(hashable):
+        """
+        Get the data used for hashing as raw bytes, i.e. without hex encoding it.
+
+        Args:
+            hashable (neo.IO.Mixins.SerializableMixin): object extending SerializableMixin
+
+        Returns:
+            bytes: not hexlified
         """
         ms = StreamManager.GetStream()
         writer = BinaryWriter(ms)
         hashable.SerializeUnsigned(writer)
-        ms.flush()
-        retVal = ms.ToArray()
+        retVal = ms.getvalue()
         StreamManager.ReleaseStream(ms)
         return retVal
 
@@ -14,6 +14,9 @@ from neo.Core.Fixed8 import Fixed8
 from neo.Core.UInt160 import UInt160
 from neo.Core.UInt256 import UInt256
 
+# classes resolved by `ReadSerializableArray`, by full path
+_serializable_classes = {}
+
 
 class BinaryReader(object):
     """docstring for BinaryReader"""
@@ -316,9 +319,11 @@ class BinaryReader(object):
         Returns:
             list: list of `class_name` objects deserialized from the stream.
         """
-        module = '.'.join(class_name.split('.')[:-1])
-        klassname = class_name.split('.')[-1]
-        klass = getattr(importlib.import_module(module), klassname)
+        klass = _serializable_classes.get(class_name, None)
+        if klass is None:
+            module = '.'.join(class_name.split('.')[:-1])
+            klassname = class_name.split('.')[-1]
+            klass = _serializable_classes[class_name] = getattr(importlib.import_module(module), klassname)
         length = self.ReadVarInt(max=max)
         items = []
         for i in range(0, length):
@@ -0,0 +1,249 @@
+"""
+Description:
+    Buffer Reader
+
+Usage:
+    from neo.Core.IO.BufferReader import BufferReader
+"""
+import sys
+import struct
+
+from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.UInt160 import UInt160
+from neo.Core.UInt256 import UInt256
+
+# precompiled formats of the fixed size values, other formats (e.g. strings) are compiled when used
+_STRUCTS = {endian + fmt: struct.Struct(endian + fmt) for endian in '<>' for fmt in 'bBhHiIqQfd'}
+_STRUCTS.update({fmt: struct.Struct(fmt) for fmt in '?c'})
+
+_BOOL = _STRUCTS['?']
+_CHAR = _STRUCTS['c']
+_INT8 = _STRUCTS['<b']
+_UINT8 = _STRUCTS['<B']
+_INT16 = _STRUCTS['<h']
+_UINT16 = _STRUCTS['<H']
+_INT32 = _STRUCTS['<i']
+_UINT32 = _STRUCTS['<I']
+_INT64 = _STRUCTS['<q']
+_UINT64 = _STRUCTS['<Q']
+
+
+class BufferReader(BinaryReader):
+    """
+    A `BinaryReader` reading directly from a bytes like object (bytes, bytearray, memoryview) instead of a stream.
+
+    The data is not copied into a stream first, values are unpacked in place with precompiled `struct.Struct` objects
+    and the position is a plain offset. Use it instead of `BinaryReader(StreamManager.GetStream(data))` when
+    deserializing a buffer.
+
+    The reader also acts as its own `stream` (`read`, `tell` and `seek`), for deserializers using the stream directly.
+    While the reader exists, a bytearray it reads from can't be resized.
+    """
+
+    def __init__(self, data, offset=0):
+        """
+        Create an instance.
+
+        Args:
+            data (bytes, bytearray, memoryview): the data to read.
+            offset (int): (Optional) position to start reading at.
+        """
+        self._view = memoryview(data)
+        if self._view.format != 'B' or self._view.ndim != 1:
+            self._view = self._view.cast('B')
+        self._position = offset
+        self._length = len(self._view)
+
+    @property
+    def stream(self):
+        return self
+
+    def read(self, length=-1):
+        """
+        Read up to `length` bytes, or all remaining bytes if `length` is negative.
+
+        Returns:
+            bytes:
+        """
+        start = self._position
+        if length is None or length < 0:
+            stop = self._length
+        else:
+            stop = min(start + length, self._length)
+        self._position = max(start, stop)
+        return bytes(self._view[start:stop])
+
+    def tell(self):
+        """
+        Get the current position.
+
+        Returns:
+            int:
+        """
+        return self._position
+
+    def seek(self, position):
+        """
+        Set the current position.
+
+        Args:
+            position (int): the new (absolute) position.
+
+        Returns:
+            int: the new position.
+        """
+        self._position = position
+        return position
+
+    def unpack(self, fmt, length=1):
+        """
+        Unpack the data at the current position according to the specified format in `fmt`.
+
+        Args:
+            fmt (str): format string.
+            length (int): UNUSED, the size follows from `fmt`.
+
+        Returns:
+            variable: the result according to the specified format.
+        """
+        s = _STRUCTS.get(fmt, None)
+        return self._unpack(s if s is not None else struct.Struct(fmt))
+
+    def _unpack(self, s):
+        value = s.unpack_from(self._view, self._position)[0]
+        self._position += s.size
+        return value
+
+    def ReadByte(self):
+        """
+        Read a single byte.
+
+        Returns:
+            bytes: a single byte if successful.
+
+        Raises:
+            ValueError: if there is insufficient data
+        """
+        position = self._position
+        if position >= self._length:
+            raise ValueError("Not enough data available")
+        self._position = position + 1
+        return bytes(self._view[position:position + 1])
+
+    def ReadBytes(self, length):
+        """
+        Read up to `length` number of bytes.
+
+        Args:
+            length (int): number of bytes to read.
+
+        Returns:
+            bytes:
+        """
+        return self.read(length)
+
+    def ReadBytesView(self, length):
+        """
+        Read up to `length` number of bytes without copying them.
+
+        Args:
+            length (int): number of bytes to read.
+
+        Returns:
+            memoryview: a view on the data, which is only valid as long as the data is.
+        """
+        start = self._position
+        self._position = min(start + length, self._length)
+        return self._view[start:self._position]
+
+    def ReadBool(self):
+        return self._unpack(_BOOL)
+
+    def ReadChar(self):
+        return self._unpack(_CHAR)
+
+    def ReadInt8(self, endian="<"):
+        return self._unpack(_INT8) if endian == "<" else self.unpack(endian + 'b')
+
+    def ReadUInt8(self, endian="<"):
+        return self._unpack(_UINT8) if endian == "<" else self.unpack(endian + 'B')
+
+    def ReadInt16(self, endian="<"):
+        return self._unpack(_INT16) if endian == "<" else self.unpack(endian + 'h')
+
+    def ReadUInt16(self, endian="<"):
+        return self._unpack(_UINT16) if endian == "<" else self.unpack(endian + 'H')
+
+    def ReadInt32(self, endian="<"):
+        return self._unpack(_INT32) if endian == "<" else self.unpack(endian + 'i')
+
+    def ReadUInt32(self, endian="<"):
+        return self._unpack(_UINT32) if endian == "<" else self.unpack(endian + 'I')
+
+    def ReadInt64(self, endian="<"):
+        return self._unpack(_INT64) if endian == "<" else self.unpack(endian + 'q')
+
+    def ReadUInt64(self, endian="<"):
+        return self._unpack(_UINT64) if endian == "<" else self.unpack(endian + 'Q')
+
+    def ReadVarInt(self, max=sys.maxsize):
+        """
+        Read a variable length integer.
+
+        Args:
+            max (int): (Optional) maximum number of bytes to read.
+
+        Returns:
+            int:
+
+        Raises:
+            ValueError: if the specified `max` number of bytes is exceeded
+        """
+        position = self._position
+        if position >= self._length:
+            return 0
+
+        value = self._view[position]
+        self._position = position + 1
+        if value == 0xfd:
+            value = self._unpack(_UINT16)
+        elif value == 0xfe:
+            value = self._unpack(_UINT32)
+        elif value == 0xff:
+            value = self._unpack(_UINT64)
+
+        if value > max:
+            raise ValueError(f"Maximum number of bytes ({max}) exceeded.")
+
+        return value
+
+    def ReadUInt256(self):
+        """
+        Read a UInt256 value.
+
+        Returns:
+            UInt256:
+        """
+        return UInt256(data=bytearray(self.ReadBytesView(32)))
+
+    def ReadUInt160(self):
+        """
+        Read a UInt160 value.
+
+        Returns:
+            UInt160:
+        """
+        return UInt160(data=bytearray(self.ReadBytesView(20)))
+
+    def ReadHashes(self):
+        """
+        Read Hash values.
+
+        Returns:
+            list: a list of hash values. Each value is of the bytearray type.
+        """
+        length = self.ReadVarInt()
+        items = []
+        for i in range(0, length):
+            items.append(self.ReadBytesView(32)[::-1].hex())
+        return items
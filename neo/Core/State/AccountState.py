@@ -1,7 +1,7 @@
 import sys
 from .StateBase import StateBase
 from neo.Core.Fixed8 import Fixed8
-from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.IO.MemoryStream import StreamManager
 from neo.Core.Cryptography.Crypto import Crypto
 from neo.Core.IO.BinaryWriter import BinaryWriter
@@ -90,18 +90,15 @@ class AccountState(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             AccountState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         account = AccountState()
         account.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return account
 
     def Deserialize(self, reader):
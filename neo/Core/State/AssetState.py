@@ -1,7 +1,6 @@
 from .StateBase import StateBase
 from neo.Core.Fixed8 import Fixed8
-from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.AssetType import AssetType
 from neo.Core.UInt160 import UInt160
 from neo.Core.Cryptography.Crypto import Crypto
@@ -66,18 +65,15 @@ class AssetState(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             AssetState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         account = AssetState()
         account.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return account
 
     def Deserialize(self, reader):
@@ -1,6 +1,5 @@
 from .StateBase import StateBase
-from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.FunctionCode import FunctionCode
 from enum import IntEnum
 import binascii
@@ -123,18 +122,15 @@ class ContractState(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             ContractState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         c = ContractState()
         c.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return c
 
     def Serialize(self, writer):
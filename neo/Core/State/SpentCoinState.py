@@ -1,7 +1,6 @@
 from collections import namedtuple
 from .StateBase import StateBase
-from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from copy import deepcopy
 
 
@@ -127,18 +126,15 @@ class SpentCoinState(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             SpentCoinState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         spentcoin = SpentCoinState()
         spentcoin.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return spentcoin
 
     def Deserialize(self, reader):
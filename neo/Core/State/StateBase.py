@@ -22,7 +22,7 @@ class StateBase(SerializableMixin):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
         """
         pass
 
@@ -1,7 +1,7 @@
 from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.IO.BinaryWriter import BinaryWriter
 from neo.Core.Mixins import SerializableMixin
-from neo.IO.MemoryStream import StreamManager
 from neo.Core.Fixed8 import Fixed8
 
 from enum import Enum
@@ -65,18 +65,15 @@ class StateDescriptor(SerializableMixin):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             ValidatorState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         v = StateDescriptor()
         v.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return v
 
     def Serialize(self, writer: BinaryWriter):
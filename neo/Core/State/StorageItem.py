@@ -1,6 +1,5 @@
 from .StateBase import StateBase
-from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.Size import GetVarSize
 
 
@@ -64,16 +63,14 @@ class StorageItem(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             StorageItem:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         v = StorageItem()
         v.Deserialize(reader)
-        StreamManager.ReleaseStream(m)
         return v
 
     def Serialize(self, writer):
@@ -1,8 +1,7 @@
 import sys
 from .StateBase import StateBase
 from .CoinState import CoinState
-from neo.Core.IO.BinaryReader import BinaryReader
-from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.Size import Size as s
 from neo.Core.Size import GetVarSize
 from neo.Core.State.CoinState import CoinState
@@ -90,18 +89,15 @@ class UnspentCoinState(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             UnspentCoinState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         uns = UnspentCoinState()
         uns.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return uns
 
     def Serialize(self, writer):
@@ -1,7 +1,7 @@
 from .StateBase import StateBase
 from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.IO.BinaryWriter import BinaryWriter
-from neo.IO.MemoryStream import StreamManager
 from neo.Core.Cryptography.ECCurve import EllipticCurve, ECDSA
 from neo.Core.Size import Size as s
 from neo.Core.Size import GetVarSize
@@ -53,18 +53,15 @@ class ValidatorState(StateBase):
         Deserialize full object.
 
         Args:
-            buffer (bytes, bytearray, BytesIO): (Optional) data to create the stream from.
+            buffer (bytes, bytearray, memoryview): the serialized data.
 
         Returns:
             ValidatorState:
         """
-        m = StreamManager.GetStream(buffer)
-        reader = BinaryReader(m)
+        reader = BufferReader(buffer)
         v = ValidatorState()
         v.Deserialize(reader)
 
-        StreamManager.ReleaseStream(m)
-
         return v
 
     def Serialize(self, writer: BinaryWriter):
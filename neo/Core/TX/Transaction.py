@@ -6,7 +6,6 @@ Usage:
 """
 import sys
 from itertools import groupby
-import binascii
 from neo.Core.UInt160 import UInt160
 from neo.Blockchain import GetBlockchain
 from neo.Core.TX.TransactionAttribute import TransactionAttributeUsage
@@ -17,7 +16,7 @@ from neo.Network.Mixins import InventoryMixin
 from neo.Core.Cryptography.Crypto import Crypto
 from neo.Core.IO.Mixins import SerializableMixin
 from neo.IO.MemoryStream import StreamManager
-from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.Mixins import EquatableMixin
 import neo.Core.Helper
 from neo.Core.Witness import Witness
@@ -261,8 +260,7 @@ class Transaction(InventoryMixin):
             UInt256:
         """
         if not self.__hash:
-            ba = bytearray(binascii.unhexlify(self.GetHashData()))
-            hash = Crypto.Hash256(ba)
+            hash = Crypto.Hash256(self.GetRawHashData())
             self.__hash = UInt256(data=hash)
         return self.__hash
 
@@ -275,6 +273,15 @@ class Transaction(InventoryMixin):
         """
         return neo.Core.Helper.Helper.GetHashData(self)
 
+    def GetRawHashData(self):
+        """
+        Get the data used for hashing as raw bytes.
+
+        Returns:
+            bytes:
+        """
+        return neo.Core.Helper.Helper.GetRawHashData(self)
+
     def GetMessage(self):
         """
         Get the data used for hashing.
@@ -421,12 +428,8 @@ class Transaction(InventoryMixin):
         Returns:
             Transaction:
         """
-        mstream = StreamManager.GetStream(buffer)
-        reader = BinaryReader(mstream)
-        tx = Transaction.DeserializeFrom(reader)
-
-        StreamManager.ReleaseStream(mstream)
-        return tx
+        reader = BufferReader(buffer)
+        return Transaction.DeserializeFrom(reader)
 
     @staticmethod
     def DeserializeFrom(reader):
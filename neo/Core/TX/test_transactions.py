@@ -74,6 +74,7 @@ class TransactionTestCase(NeoTestCase):
 
         self.assertEqual(tx.ToArray(), self.ctx_raw)
         self.assertEqual(tx.Hash.ToBytes(), self.ctx_id)
+        self.assertEqual(tx.GetRawHashData(), binascii.unhexlify(tx.GetHashData()))
 
         json = tx.ToJson()
         self.assertEqual(json['size'], 605)
@@ -250,6 +250,32 @@ class TestCrypto(TestCase):
         self.assertEqual(verification_result, verification_result2)
         self.assertTrue(verification_result)
 
+    def test_verifying_key_cache(self):
+        privkey = KeyPair.PrivateKeyFromWIF("L44B5gGEpqEDRS9vVPz7QT35jcBG2r3CZwSwQ4fCewXAhAhqGVpP")
+        keypair = KeyPair(privkey)
+        compressed_key = binascii.unhexlify(keypair.PublicKey.encode_point(True))
+        message = b'aabbcc'
+        signature = Crypto.Sign(message, bytes(keypair.PrivateKey))
+
+        Crypto.ClearVerifyingKeyCache()
+        for _ in range(3):
+            self.assertTrue(Crypto.VerifySignature(message, signature, compressed_key))
+        self.assertFalse(Crypto.VerifySignature(b'aabb', signature, compressed_key))
+
+        stats = Crypto.VerifyingKeyCacheStats()
+        self.assertEqual(1, stats['size'])
+        self.assertEqual(3, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(0.75, stats['hit_rate'])
+
+        # invalid keys are cached as well
+        self.assertFalse(Crypto.VerifySignature(message, signature, b'\x01' * 64))
+        self.assertFalse(Crypto.VerifySignature(message, signature, b'\x01' * 64))
+        self.assertIsNone(Crypto._verifying_keys[b'\x01' * 64])
+
+        Crypto.ClearVerifyingKeyCache()
+        self.assertEqual({'size': 0, 'hits': 0, 'misses': 0, 'hit_rate': 0.0}, Crypto.VerifyingKeyCacheStats())
+
     def test_script_hash(self):
         # Expected output taken from running: getHash(Buffer.from('abc', 'utf8')).toString('hex')
         # using https://github.com/CityOfZion/neon-wallet-react-native/blob/master/app/api/crypto/index.js
@@ -0,0 +1,102 @@
+import binascii
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from neo.Core.HeaderIndex import HeaderIndex
+from neo.Core.UInt256 import UInt256
+
+
+class HeaderIndexTest(TestCase):
+    def hashes(self, count):
+        return [hashlib.sha256(i.to_bytes(4, 'little')).hexdigest().encode('utf-8') for i in range(count)]
+
+    def test_list_behaviour(self):
+        hashes = self.hashes(10)
+        index = HeaderIndex(hashes[:5])
+        index.append(hashes[5])
+        index.extend(hashes[6:])
+
+        self.assertEqual(len(index), 10)
+        self.assertEqual(index[0], hashes[0])
+        self.assertEqual(index[-1], hashes[9])
+        self.assertEqual(index[2:4], hashes[2:4])
+        self.assertEqual(index[8:20], hashes[8:])
+        self.assertEqual(list(index), hashes)
+
+        with self.assertRaises(IndexError):
+            index[10]
+
+        with self.assertRaises(ValueError):
+            index.append(b'aa')
+
+    def test_lookup(self):
+        # enough hashes to grow the lookup table a few times
+        hashes = self.hashes(5000)
+        index = HeaderIndex()
+        for hash in hashes:
+            index.append(hash)
+
+        for height in (0, 1, 1000, 4999):
+            self.assertEqual(index.IndexOf(hashes[height]), height)
+            self.assertEqual(index.IndexOf(hashes[height].decode('utf-8')), height)
+            self.assertIn(hashes[height], index)
+
+        self.assertEqual(index.IndexOf(UInt256.ParseString(hashes[42].decode('utf-8'))), 42)
+
+        # 4 byte slots, between 3/8 and 3/4 of them in use
+        self.assertEqual(index._table.itemsize, 4)
+        self.assertEqual(len(index._table), 8192)
+
+        self.assertEqual(index.IndexOf(b'00' * 32), -1)
+        self.assertEqual(index.IndexOf(b'not a hash'), -1)
+        self.assertEqual(index.IndexOf(None), -1)
+        self.assertNotIn(b'zz' * 32, index)
+
+    def test_raw(self):
+        hashes = self.hashes(3)
+        raw = b''.join(binascii.unhexlify(hash)[::-1] for hash in hashes)
+
+        index = HeaderIndex()
+        index.ExtendRaw(raw)
+
+        self.assertEqual(index[:], hashes)
+        self.assertEqual(index.GetRaw(0, 3), raw)
+        self.assertEqual(index.GetRaw(1, 2000), raw[32:])
+        self.assertEqual(index.IndexOf(hashes[2]), 2)
+
+        with self.assertRaises(ValueError):
+            index.ExtendRaw(raw[:40])
+
+    def test_file(self):
+        hashes = self.hashes(3000)
+        index = HeaderIndex(hashes)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, 'header_index.bin')
+            index.WriteFile(path)
+
+            loaded = HeaderIndex.FromFile(path)
+            self.assertEqual(list(loaded), hashes)
+            self.assertEqual(loaded.IndexOf(hashes[2999]), 2999)
+
+            loaded.append(self.hashes(3001)[-1])
+            self.assertEqual(loaded.IndexOf(loaded[-1]), 3000)
+
+            with open(path, 'r+b') as f:
+                f.seek(100)
+                f.write(b'x')
+
+            with self.assertRaises(ValueError) as context:
+                HeaderIndex.FromFile(path)
+            self.assertIn("checksum", str(context.exception))
+
+            with open(path, 'wb') as f:
+                f.write(b'not an index')
+
+            with self.assertRaises(ValueError):
+                HeaderIndex.FromFile(path)
+        finally:
+            shutil.rmtree(tmp_dir)
@@ -1,4 +1,5 @@
 import binascii
+import struct
 from io import BytesIO
 from unittest import TestCase
 from neo.Core.Fixed8 import Fixed8
@@ -7,6 +8,7 @@ from neo.Core.UInt256 import UInt256
 from neo.Core.IO.Mixins import SerializableMixin
 import neo.Core.IO.BinaryWriter as BinaryWriter
 from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 
 
 class TestObject(SerializableMixin):
@@ -141,6 +143,57 @@ class BinaryReaderTestCase(TestCase):
         self.assertIn("Not enough data available", str(context.exception))
 
 
+class BufferReaderTestCase(TestCase):
+    def test_same_as_binary_reader(self):
+        cases = [
+            ('ReadByte', b"\x41\x01"), ('ReadBool', b"\x02"), ('ReadChar', b"\x41"),
+            ('ReadFloat', b"1234"), ('ReadDouble', b"12345678"),
+            ('ReadInt8', b"\xff"), ('ReadUInt8', b"\xff"), ('ReadInt16', b"\xff2"), ('ReadUInt16', b"\xff2"),
+            ('ReadInt32', b"\xff234"), ('ReadUInt32', b"\xff234"),
+            ('ReadInt64', b"\xff2345678"), ('ReadUInt64', b"\xff2345678"),
+            ('ReadVarInt', b""), ('ReadVarInt', b"\x05"), ('ReadVarInt', b"\xfd12"), ('ReadVarInt', b"\xfe1234"),
+            ('ReadVarInt', b"\xff12345678"),
+            ('ReadVarBytes', b"\x0312345"), ('ReadString', b"\x03234"), ('ReadVarString', b"\x03123"),
+            ('ReadUInt256', b"123871987392873918723981723987189"), ('ReadUInt160', b"123871987392873918723981723987189"),
+            ('ReadFixed8', b"\x01\x02\x0345678"), ('ReadHashes', b"\x0212345567898765434567890987"),
+        ]
+        for method, data in cases:
+            expected = getattr(get_br(data), method)()
+            self.assertEqual(getattr(BufferReader(data), method)(), expected, method)
+            self.assertEqual(getattr(BufferReader(memoryview(b"xx" + data)[2:]), method)(), expected, method)
+
+        self.assertEqual(BufferReader(b"\x00\x01").ReadUInt16(endian=">"), 1)
+        self.assertEqual(BufferReader(b"abc").ReadFixedString(2), b"ab")
+        self.assertEqual(BufferReader(b"xx\x04\x01\x02\x03\x04", 2).ReadSerializableArray('neo.Core.tests.test_io.TestObject')[0].test_value, 0x4030201)
+
+    def test_position(self):
+        reader = BufferReader(b"\x01\x02\x03\x04")
+        self.assertEqual(reader.ReadBytes(3), b"\x01\x02\x03")
+        self.assertEqual(reader.stream.tell(), 3)
+        self.assertEqual(reader.ReadBytes(10), b"\x04")
+
+        reader.stream.seek(1)
+        self.assertEqual(bytes(reader.ReadBytesView(2)), b"\x02\x03")
+        self.assertEqual(reader.read(), b"\x04")
+
+    def test_insufficient_data(self):
+        with self.assertRaises(ValueError):
+            BufferReader(b"").ReadByte()
+
+        with self.assertRaises(ValueError) as context:
+            BufferReader(b"1234").SafeReadBytes(10)
+        self.assertIn("Not enough data available", str(context.exception))
+
+        with self.assertRaises(ValueError):
+            BufferReader(b"\xfd\x01\x00").ReadVarBytes()
+
+        with self.assertRaises(ValueError):
+            BufferReader(b"\xfd\x01\x00").ReadVarInt(max=0)
+
+        with self.assertRaises(struct.error):
+            BufferReader(b"123").ReadUInt32()
+
+
 class BinaryWriterTestCase(TestCase):
     def test_various(self):
         self.assertEqual(BinaryWriter.swap32(123), 2063597568)
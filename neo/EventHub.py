@@ -17,12 +17,60 @@ from neo.logging import log_manager
 logger = log_manager.getLogger()
 
 # pymitter manages the event dispatching (https://github.com/riga/pymitter#examples)
-from pymitter import EventEmitter
+import pymitter
+
+
+class EventEmitter(pymitter.EventEmitter):
+    """
+    `pymitter.EventEmitter` which can also tell which listeners an event would be emitted to, so that events nobody
+    listens for don't have to be created.
+    """
+
+    def listeners_of(self, event):
+        """
+        Returns all functions that are invoked when emitting *event*, with wildcards applied like `emit` does.
+        """
+        # the tree of listeners is private to pymitter.EventEmitter
+        tree = self._EventEmitter__tree
+        cbkey = self._EventEmitter__CBKEY
+        wcchar = self._EventEmitter__WCCHAR
+
+        parts = event.split(self.delimiter)
+        if cbkey in parts:
+            return []
+
+        listeners = tree[cbkey][:]
+        branches = [tree]
+        for p in parts:
+            branches = [b for branch in branches for k, b in branch.items()
+                        if k != cbkey and (k == p or (self.wildcard and (p == wcchar or k == wcchar)))]
+
+        for b in branches:
+            listeners.extend(b[cbkey])
+
+        return [l.func for l in listeners]
+
 
 # `events` is can be imported and used from all parts of the code to dispatch or receive events
 events = EventEmitter(wildcard=True)
 
 
+def has_smart_contract_event_listeners(event_type):
+    """
+    Check if a smart contract event would be handled by anybody, i.e. if it has to be created and dispatched at all.
+
+    Args:
+        event_type (str): the event type, e.g. `SmartContractEvent.STORAGE_GET`.
+
+    Returns:
+        bool:
+    """
+    if settings.log_smart_contract_events:
+        return True
+    # `on_sc_event` only logs the events when enabled
+    return any(func is not on_sc_event for func in events.listeners_of(event_type))
+
+
 # Helper for easier dispatching of events from somewhere in the project
 def dispatch_smart_contract_event(event_type,
                                   event_payload,
@@ -1,6 +1,5 @@
 import importlib
-from .MemoryStream import StreamManager
-from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.logging import log_manager
 
 logger = log_manager.getLogger()
@@ -13,7 +12,7 @@ class Helper:
         """
 
         Args:
-            buffer (BytesIO/bytes): stream to deserialize `class_name` to.
+            buffer (bytes, bytearray, memoryview): data to deserialize `class_name` to.
             class_name (str): a full path to the class to be deserialized into. e.g. 'neo.Core.Block.Block'
 
         Returns:
@@ -23,8 +22,7 @@ class Helper:
         module = '.'.join(class_name.split('.')[:-1])
         klassname = class_name.split('.')[-1]
         klass = getattr(importlib.import_module(module), klassname)
-        mstream = StreamManager.GetStream(buffer)
-        reader = BinaryReader(mstream)
+        reader = BufferReader(buffer)
 
         try:
             serializable = klass()
@@ -32,7 +30,5 @@ class Helper:
             return serializable
         except Exception as e:
             logger.error("Could not deserialize: %s %s" % (e, class_name))
-        finally:
-            StreamManager.ReleaseStream(mstream)
 
         return None
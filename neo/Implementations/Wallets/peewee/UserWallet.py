@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 import binascii
+from contextlib import contextmanager
 
+from peewee import chunked
 from playhouse.migrate import SqliteMigrator, BooleanField, migrate
 from .PWDatabase import PWDatabase
 from neo.Wallets.Wallet import Wallet
 from neo.Wallets.Coin import Coin as WalletCoin
+from neo.Wallets.CoinStore import CoinStore
 from neo.SmartContract.Contract import Contract as WalletContract
 from neo.IO.Helper import Helper
 from neo.Core.Helper import Helper as CoreHelper
@@ -27,11 +30,16 @@ from neo.logging import log_manager
 
 logger = log_manager.getLogger()
 
+# rows per bulk statement, keeping the number of SQL variables below the SQLite limit (999)
+BATCH_SIZE = 100
+
 
 class UserWallet(Wallet):
     Version = None
 
     def __init__(self, path, passwordKey, create):
+        # script hash (bytes) -> id of the Address row, see `_GetAddressIds`
+        self._address_ids = {}
 
         super(UserWallet, self).__init__(path, passwordKey=passwordKey, create=create)
         logger.debug("initialized user wallet %s " % self)
@@ -58,10 +66,9 @@ class UserWallet(Wallet):
             logger.debug("wallet rebuild: deleting %s coins and %s transactions" %
                          (Coin.select().count(), Transaction.select().count()))
 
-            for c in Coin.select():
-                c.delete_instance()
-            for tx in Transaction.select():
-                tx.delete_instance()
+            with PWDatabase.DBProxy().atomic():
+                Coin.delete().execute()
+                Transaction.delete().execute()
         except Exception as e:
             print("Could not rebuild %s " % e)
 
@@ -306,73 +313,135 @@ class UserWallet(Wallet):
         if k is None:
             k = Key.create(Name=key, Value=value)
 
-    def OnProcessNewBlock(self, block, added, changed, deleted):
-        for tx in block.FullTransactions:
-
-            if self.IsWalletTransaction(tx):
-                db_tx = None
-                try:
-                    db_tx = Transaction.get(Hash=tx.Hash.ToBytes())
-                except Exception as e:
-                    pass
-
-                ttype = tx.Type
-                if type(ttype) is bytes:
-                    ttype = int.from_bytes(tx.Type, 'little')
-
-                if not db_tx:
-                    db_tx = Transaction.create(
-                        Hash=tx.Hash.ToBytes(),
-                        TransactionType=ttype,
-                        RawData=tx.ToArray(),
-                        Height=block.Index,
-                        DateTime=block.Timestamp
-                    )
-                else:
-                    db_tx.Height = block.Index
+    @contextmanager
+    def BlockProcessingBatch(self):
+        """
+        Persist the changes of all blocks processed by a `ProcessBlocks` call in a single database transaction.
 
-                db_tx.save()
+        If processing fails, the transaction is rolled back and the wallet height and coins are restored to the start of
+        the chunk, so that its blocks are processed again.
+        """
+        start_height = self._current_height
+        try:
+            with PWDatabase.DBProxy().atomic():
+                yield
+        except Exception:
+            self._current_height = start_height
+            self._coins = CoinStore(self.LoadCoins())
+            raise
 
-        self.OnCoinsChanged(added, changed, deleted)
+    def OnProcessNewBlock(self, block, added, changed, deleted):
+        with PWDatabase.DBProxy().atomic():
+            wallet_txs = {}
+            for tx in block.FullTransactions:
+                if self.IsWalletTransaction(tx):
+                    wallet_txs[tx.Hash.ToString()] = tx
+
+            if wallet_txs:
+                # transactions stored before, e.g. when they were sent from this wallet, only get their height updated
+                existing = set()
+                for hashes in chunked(wallet_txs.keys(), BATCH_SIZE):
+                    existing.update(db_tx.Hash for db_tx in Transaction.select(Transaction.Hash).where(Transaction.Hash.in_(hashes)))
+
+                for hashes in chunked(existing, BATCH_SIZE):
+                    Transaction.update(Height=block.Index).where(Transaction.Hash.in_(hashes)).execute()
+
+                rows = []
+                for tx_hash, tx in wallet_txs.items():
+                    if tx_hash in existing:
+                        continue
+
+                    ttype = tx.Type
+                    if type(ttype) is bytes:
+                        ttype = int.from_bytes(tx.Type, 'little')
+
+                    rows.append({
+                        'Hash': tx_hash,
+                        'TransactionType': ttype,
+                        'RawData': tx.ToArray(),
+                        'Height': block.Index,
+                        'DateTime': block.Timestamp
+                    })
+
+                for batch in chunked(rows, BATCH_SIZE):
+                    Transaction.insert_many(batch).execute()
+
+            self.OnCoinsChanged(added, changed, deleted)
 
     def OnSaveTransaction(self, tx, added, changed, deleted):
         self.OnCoinsChanged(added, changed, deleted)
 
     def OnCoinsChanged(self, added, changed, deleted):
-
-        for coin in added:
-            addr_hash = bytes(coin.Output.ScriptHash.Data)
+        with PWDatabase.DBProxy().atomic():
+            address_ids = self._GetAddressIds(set(bytes(coin.Output.ScriptHash.Data) for coin in added))
+
+            rows = []
+            for coin in added:
+                addr_hash = bytes(coin.Output.ScriptHash.Data)
+                address_id = address_ids.get(addr_hash, None)
+                if address_id is None:
+                    logger.error("[Path: %s ] Could not create coin: address %s not found " % (self._path, coin.Output.ScriptHash))
+                    continue
+
+                rows.append({
+                    'TxId': bytes(coin.Reference.PrevHash.Data),
+                    'Index': coin.Reference.PrevIndex,
+                    'AssetId': bytes(coin.Output.AssetId.Data),
+                    'Value': coin.Output.Value.value,
+                    'ScriptHash': addr_hash,
+                    'State': coin.State,
+                    'Address': address_id
+                })
 
             try:
-                address = Address.get(ScriptHash=addr_hash)
-
-                c = Coin(
-                    TxId=bytes(coin.Reference.PrevHash.Data),
-                    Index=coin.Reference.PrevIndex,
-                    AssetId=bytes(coin.Output.AssetId.Data),
-                    Value=coin.Output.Value.value,
-                    ScriptHash=bytes(coin.Output.ScriptHash.Data),
-                    State=coin.State,
-                    Address=address
-                )
-                c.save()
+                for batch in chunked(rows, BATCH_SIZE):
+                    Coin.insert_many(batch).execute()
             except Exception as e:
-                logger.error("[Path: %s ] Could not create coin: %s " % (self._path, e))
+                logger.error("[Path: %s ] Could not create coins: %s " % (self._path, e))
 
-        for coin in changed:
-            try:
-                c = Coin.get(TxId=bytes(coin.Reference.PrevHash.Data), Index=coin.Reference.PrevIndex)
-                c.State = coin.State
-                c.save()
-            except Exception as e:
-                logger.error("[Path: %s ] could not change coin %s %s (coin to change not found)" % (self._path, coin, e))
+            # coins of the same transaction and state are updated together
+            by_state = {}
+            for coin in changed:
+                by_state.setdefault((coin.State, bytes(coin.Reference.PrevHash.Data)), []).append(coin)
 
-        for coin in deleted:
+            for (state, tx_id), coins in by_state.items():
+                try:
+                    count = Coin.update(State=state).where(
+                        (Coin.TxId == tx_id) & (Coin.Index.in_([coin.Reference.PrevIndex for coin in coins]))).execute()
+                    if count < len(coins):
+                        logger.error("[Path: %s ] could not change coins %s (coin to change not found)" % (self._path, coins))
+                except Exception as e:
+                    logger.error("[Path: %s ] could not change coins %s %s" % (self._path, coins, e))
+
+            self._DeleteCoins(deleted)
+
+    def _GetAddressIds(self, script_hashes):
+        """
+        Get the ids of the Address rows of script hashes, cached in `_address_ids`.
+
+        Args:
+            script_hashes (set): of script hashes (bytes).
+
+        Returns:
+            dict: script hash -> id, without the script hashes not having an Address row.
+        """
+        missing = [script_hash for script_hash in script_hashes if script_hash not in self._address_ids]
+        for batch in chunked(missing, BATCH_SIZE):
+            for address in Address.select(Address.Id, Address.ScriptHash).where(Address.ScriptHash.in_(batch)):
+                self._address_ids[bytes(address.ScriptHash)] = address.Id
+
+        return self._address_ids
+
+    def _DeleteCoins(self, coins):
+        by_tx = {}
+        for coin in coins:
+            by_tx.setdefault(bytes(coin.Reference.PrevHash.Data), []).append(coin.Reference.PrevIndex)
+
+        for tx_id, indexes in by_tx.items():
             try:
-                c = Coin.get(TxId=bytes(coin.Reference.PrevHash.Data), Index=coin.Reference.PrevIndex)
-                c.delete_instance()
+                Coin.delete().where((Coin.TxId == tx_id) & (Coin.Index.in_(indexes))).execute()
             except Exception as e:
-                logger.error("[Path: %s] could not delete coin %s %s " % (self._path, coin, e))
+                logger.error("[Path: %s] could not delete coins of %s %s " % (self._path, tx_id, e))
 
     @property
     def Addresses(self):
@@ -435,14 +504,11 @@ class UserWallet(Wallet):
     def DeleteAddress(self, script_hash):
         success, coins_toremove = super(UserWallet, self).DeleteAddress(script_hash)
 
-        for coin in coins_toremove:
-            try:
-                c = Coin.get(TxId=bytes(coin.Reference.PrevHash.Data), Index=coin.Reference.PrevIndex)
-                c.delete_instance()
-            except Exception as e:
-                logger.error("Could not delete coin %s %s " % (coin, e))
+        with PWDatabase.DBProxy().atomic():
+            self._DeleteCoins(coins_toremove)
 
         todelete = bytes(script_hash.ToArray())
+        self._address_ids.pop(todelete, None)
 
         for c in Contract.select():
             address = c.Address
@@ -463,18 +529,12 @@ class UserWallet(Wallet):
         Returns:
             Fixed8: total balance.
         """
-        total = Fixed8(0)
-
-        for coin in self.GetCoins():
-            if coin.Output.AssetId == asset_id and coin.Output.Address == for_addr:
-                if coin.State & CoinState.Confirmed > 0 and \
-                        coin.State & CoinState.Spent == 0 and \
-                        coin.State & CoinState.Locked == 0 and \
-                        coin.State & CoinState.Frozen == 0 and \
-                        coin.State & CoinState.WatchOnly == watch_only:
-                    total = total + coin.Output.Value
-
-        return total
+        try:
+            script_hash = CoreHelper.AddrStrToScriptHash(for_addr)
+        except Exception as e:
+            return Fixed8(0)
+
+        return self._coins.Balance(asset_id, script_hash=script_hash, watch_only_val=watch_only)
 
     def _get_asset_balances(self, address, watch_only):
         assets = dict()
@@ -1,9 +1,21 @@
+import os
+import shutil
+import tempfile
+from mock import patch, MagicMock
+from neo.Utils.NeoTestCase import NeoTestCase
 from neo.Utils.WalletFixtureTestCase import WalletFixtureTestCase
 from neo.Implementations.Wallets.peewee.UserWallet import UserWallet
 from neo.Wallets.utils import to_aes_key
 from neo.Core.Blockchain import Blockchain
 from neo.Core.UInt160 import UInt160
 from neo.Core.KeyPair import KeyPair
+from neo.Core.CoinReference import CoinReference
+from neo.Core.TX.Transaction import TransactionOutput, ContractTransaction
+from neo.Core.State.CoinState import CoinState
+from neo.Core.Fixed8 import Fixed8
+from neo.Core.UInt256 import UInt256
+from neo.Wallets.Coin import Coin
+from neo.Implementations.Wallets.peewee.Models import Coin as DBCoin
 
 
 class UserWalletTestCase(WalletFixtureTestCase):
@@ -102,3 +114,71 @@ class UserWalletTestCase(WalletFixtureTestCase):
     def test_8_create_bad_path(self):
 
         self.assertRaises(Exception, UserWallet.Create, './path/to/nonexistent/wallet.db3', 'blah')
+
+    def test_9_coins_changed(self):
+
+        wallet = self.GetWallet1(recreate=True)
+        addr = wallet.GetStandardAddress()
+        unknown_addr = UInt160(data=bytearray(20))
+        tx_id = UInt256(data=bytearray(b'\x01' * 32))
+
+        coins = [Coin.CoinFromRef(CoinReference(tx_id, index), TransactionOutput(self.NEO, Fixed8.FromDecimal(index + 1), addr), CoinState.Confirmed)
+                 for index in range(3)]
+        unknown = Coin.CoinFromRef(CoinReference(tx_id, 3), TransactionOutput(self.NEO, Fixed8.One(), unknown_addr), CoinState.Confirmed)
+
+        wallet.OnCoinsChanged(coins + [unknown], [], [])
+        self.assertEqual(len(wallet.LoadCoins()), 3)
+
+        coins[0].State |= CoinState.Spent
+        wallet.OnCoinsChanged([], [coins[0]], [coins[1]])
+
+        stored = wallet.LoadCoins()
+        self.assertEqual(len(stored), 2)
+        self.assertEqual(stored[coins[0].Reference].State, CoinState.Confirmed | CoinState.Spent)
+        self.assertEqual(stored[coins[2].Reference].State, CoinState.Confirmed)
+
+
+class UserWalletProcessBlocksTestCase(NeoTestCase):
+
+    def setUp(self):
+        self.wallet_dir = tempfile.mkdtemp()
+        self.wallet = UserWallet.Create(os.path.join(self.wallet_dir, 'wallet.db3'), to_aes_key('awesomepassword'))
+
+    def tearDown(self):
+        self.wallet.Close()
+        shutil.rmtree(self.wallet_dir)
+
+    def block(self, index):
+        tx = ContractTransaction()
+        tx.outputs = [TransactionOutput(UInt256(data=bytearray(b'\x01' * 32)), Fixed8.FromDecimal(index + 1), self.wallet.GetStandardAddress())]
+        block = MagicMock()
+        block.Index = index
+        block.Timestamp = 1500000000 + index
+        block.Transactions = block.FullTransactions = [tx]
+        return block
+
+    def test_failed_batch_is_processed_again(self):
+        blocks = [self.block(index) for index in range(3)]
+        failing = [True]
+
+        def get_block(height):
+            if height == 1 and failing[0]:
+                raise Exception("block not available")
+            return blocks[height]
+
+        with patch('neo.Wallets.Wallet.Blockchain') as blockchain:
+            blockchain.Default.return_value.Height = 3
+            blockchain.Default.return_value.GetBlockByHeight.side_effect = get_block
+
+            # the coin of block 0 is rolled back together with the rest of the batch
+            self.wallet.ProcessBlocks()
+            self.assertEqual(self.wallet.WalletHeight, 0)
+            self.assertEqual(len(self.wallet._coins), 0)
+            self.assertEqual(DBCoin.select().count(), 0)
+
+            failing[0] = False
+            self.wallet.ProcessBlocks()
+            self.assertEqual(self.wallet.WalletHeight, 3)
+            self.assertEqual(len(self.wallet._coins), 3)
+            self.assertEqual(DBCoin.select().count(), 3)
+            self.assertEqual(int(self.wallet.LoadStoredData('Height')), 3)
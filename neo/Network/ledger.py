@@ -1,6 +1,7 @@
 import binascii
 import asyncio
-from typing import TYPE_CHECKING, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
 from neo.Core.Blockchain import Blockchain
 from neo.Core.Block import Block
 from neo.IO.Helper import Helper as IOHelper
@@ -15,10 +16,39 @@ if TYPE_CHECKING:
     from neo.Implementations.Blockchains.LevelDB.LevelDBBlockchain import LevelDBBlockchain
 
 
+def _decode_block(raw_block: bytes) -> Optional[Block]:
+    """
+    Deserialize a raw block and compute its hashes.
+
+    Runs in a worker process, the computed hashes are cached on the objects and travel back with the (pickled) block.
+    """
+    block = IOHelper.AsSerializableWithType(raw_block, 'neo.Core.Block.Block')  # type: Block
+    if block is not None:
+        block.Hash
+        for tx in block.Transactions:
+            tx.Hash
+    return block
+
+
 class Ledger:
+    # number of processes decoding upcoming blocks while the current block is being persisted
+    DECODE_WORKERS = 2
+
     def __init__(self, controller=None):
         self.controller = controller
         self.ledger = Blockchain.Default()  # type: LevelDBBlockchain
+        self._decode_executor = None
+        # set when the worker processes failed, blocks are decoded in this process from then on
+        self._decode_in_process = False
+        self._warm_executor = None
+
+    def shutdown(self) -> None:
+        if self._decode_executor:
+            self._decode_executor.shutdown()
+            self._decode_executor = None
+        if self._warm_executor:
+            self._warm_executor.shutdown()
+            self._warm_executor = None
 
     async def cur_header_height(self) -> int:
         return self.ledger.HeaderHeight
@@ -62,10 +92,55 @@ class Ledger:
 
         return count
 
+    async def decode_block(self, raw_block: bytes) -> Optional[Block]:
+        """
+        Deserialize and hash a raw block in a worker process, then warm up the database for the transactions its inputs
+        refer to. Meant to run ahead of `persist_block`.
+
+        Returns:
+            Block: or None if the block could not be deserialized.
+        """
+        loop = asyncio.get_event_loop()
+
+        block = None
+        decoded = False
+        if not self._decode_in_process:
+            try:
+                if self._decode_executor is None:
+                    self._decode_executor = ProcessPoolExecutor(max_workers=self.DECODE_WORKERS)
+                block = await loop.run_in_executor(self._decode_executor, _decode_block, raw_block)
+                decoded = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Failed to decode block in worker process, decoding in place from now on. Reason: {e}")
+                self._decode_in_process = True
+                if self._decode_executor is not None:
+                    self._decode_executor.shutdown(wait=False)
+                    self._decode_executor = None
+
+        if not decoded:
+            block = _decode_block(raw_block)
+
+        if block is not None:
+            if self._warm_executor is None:
+                self._warm_executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                await loop.run_in_executor(self._warm_executor, self.ledger.WarmBlockInputs, block)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # only an optimization, persisting will read what it needs anyway
+                logger.debug(f"Failed to warm up block inputs. Reason: {e}")
+
+        return block
+
     async def add_block(self, raw_block: bytes) -> bool:
         # return await self.controller.add_block(block)
         block = IOHelper.AsSerializableWithType(raw_block, 'neo.Core.Block.Block')  # type: Block
+        return await self.persist_block(block)
 
+    async def persist_block(self, block: Optional[Block]) -> bool:
         if block is None:
             return False
         else:
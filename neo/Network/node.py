@@ -189,6 +189,13 @@ class NeoNode:
                     continue
 
                 for h in inv.hashes:
+                    if inv.type == InventoryType.block:
+                        # serialized from the stored data, without deserializing the block
+                        raw_block = GetBlockchain().GetRawBlock(h.to_string())
+                        if raw_block is not None:
+                            await self.send_message(Message(command='block', payload=raw_block))
+                        continue
+
                     item = self.nodemanager.relay_cache.try_get(h)
                     if item is None:
                         # for the time being we only support data retrieval for our own relays
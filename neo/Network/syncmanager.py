@@ -28,6 +28,7 @@ class SyncManager(Singleton):
     BLOCK_MAX_CACHE_SIZE = 500
     BLOCK_NETWORK_REQ_LIMIT = 500
     BLOCK_REQUEST_TIMEOUT = 5
+    BLOCK_DECODE_AHEAD = 16
 
     def init(self, nodemgr: 'NodeManager'):
         self.nodemgr = nodemgr
@@ -72,6 +73,9 @@ class SyncManager(Singleton):
             shutdown_tasks.append(self.persist_task)
         await asyncio.gather(*shutdown_tasks, return_exceptions=True)
 
+        if self.ledger:
+            self.ledger.shutdown()
+
         print("DONE")
 
     async def block_health(self):
@@ -208,17 +212,55 @@ class SyncManager(Singleton):
             node.nodeweight.append_new_request_time()
 
     async def persist_blocks(self) -> None:
+        """
+        Persist the cached blocks in order.
+
+        Blocks are processed in two stages: the next `BLOCK_DECODE_AHEAD` cached blocks are decoded (and their inputs
+        warmed up) in the background, while the persist stage consumes the already decoded blocks one by one.
+        A block stays in the block cache until it is persisted, so that it is not requested or cached again meanwhile.
+        """
         self.is_persisting_blocks = True
-        while self.keep_running:
-            try:
-                b = self.block_cache.pop(0)
-                raw_b = self.raw_block_cache.pop(0)
-                await self.ledger.add_block(raw_b)
-                await asyncio.sleep(0.001)
-            except IndexError:
-                # cache empty
-                break
-        self.is_persisting_blocks = False
+        decoding = dict()  # id(network block) -> (network block, task decoding its raw block)
+        try:
+            while self.keep_running:
+                try:
+                    b = self.block_cache[0]
+                    raw_b = self.raw_block_cache[0]
+                except IndexError:
+                    # cache empty
+                    break
+
+                _, decode_task = decoding.pop(id(b), (None, None))
+                self._decode_upcoming_blocks(decoding)
+
+                if decode_task is None:
+                    block = await self.ledger.decode_block(raw_b)
+                else:
+                    block = await decode_task
+
+                await self.ledger.persist_block(block)
+
+                # the block cache might have been reset in the mean time
+                if self.block_cache and self.block_cache[0] is b:
+                    self.block_cache.pop(0)
+                    self.raw_block_cache.pop(0)
+                await asyncio.sleep(0)
+        finally:
+            for _, decode_task in decoding.values():
+                decode_task.cancel()
+            self.is_persisting_blocks = False
+
+    def _decode_upcoming_blocks(self, decoding: dict) -> None:
+        # the first cached block is the one being persisted
+        upcoming = set()
+        for b, raw_b in zip(self.block_cache[1:self.BLOCK_DECODE_AHEAD + 1], self.raw_block_cache[1:self.BLOCK_DECODE_AHEAD + 1]):
+            upcoming.add(id(b))
+            if id(b) not in decoding:
+                decoding[id(b)] = (b, asyncio.create_task(self.ledger.decode_block(raw_b)))
+
+        # the block cache might have been reset in the mean time
+        for key in [key for key in decoding if key not in upcoming]:
+            decoding.pop(key)[1].cancel()
 
     async def check_timeout(self) -> None:
         task1 = asyncio.create_task(self.check_header_timeout())
@@ -0,0 +1,24 @@
+import asynctest
+from neo.Network.ledger import Ledger
+
+
+class LedgerDecodeBlockTestCase(asynctest.TestCase):
+    async def test_decode_in_process_after_pool_failure(self):
+        ledger = Ledger()
+        ledger.ledger = asynctest.MagicMock()
+        block = object()
+
+        with asynctest.patch('neo.Network.ledger.ProcessPoolExecutor') as executor_class, \
+                asynctest.patch('neo.Network.ledger._decode_block', return_value=block) as decode:
+            executor_class.return_value.submit.side_effect = RuntimeError("broken pool")
+
+            self.assertIs(block, await ledger.decode_block(b'raw1'))
+            self.assertIs(block, await ledger.decode_block(b'raw2'))
+
+            # the pool is not rebuilt after failing, blocks are decoded in place instead
+            executor_class.assert_called_once()
+            executor_class.return_value.shutdown.assert_called_once_with(wait=False)
+            self.assertEqual(decode.call_count, 2)
+            self.assertIsNone(ledger._decode_executor)
+
+        ledger.shutdown()
@@ -53,3 +53,56 @@ class ShutdownSyncManagerTests(asynctest.TestCase):
         await asyncio.sleep(0.5)
         await self.syncmgr.shutdown()
         self.assertTrue(self.syncmgr.health_task.cancelled())
+
+
+class PersistBlocksSyncManagerTests(asynctest.TestCase):
+    def setUp(self) -> None:
+        self.syncmgr = SyncManager(asynctest.MagicMock)
+        self.syncmgr.reset()
+        # the sync manager is a singleton and might have been shut down by another test
+        self.syncmgr.keep_running = True
+
+    async def test_persist_blocks_in_order(self):
+        decoded = []
+
+        async def decode_block(raw_block):
+            decoded.append(raw_block)
+            return raw_block.decode()
+
+        self.syncmgr.ledger = asynctest.MagicMock()
+        self.syncmgr.ledger.decode_block = asynctest.CoroutineMock(side_effect=decode_block)
+        self.syncmgr.ledger.persist_block = asynctest.CoroutineMock(return_value=True)
+
+        raw_blocks = [b'block1', b'block2', b'block3']
+        self.syncmgr.block_cache = [object() for _ in raw_blocks]
+        self.syncmgr.raw_block_cache = list(raw_blocks)
+
+        await self.syncmgr.persist_blocks()
+
+        # every block is decoded once and persisted in order
+        self.assertEqual(sorted(decoded), raw_blocks)
+        persisted = [call[0][0] for call in self.syncmgr.ledger.persist_block.call_args_list]
+        self.assertEqual(persisted, ['block1', 'block2', 'block3'])
+        self.assertEqual(self.syncmgr.block_cache, [])
+        self.assertFalse(self.syncmgr.is_persisting_blocks)
+
+    async def test_persisting_block_stays_cached(self):
+        cached = []
+
+        async def persist_block(block):
+            cached.append(self.syncmgr.is_in_blockcache(block))
+            return True
+
+        self.syncmgr.ledger = asynctest.MagicMock()
+        self.syncmgr.ledger.decode_block = asynctest.CoroutineMock(side_effect=lambda raw_block: int(raw_block))
+        self.syncmgr.ledger.persist_block = asynctest.CoroutineMock(side_effect=persist_block)
+
+        self.syncmgr.block_cache = [asynctest.MagicMock(index=1), asynctest.MagicMock(index=2)]
+        self.syncmgr.raw_block_cache = [b'1', b'2']
+
+        await self.syncmgr.persist_blocks()
+
+        # a block is only removed from the cache once persisted, so it is not requested or added again meanwhile
+        self.assertEqual(cached, [True, True])
+        self.assertEqual(self.syncmgr.block_cache, [])
+        self.assertEqual(self.syncmgr.raw_block_cache, [])
@@ -1,5 +1,6 @@
 import sys
 from neo.Settings import settings
+from neo.Storage.Common.Migration import migrateDatabaseAt
 from prompt_toolkit import prompt
 import requests
 from tqdm import tqdm
@@ -91,6 +92,11 @@ def do_bootstrap(download_location, bootstrap_name, destination_dir, tmp_file_na
         print("closing archive")
         tar.close()
 
+        # bootstrap files may still use the hex encoded database schema
+        if not bootstrap_name.endswith('_notif') and os.path.exists(os.path.join(destination_dir, 'CURRENT')):
+            print("Migrating %s to the current database schema, this may take a while" % destination_dir)
+            migrateDatabaseAt(destination_dir)
+
         success = True
 
     except Exception as e:
@@ -250,6 +250,11 @@ class CommandShowState(CommandBase):
         out += "Time elapsed %s mins\n" % mins
         out += "Blocks per min %s \n" % bpm
         out += "TPS: %s \n" % tps
+
+        state_cache = getattr(Blockchain.Default()._db, 'stateCache', None)
+        if state_cache is not None:
+            stats = state_cache.Stats()
+            out += "State cache: %s items, %s hits, %s misses (hit rate %.2f)\n" % (stats['size'], stats['hits'], stats['misses'], stats['hit_rate'])
         print(out)
         return out
 
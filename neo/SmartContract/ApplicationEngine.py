@@ -36,6 +36,19 @@ HASH_SYSTEM_STORAGE_PUTEX = interop_hash("System.Storage.PutEx")
 HASH_NEO_STORAGE_PUT = interop_hash("Neo.Storage.Put")
 HASH_ANT_STORAGE_PUT = interop_hash("AntShares.Storage.Put")
 
+# static execution prices indexed by (integer) opcode, SYSCALL and CHECKMULTISIG are priced per instruction
+_OpCodePrices = [1] * 256
+for op_num in range(0, NOP[0] + 1):
+    _OpCodePrices[op_num] = 0
+_OpCodePrices[APPCALL[0]] = 10
+_OpCodePrices[TAILCALL[0]] = 10
+_OpCodePrices[SHA1[0]] = 10
+_OpCodePrices[SHA256[0]] = 10
+_OpCodePrices[HASH160[0]] = 20
+_OpCodePrices[HASH256[0]] = 20
+_OpCodePrices[CHECKSIG[0]] = 100
+_OpCodePrices[VERIFY[0]] = 100
+
 
 class ApplicationEngine(ExecutionEngine):
     ratio = 100000
@@ -62,7 +75,7 @@ class ApplicationEngine(ExecutionEngine):
         cx = self.CurrentContext
         opcode = cx.CurrentInstruction.OpCode
 
-        if opcode in [OpCode.APPCALL, OpCode.TAILCALL]:
+        if opcode in [OpCode.APPCALL[0], OpCode.TAILCALL[0]]:
             script_hash = cx.CurrentInstruction.Operand
 
             for b in script_hash:
@@ -77,7 +90,7 @@ class ApplicationEngine(ExecutionEngine):
 
             # if current contract state cant do dynamic calls, return False
             return current_contract_state.HasDynamicInvoke
-        elif opcode in [OpCode.CALL_ED, OpCode.CALL_EDT]:
+        elif opcode in [OpCode.CALL_ED[0], OpCode.CALL_EDT[0]]:
             current = UInt160(data=cx.ScriptHash())
             current_contract_state = self.snapshot.Contracts[current.ToBytes()]
             return current_contract_state.HasDynamicInvoke
@@ -102,42 +115,42 @@ class ApplicationEngine(ExecutionEngine):
         return True
 
     def GetPrice(self):
+        instruction = self.CurrentContext.CurrentInstruction
+        price = instruction.Price
+        if price is None:
+            price = self._ResolvePrice(instruction)
+
+        if price.__class__ is int:
+            return price
 
-        opcode = self.CurrentContext.CurrentInstruction.OpCode
-        if opcode <= NOP:
-            return 0
-
-        elif opcode in [APPCALL, TAILCALL]:
-            return 10
-        elif opcode == SYSCALL:
-            return self.GetPriceForSysCall()
-        elif opcode in [SHA1, SHA256]:
-            return 10
-        elif opcode in [HASH160, HASH256]:
-            return 20
-        elif opcode in [CHECKSIG, VERIFY]:
-            return 100
-        elif opcode == CHECKMULTISIG:
-            if self.CurrentContext.EvaluationStack.Count == 0:
-                return 1
-
-            item = self.CurrentContext.EvaluationStack.Peek()
-            if isinstance(item, Array):
-                n = item.Count
-            else:
-                n = item.GetBigInteger()
-
-            if n < 1:
-                return 1
-
-            return 100 * n
+        # the price depends on the evaluation stack and has to be computed on every execution
+        return price(self)
 
+    def _ResolvePrice(self, instruction):
+        """
+        Resolve the price of an instruction and cache it on the (shared) instruction.
+
+        Returns:
+            int: for instructions with a static price.
+            function: accepting the engine, for instructions with a price depending on the evaluation stack.
+        """
+        opcode = instruction.OpCode
+        if opcode == SYSCALL[0]:
+            price = self._ResolvePriceForSysCall(instruction)
+        elif opcode == CHECKMULTISIG[0]:
+            price = ApplicationEngine._GetPriceForCheckMultiSig
         else:
-            return 1
+            price = _OpCodePrices[opcode]
 
-    def GetPriceForSysCall(self):
-        instruction = self.CurrentContext.CurrentInstruction
-        api_hash = instruction.TokenU32 if len(instruction.Operand) == 4 else interop_hash(instruction.TokenString)
+        instruction.Price = price
+        return price
+
+    def _ResolvePriceForSysCall(self, instruction):
+        if len(instruction.Operand) != 4:
+            # interop names must be ascii, this raises for anything else
+            instruction.TokenString
+
+        api_hash = instruction.InteropId
 
         price = self._Service.GetPrice(api_hash)
 
@@ -148,29 +161,59 @@ class ApplicationEngine(ExecutionEngine):
             return int(5000 * 100000000 / self.ratio)
 
         if api_hash == HASH_ANT_ASSET_RENEW or api_hash == HASH_ANT_ASSET_RENEW:
-            return int(self.CurrentContext.EvaluationStack.Peek(1).GetBigInteger() * 5000 * 100000000 / self.ratio)
+            return ApplicationEngine._GetPriceForAssetRenew
 
         if api_hash == HASH_NEO_CONTRACT_CREATE or api_hash == HASH_NEO_CONTRACT_MIGRATE or api_hash == HASH_ANT_CONTRACT_CREATE or api_hash == HASH_ANT_CONTRACT_MIGRATE:
-            fee = int(100 * 100000000 / self.ratio)  # 100 gas for contract with no storage no dynamic invoke
+            return ApplicationEngine._GetPriceForContractCreate
+
+        if api_hash == HASH_SYSTEM_STORAGE_PUT or api_hash == HASH_SYSTEM_STORAGE_PUTEX or api_hash == HASH_NEO_STORAGE_PUT or api_hash == HASH_ANT_STORAGE_PUT:
+            return ApplicationEngine._GetPriceForStoragePut
 
-            contract_properties = self.CurrentContext.EvaluationStack.Peek(3).GetBigInteger()
-            if contract_properties < 0 or contract_properties > 0xff:
-                raise ValueError("Invalid contract properties")
+        return 1
 
-            if contract_properties & ContractPropertyState.HasStorage > 0:
-                fee += int(400 * 100000000 / self.ratio)  # if contract has storage, we add 400 gas
+    def GetPriceForSysCall(self):
+        price = self._ResolvePriceForSysCall(self.CurrentContext.CurrentInstruction)
+        if price.__class__ is int:
+            return price
+        return price(self)
 
-            if contract_properties & ContractPropertyState.HasDynamicInvoke > 0:
-                fee += int(500 * 100000000 / self.ratio)  # if it has dynamic invoke, add extra 500 gas
+    def _GetPriceForCheckMultiSig(self):
+        if self.CurrentContext.EvaluationStack.Count == 0:
+            return 1
 
-            return fee
+        item = self.CurrentContext.EvaluationStack.Peek()
+        if isinstance(item, Array):
+            n = item.Count
+        else:
+            n = item.GetBigInteger()
 
-        if api_hash == HASH_SYSTEM_STORAGE_PUT or api_hash == HASH_SYSTEM_STORAGE_PUTEX or api_hash == HASH_NEO_STORAGE_PUT or api_hash == HASH_ANT_STORAGE_PUT:
-            l1 = len(self.CurrentContext.EvaluationStack.Peek(1).GetByteArray())
-            l2 = len(self.CurrentContext.EvaluationStack.Peek(2).GetByteArray())
-            return (int((l1 + l2 - 1) / 1024) + 1) * 1000
+        if n < 1:
+            return 1
 
-        return 1
+        return 100 * n
+
+    def _GetPriceForAssetRenew(self):
+        return int(self.CurrentContext.EvaluationStack.Peek(1).GetBigInteger() * 5000 * 100000000 / self.ratio)
+
+    def _GetPriceForContractCreate(self):
+        fee = int(100 * 100000000 / self.ratio)  # 100 gas for contract with no storage no dynamic invoke
+
+        contract_properties = self.CurrentContext.EvaluationStack.Peek(3).GetBigInteger()
+        if contract_properties < 0 or contract_properties > 0xff:
+            raise ValueError("Invalid contract properties")
+
+        if contract_properties & ContractPropertyState.HasStorage > 0:
+            fee += int(400 * 100000000 / self.ratio)  # if contract has storage, we add 400 gas
+
+        if contract_properties & ContractPropertyState.HasDynamicInvoke > 0:
+            fee += int(500 * 100000000 / self.ratio)  # if it has dynamic invoke, add extra 500 gas
+
+        return fee
+
+    def _GetPriceForStoragePut(self):
+        l1 = len(self.CurrentContext.EvaluationStack.Peek(1).GetByteArray())
+        l2 = len(self.CurrentContext.EvaluationStack.Peek(2).GetByteArray())
+        return (int((l1 + l2 - 1) / 1024) + 1) * 1000
 
     @staticmethod
     def Run(snapshot, script, container=None, exit_on_error=False, gas=Fixed8.Zero(), test_mode=True, wb=None):
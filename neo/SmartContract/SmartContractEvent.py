@@ -28,7 +28,8 @@ class SmartContractEvent(SerializableMixin):
     - test_mode (bool)
 
     `event_payload` is always a list of object, depending on what data types you sent
-    in the smart contract.
+    in the smart contract. It can also be passed as a function returning the payload,
+    which is then only called when the payload is read.
     """
     RUNTIME_NOTIFY = "SmartContract.Runtime.Notify"  # payload: object[]
     RUNTIME_LOG = "SmartContract.Runtime.Log"  # payload: bytes
@@ -54,11 +55,17 @@ class SmartContractEvent(SerializableMixin):
 
     def __init__(self, event_type, event_payload, contract_hash, block_number, tx_hash, execution_success=False, test_mode=False):
 
-        if event_payload and not isinstance(event_payload, ContractParameter):
+        self._event_payload = None
+        self._event_payload_factory = None
+
+        if callable(event_payload):
+            self._event_payload_factory = event_payload
+        elif event_payload and not isinstance(event_payload, ContractParameter):
             raise Exception("Event payload must be ContractParameter")
+        else:
+            self._event_payload = event_payload
 
         self.event_type = event_type
-        self.event_payload = event_payload
         self.contract_hash = contract_hash
         self.block_number = block_number
         self.tx_hash = tx_hash
@@ -67,13 +74,26 @@ class SmartContractEvent(SerializableMixin):
         self.token = None
         self.contract = None
 
-        if not self.event_payload:
-            self.event_payload = ContractParameter(ContractParameterType.Array, value=[])
-
         if self.event_type in [SmartContractEvent.CONTRACT_CREATED, SmartContractEvent.CONTRACT_MIGRATED]:
             if self.event_payload.Type == ContractParameterType.InteropInterface:
                 self.contract = self.event_payload.Value
 
+    @property
+    def event_payload(self):
+        if self._event_payload_factory is not None:
+            self._event_payload = self._event_payload_factory()
+            self._event_payload_factory = None
+
+        if not self._event_payload:
+            self._event_payload = ContractParameter(ContractParameterType.Array, value=[])
+
+        return self._event_payload
+
+    @event_payload.setter
+    def event_payload(self, value):
+        self._event_payload = value
+        self._event_payload_factory = None
+
     def Serialize(self, writer):
         writer.WriteVarString(self.event_type.encode('utf-8'))
         writer.WriteUInt160(self.contract_hash)
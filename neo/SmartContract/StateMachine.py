@@ -45,159 +45,161 @@ class StateMachine(StateReader):
         super(StateMachine, self).__init__(trigger, snapshot)
         self._contracts_created = {}
 
-        self.RegisterWithPrice("Neo.Runtime.GetTrigger", self.Runtime_GetTrigger, 1)
-        self.RegisterWithPrice("Neo.Runtime.CheckWitness", self.Runtime_CheckWitness, 200)
-        self.RegisterWithPrice("Neo.Runtime.Notify", self.Runtime_Notify, 1)
-        self.RegisterWithPrice("Neo.Runtime.Log", self.Runtime_Log, 1)
-        self.RegisterWithPrice("Neo.Runtime.GetTime", self.Runtime_GetCurrentTime, 1)
-        self.RegisterWithPrice("Neo.Runtime.Serialize", self.Runtime_Serialize, 1)
-        self.RegisterWithPrice("Neo.Runtime.Deserialize", self.Runtime_Deserialize, 1)
-
-        self.RegisterWithPrice("Neo.Blockchain.GetHeight", self.Blockchain_GetHeight, 1)
-        self.RegisterWithPrice("Neo.Blockchain.GetHeader", self.Blockchain_GetHeader, 100)
-        self.RegisterWithPrice("Neo.Blockchain.GetBlock", self.Blockchain_GetBlock, 200)
-        self.RegisterWithPrice("Neo.Blockchain.GetTransaction", self.Blockchain_GetTransaction, 100)
-        self.RegisterWithPrice("Neo.Blockchain.GetTransactionHeight", self.Blockchain_GetTransactionHeight, 100)
-        self.RegisterWithPrice("Neo.Blockchain.GetAccount", self.Blockchain_GetAccount, 100)
-        self.RegisterWithPrice("Neo.Blockchain.GetValidators", self.Blockchain_GetValidators, 100)
-        self.RegisterWithPrice("Neo.Blockchain.GetAsset", self.Blockchain_GetAsset, 100)
-        self.RegisterWithPrice("Neo.Blockchain.GetContract", self.Blockchain_GetContract, 100)
-
-        self.RegisterWithPrice("Neo.Header.GetHash", self.Header_GetHash, 1)
-        self.RegisterWithPrice("Neo.Header.GetVersion", self.Header_GetVersion, 1)
-        self.RegisterWithPrice("Neo.Header.GetPrevHash", self.Header_GetPrevHash, 1)
-        self.RegisterWithPrice("Neo.Header.GetMerkleRoot", self.Header_GetMerkleRoot, 1)
-        self.RegisterWithPrice("Neo.Header.GetTimestamp", self.Header_GetTimestamp, 1)
-        self.RegisterWithPrice("Neo.Header.GetIndex", self.Header_GetIndex, 1)
-        self.RegisterWithPrice("Neo.Header.GetConsensusData", self.Header_GetConsensusData, 1)
-        self.RegisterWithPrice("Neo.Header.GetNextConsensus", self.Header_GetNextConsensus, 1)
-
-        self.RegisterWithPrice("Neo.Block.GetTransactionCount", self.Block_GetTransactionCount, 1)
-        self.RegisterWithPrice("Neo.Block.GetTransactions", self.Block_GetTransactions, 1)
-        self.RegisterWithPrice("Neo.Block.GetTransaction", self.Block_GetTransaction, 1)
-
-        self.RegisterWithPrice("Neo.Transaction.GetHash", self.Transaction_GetHash, 1)
-        self.RegisterWithPrice("Neo.Transaction.GetType", self.Transaction_GetType, 1)
-        self.RegisterWithPrice("Neo.Transaction.GetAttributes", self.Transaction_GetAttributes, 1)
-        self.RegisterWithPrice("Neo.Transaction.GetInputs", self.Transaction_GetInputs, 1)
-        self.RegisterWithPrice("Neo.Transaction.GetOutputs", self.Transaction_GetOutputs, 1)
-        self.RegisterWithPrice("Neo.Transaction.GetReferences", self.Transaction_GetReferences, 200)
-        self.RegisterWithPrice("Neo.Transaction.GetUnspentCoins", self.Transaction_GetUnspentCoins, 200)
-        self.RegisterWithPrice("Neo.Transaction.GetWitnesses", self.Transaction_GetWitnesses, 200)
-
-        self.RegisterWithPrice("Neo.InvocationTransaction.GetScript", self.InvocationTransaction_GetScript, 1)
-        self.RegisterWithPrice("Neo.Witness.GetVerificationScript", self.Witness_GetVerificationScript, 100)
-        self.RegisterWithPrice("Neo.Attribute.GetUsage", self.Attribute_GetUsage, 1)
-        self.RegisterWithPrice("Neo.Attribute.GetData", self.Attribute_GetData, 1)
-
-        self.RegisterWithPrice("Neo.Input.GetHash", self.Input_GetHash, 1)
-        self.RegisterWithPrice("Neo.Input.GetIndex", self.Input_GetIndex, 1)
-        self.RegisterWithPrice("Neo.Output.GetAssetId", self.Output_GetAssetId, 1)
-        self.RegisterWithPrice("Neo.Output.GetValue", self.Output_GetValue, 1)
-        self.RegisterWithPrice("Neo.Output.GetScriptHash", self.Output_GetScriptHash, 1)
-
-        self.RegisterWithPrice("Neo.Account.GetScriptHash", self.Account_GetScriptHash, 1)
-        self.RegisterWithPrice("Neo.Account.GetVotes", self.Account_GetVotes, 1)
-        self.RegisterWithPrice("Neo.Account.GetBalance", self.Account_GetBalance, 1)
-        self.RegisterWithPrice("Neo.Account.IsStandard", self.Account_IsStandard, 100)
-
-        self.Register("Neo.Asset.Create", self.Asset_Create)
-        self.Register("Neo.Asset.Renew", self.Asset_Renew)
-        self.RegisterWithPrice("Neo.Asset.GetAssetId", self.Asset_GetAssetId, 1)
-        self.RegisterWithPrice("Neo.Asset.GetAssetType", self.Asset_GetAssetType, 1)
-        self.RegisterWithPrice("Neo.Asset.GetAmount", self.Asset_GetAmount, 1)
-        self.RegisterWithPrice("Neo.Asset.GetAvailable", self.Asset_GetAvailable, 1)
-        self.RegisterWithPrice("Neo.Asset.GetPrecision", self.Asset_GetPrecision, 1)
-        self.RegisterWithPrice("Neo.Asset.GetOwner", self.Asset_GetOwner, 1)
-        self.RegisterWithPrice("Neo.Asset.GetAdmin", self.Asset_GetAdmin, 1)
-        self.RegisterWithPrice("Neo.Asset.GetIssuer", self.Asset_GetIssuer, 1)
-
-        self.Register("Neo.Contract.Create", self.Contract_Create)
-        self.Register("Neo.Contract.Migrate", self.Contract_Migrate)
-        self.RegisterWithPrice("Neo.Contract.Destroy", self.Contract_Destroy, 1)
-        self.RegisterWithPrice("Neo.Contract.GetScript", self.Contract_GetScript, 1)
-        self.RegisterWithPrice("Neo.Contract.IsPayable", self.Contract_IsPayable, 1)
-        self.RegisterWithPrice("Neo.Contract.GetStorageContext", self.Contract_GetStorageContext, 1)
-
-        self.RegisterWithPrice("Neo.Storage.GetContext", self.Storage_GetContext, 1)
-        self.RegisterWithPrice("Neo.Storage.GetReadOnlyContext", self.Storage_GetReadOnlyContext, 1)
-        self.RegisterWithPrice("Neo.Storage.Get", self.Storage_Get, 100)
-        self.Register("Neo.Storage.Put", self.Storage_Put)
-        self.RegisterWithPrice("Neo.Storage.Delete", self.Storage_Delete, 100)
-        self.RegisterWithPrice("Neo.Storage.Find", self.Storage_Find, 1)
-        self.RegisterWithPrice("Neo.StorageContext.AsReadOnly", self.StorageContext_AsReadOnly, 1)
-
-        self.RegisterWithPrice("Neo.Enumerator.Create", self.Enumerator_Create, 1)
-        self.RegisterWithPrice("Neo.Enumerator.Next", self.Enumerator_Next, 1)
-        self.RegisterWithPrice("Neo.Enumerator.Value", self.Enumerator_Value, 1)
-        self.RegisterWithPrice("Neo.Enumerator.Concat", self.Enumerator_Concat, 1)
-        self.RegisterWithPrice("Neo.Iterator.Create", self.Iterator_Create, 1)
-        self.RegisterWithPrice("Neo.Iterator.Key", self.Iterator_Key, 1)
-        self.RegisterWithPrice("Neo.Iterator.Keys", self.Iterator_Keys, 1)
-        self.RegisterWithPrice("Neo.Iterator.Values", self.Iterator_Values, 1)
-        self.RegisterWithPrice("Neo.Iterator.Concat", self.Iterator_Concat, 1)
+    @classmethod
+    def _RegisterInterops(cls):
+        cls.RegisterWithPrice("Neo.Runtime.GetTrigger", cls.Runtime_GetTrigger, 1)
+        cls.RegisterWithPrice("Neo.Runtime.CheckWitness", cls.Runtime_CheckWitness, 200)
+        cls.RegisterWithPrice("Neo.Runtime.Notify", cls.Runtime_Notify, 1)
+        cls.RegisterWithPrice("Neo.Runtime.Log", cls.Runtime_Log, 1)
+        cls.RegisterWithPrice("Neo.Runtime.GetTime", cls.Runtime_GetCurrentTime, 1)
+        cls.RegisterWithPrice("Neo.Runtime.Serialize", cls.Runtime_Serialize, 1)
+        cls.RegisterWithPrice("Neo.Runtime.Deserialize", cls.Runtime_Deserialize, 1)
+
+        cls.RegisterWithPrice("Neo.Blockchain.GetHeight", cls.Blockchain_GetHeight, 1)
+        cls.RegisterWithPrice("Neo.Blockchain.GetHeader", cls.Blockchain_GetHeader, 100)
+        cls.RegisterWithPrice("Neo.Blockchain.GetBlock", cls.Blockchain_GetBlock, 200)
+        cls.RegisterWithPrice("Neo.Blockchain.GetTransaction", cls.Blockchain_GetTransaction, 100)
+        cls.RegisterWithPrice("Neo.Blockchain.GetTransactionHeight", cls.Blockchain_GetTransactionHeight, 100)
+        cls.RegisterWithPrice("Neo.Blockchain.GetAccount", cls.Blockchain_GetAccount, 100)
+        cls.RegisterWithPrice("Neo.Blockchain.GetValidators", cls.Blockchain_GetValidators, 100)
+        cls.RegisterWithPrice("Neo.Blockchain.GetAsset", cls.Blockchain_GetAsset, 100)
+        cls.RegisterWithPrice("Neo.Blockchain.GetContract", cls.Blockchain_GetContract, 100)
+
+        cls.RegisterWithPrice("Neo.Header.GetHash", cls.Header_GetHash, 1)
+        cls.RegisterWithPrice("Neo.Header.GetVersion", cls.Header_GetVersion, 1)
+        cls.RegisterWithPrice("Neo.Header.GetPrevHash", cls.Header_GetPrevHash, 1)
+        cls.RegisterWithPrice("Neo.Header.GetMerkleRoot", cls.Header_GetMerkleRoot, 1)
+        cls.RegisterWithPrice("Neo.Header.GetTimestamp", cls.Header_GetTimestamp, 1)
+        cls.RegisterWithPrice("Neo.Header.GetIndex", cls.Header_GetIndex, 1)
+        cls.RegisterWithPrice("Neo.Header.GetConsensusData", cls.Header_GetConsensusData, 1)
+        cls.RegisterWithPrice("Neo.Header.GetNextConsensus", cls.Header_GetNextConsensus, 1)
+
+        cls.RegisterWithPrice("Neo.Block.GetTransactionCount", cls.Block_GetTransactionCount, 1)
+        cls.RegisterWithPrice("Neo.Block.GetTransactions", cls.Block_GetTransactions, 1)
+        cls.RegisterWithPrice("Neo.Block.GetTransaction", cls.Block_GetTransaction, 1)
+
+        cls.RegisterWithPrice("Neo.Transaction.GetHash", cls.Transaction_GetHash, 1)
+        cls.RegisterWithPrice("Neo.Transaction.GetType", cls.Transaction_GetType, 1)
+        cls.RegisterWithPrice("Neo.Transaction.GetAttributes", cls.Transaction_GetAttributes, 1)
+        cls.RegisterWithPrice("Neo.Transaction.GetInputs", cls.Transaction_GetInputs, 1)
+        cls.RegisterWithPrice("Neo.Transaction.GetOutputs", cls.Transaction_GetOutputs, 1)
+        cls.RegisterWithPrice("Neo.Transaction.GetReferences", cls.Transaction_GetReferences, 200)
+        cls.RegisterWithPrice("Neo.Transaction.GetUnspentCoins", cls.Transaction_GetUnspentCoins, 200)
+        cls.RegisterWithPrice("Neo.Transaction.GetWitnesses", cls.Transaction_GetWitnesses, 200)
+
+        cls.RegisterWithPrice("Neo.InvocationTransaction.GetScript", cls.InvocationTransaction_GetScript, 1)
+        cls.RegisterWithPrice("Neo.Witness.GetVerificationScript", cls.Witness_GetVerificationScript, 100)
+        cls.RegisterWithPrice("Neo.Attribute.GetUsage", cls.Attribute_GetUsage, 1)
+        cls.RegisterWithPrice("Neo.Attribute.GetData", cls.Attribute_GetData, 1)
+
+        cls.RegisterWithPrice("Neo.Input.GetHash", cls.Input_GetHash, 1)
+        cls.RegisterWithPrice("Neo.Input.GetIndex", cls.Input_GetIndex, 1)
+        cls.RegisterWithPrice("Neo.Output.GetAssetId", cls.Output_GetAssetId, 1)
+        cls.RegisterWithPrice("Neo.Output.GetValue", cls.Output_GetValue, 1)
+        cls.RegisterWithPrice("Neo.Output.GetScriptHash", cls.Output_GetScriptHash, 1)
+
+        cls.RegisterWithPrice("Neo.Account.GetScriptHash", cls.Account_GetScriptHash, 1)
+        cls.RegisterWithPrice("Neo.Account.GetVotes", cls.Account_GetVotes, 1)
+        cls.RegisterWithPrice("Neo.Account.GetBalance", cls.Account_GetBalance, 1)
+        cls.RegisterWithPrice("Neo.Account.IsStandard", cls.Account_IsStandard, 100)
+
+        cls.Register("Neo.Asset.Create", cls.Asset_Create)
+        cls.Register("Neo.Asset.Renew", cls.Asset_Renew)
+        cls.RegisterWithPrice("Neo.Asset.GetAssetId", cls.Asset_GetAssetId, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetAssetType", cls.Asset_GetAssetType, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetAmount", cls.Asset_GetAmount, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetAvailable", cls.Asset_GetAvailable, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetPrecision", cls.Asset_GetPrecision, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetOwner", cls.Asset_GetOwner, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetAdmin", cls.Asset_GetAdmin, 1)
+        cls.RegisterWithPrice("Neo.Asset.GetIssuer", cls.Asset_GetIssuer, 1)
+
+        cls.Register("Neo.Contract.Create", cls.Contract_Create)
+        cls.Register("Neo.Contract.Migrate", cls.Contract_Migrate)
+        cls.RegisterWithPrice("Neo.Contract.Destroy", cls.Contract_Destroy, 1)
+        cls.RegisterWithPrice("Neo.Contract.GetScript", cls.Contract_GetScript, 1)
+        cls.RegisterWithPrice("Neo.Contract.IsPayable", cls.Contract_IsPayable, 1)
+        cls.RegisterWithPrice("Neo.Contract.GetStorageContext", cls.Contract_GetStorageContext, 1)
+
+        cls.RegisterWithPrice("Neo.Storage.GetContext", cls.Storage_GetContext, 1)
+        cls.RegisterWithPrice("Neo.Storage.GetReadOnlyContext", cls.Storage_GetReadOnlyContext, 1)
+        cls.RegisterWithPrice("Neo.Storage.Get", cls.Storage_Get, 100)
+        cls.Register("Neo.Storage.Put", cls.Storage_Put)
+        cls.RegisterWithPrice("Neo.Storage.Delete", cls.Storage_Delete, 100)
+        cls.RegisterWithPrice("Neo.Storage.Find", cls.Storage_Find, 1)
+        cls.RegisterWithPrice("Neo.StorageContext.AsReadOnly", cls.StorageContext_AsReadOnly, 1)
+
+        cls.RegisterWithPrice("Neo.Enumerator.Create", cls.Enumerator_Create, 1)
+        cls.RegisterWithPrice("Neo.Enumerator.Next", cls.Enumerator_Next, 1)
+        cls.RegisterWithPrice("Neo.Enumerator.Value", cls.Enumerator_Value, 1)
+        cls.RegisterWithPrice("Neo.Enumerator.Concat", cls.Enumerator_Concat, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Create", cls.Iterator_Create, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Key", cls.Iterator_Key, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Keys", cls.Iterator_Keys, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Values", cls.Iterator_Values, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Concat", cls.Iterator_Concat, 1)
 
         # Aliases
-        self.RegisterWithPrice("Neo.Iterator.Next", self.Enumerator_Next, 1)
-        self.RegisterWithPrice("Neo.Iterator.Value", self.Enumerator_Value, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Next", cls.Enumerator_Next, 1)
+        cls.RegisterWithPrice("Neo.Iterator.Value", cls.Enumerator_Value, 1)
 
         # Old APIs
-        self.RegisterWithPrice("AntShares.Runtime.CheckWitness", self.Runtime_CheckWitness, 200)
-        self.RegisterWithPrice("AntShares.Runtime.Notify", self.Runtime_Notify, 1)
-        self.RegisterWithPrice("AntShares.Runtime.Log", self.Runtime_Log, 1)
-        self.RegisterWithPrice("AntShares.Blockchain.GetHeight", self.Blockchain_GetHeight, 1)
-        self.RegisterWithPrice("AntShares.Blockchain.GetHeader", self.Blockchain_GetHeader, 100)
-        self.RegisterWithPrice("AntShares.Blockchain.GetBlock", self.Blockchain_GetBlock, 200)
-        self.RegisterWithPrice("AntShares.Blockchain.GetTransaction", self.Blockchain_GetTransaction, 100)
-        self.RegisterWithPrice("AntShares.Blockchain.GetAccount", self.Blockchain_GetAccount, 100)
-        self.RegisterWithPrice("AntShares.Blockchain.GetValidators", self.Blockchain_GetValidators, 200)
-        self.RegisterWithPrice("AntShares.Blockchain.GetAsset", self.Blockchain_GetAsset, 100)
-        self.RegisterWithPrice("AntShares.Blockchain.GetContract", self.Blockchain_GetContract, 100)
-        self.RegisterWithPrice("AntShares.Header.GetHash", self.Header_GetHash, 1)
-        self.RegisterWithPrice("AntShares.Header.GetVersion", self.Header_GetVersion, 1)
-        self.RegisterWithPrice("AntShares.Header.GetPrevHash", self.Header_GetPrevHash, 1)
-        self.RegisterWithPrice("AntShares.Header.GetMerkleRoot", self.Header_GetMerkleRoot, 1)
-        self.RegisterWithPrice("AntShares.Header.GetTimestamp", self.Header_GetTimestamp, 1)
-        self.RegisterWithPrice("AntShares.Header.GetConsensusData", self.Header_GetConsensusData, 1)
-        self.RegisterWithPrice("AntShares.Header.GetNextConsensus", self.Header_GetNextConsensus, 1)
-        self.RegisterWithPrice("AntShares.Block.GetTransactionCount", self.Block_GetTransactionCount, 1)
-        self.RegisterWithPrice("AntShares.Block.GetTransactions", self.Block_GetTransactions, 1)
-        self.RegisterWithPrice("AntShares.Block.GetTransaction", self.Block_GetTransaction, 1)
-        self.RegisterWithPrice("AntShares.Transaction.GetHash", self.Transaction_GetHash, 1)
-        self.RegisterWithPrice("AntShares.Transaction.GetType", self.Transaction_GetType, 1)
-        self.RegisterWithPrice("AntShares.Transaction.GetAttributes", self.Transaction_GetAttributes, 1)
-        self.RegisterWithPrice("AntShares.Transaction.GetInputs", self.Transaction_GetInputs, 1)
-        self.RegisterWithPrice("AntShares.Transaction.GetOutpus", self.Transaction_GetOutputs, 1)
-        self.RegisterWithPrice("AntShares.Transaction.GetReferences", self.Transaction_GetReferences, 200)
-        self.RegisterWithPrice("AntShares.Attribute.GetData", self.Attribute_GetData, 1)
-        self.RegisterWithPrice("AntShares.Attribute.GetUsage", self.Attribute_GetUsage, 1)
-        self.RegisterWithPrice("AntShares.Input.GetHash", self.Input_GetHash, 1)
-        self.RegisterWithPrice("AntShares.Input.GetIndex", self.Input_GetIndex, 1)
-        self.RegisterWithPrice("AntShares.Output.GetAssetId", self.Output_GetAssetId, 1)
-        self.RegisterWithPrice("AntShares.Output.GetValue", self.Output_GetValue, 1)
-        self.RegisterWithPrice("AntShares.Output.GetScriptHash", self.Output_GetScriptHash, 1)
-        self.RegisterWithPrice("AntShares.Account.GetVotes", self.Account_GetVotes, 1)
-        self.RegisterWithPrice("AntShares.Account.GetBalance", self.Account_GetBalance, 1)
-        self.RegisterWithPrice("AntShares.Account.GetScriptHash", self.Account_GetScriptHash, 1)
-        self.Register("AntShares.Asset.Create", self.Asset_Create)
-        self.Register("AntShares.Asset.Renew", self.Asset_Renew)
-        self.RegisterWithPrice("AntShares.Asset.GetAssetId", self.Asset_GetAssetId, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetAssetType", self.Asset_GetAssetType, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetAmount", self.Asset_GetAmount, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetAvailable", self.Asset_GetAvailable, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetPrecision", self.Asset_GetPrecision, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetOwner", self.Asset_GetOwner, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetAdmin", self.Asset_GetAdmin, 1)
-        self.RegisterWithPrice("AntShares.Asset.GetIssuer", self.Asset_GetIssuer, 1)
-        self.Register("AntShares.Contract.Create", self.Contract_Create)
-        self.Register("AntShares.Contract.Migrate", self.Contract_Migrate)
-        self.RegisterWithPrice("AntShares.Contract.Destroy", self.Contract_Destroy, 1)
-        self.RegisterWithPrice("AntShares.Contract.GetScript", self.Contract_GetScript, 1)
-        self.RegisterWithPrice("AntShares.Contract.GetStorageContext", self.Contract_GetStorageContext, 1)
-        self.RegisterWithPrice("AntShares.Storage.GetContext", self.Storage_GetContext, 1)
-        self.RegisterWithPrice("AntShares.Storage.Get", self.Storage_Get, 100)
-        self.Register("AntShares.Storage.Put", self.Storage_Put)
-        self.RegisterWithPrice("Neo.Storage.Delete", self.Storage_Delete, 100)
+        cls.RegisterWithPrice("AntShares.Runtime.CheckWitness", cls.Runtime_CheckWitness, 200)
+        cls.RegisterWithPrice("AntShares.Runtime.Notify", cls.Runtime_Notify, 1)
+        cls.RegisterWithPrice("AntShares.Runtime.Log", cls.Runtime_Log, 1)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetHeight", cls.Blockchain_GetHeight, 1)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetHeader", cls.Blockchain_GetHeader, 100)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetBlock", cls.Blockchain_GetBlock, 200)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetTransaction", cls.Blockchain_GetTransaction, 100)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetAccount", cls.Blockchain_GetAccount, 100)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetValidators", cls.Blockchain_GetValidators, 200)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetAsset", cls.Blockchain_GetAsset, 100)
+        cls.RegisterWithPrice("AntShares.Blockchain.GetContract", cls.Blockchain_GetContract, 100)
+        cls.RegisterWithPrice("AntShares.Header.GetHash", cls.Header_GetHash, 1)
+        cls.RegisterWithPrice("AntShares.Header.GetVersion", cls.Header_GetVersion, 1)
+        cls.RegisterWithPrice("AntShares.Header.GetPrevHash", cls.Header_GetPrevHash, 1)
+        cls.RegisterWithPrice("AntShares.Header.GetMerkleRoot", cls.Header_GetMerkleRoot, 1)
+        cls.RegisterWithPrice("AntShares.Header.GetTimestamp", cls.Header_GetTimestamp, 1)
+        cls.RegisterWithPrice("AntShares.Header.GetConsensusData", cls.Header_GetConsensusData, 1)
+        cls.RegisterWithPrice("AntShares.Header.GetNextConsensus", cls.Header_GetNextConsensus, 1)
+        cls.RegisterWithPrice("AntShares.Block.GetTransactionCount", cls.Block_GetTransactionCount, 1)
+        cls.RegisterWithPrice("AntShares.Block.GetTransactions", cls.Block_GetTransactions, 1)
+        cls.RegisterWithPrice("AntShares.Block.GetTransaction", cls.Block_GetTransaction, 1)
+        cls.RegisterWithPrice("AntShares.Transaction.GetHash", cls.Transaction_GetHash, 1)
+        cls.RegisterWithPrice("AntShares.Transaction.GetType", cls.Transaction_GetType, 1)
+        cls.RegisterWithPrice("AntShares.Transaction.GetAttributes", cls.Transaction_GetAttributes, 1)
+        cls.RegisterWithPrice("AntShares.Transaction.GetInputs", cls.Transaction_GetInputs, 1)
+        cls.RegisterWithPrice("AntShares.Transaction.GetOutpus", cls.Transaction_GetOutputs, 1)
+        cls.RegisterWithPrice("AntShares.Transaction.GetReferences", cls.Transaction_GetReferences, 200)
+        cls.RegisterWithPrice("AntShares.Attribute.GetData", cls.Attribute_GetData, 1)
+        cls.RegisterWithPrice("AntShares.Attribute.GetUsage", cls.Attribute_GetUsage, 1)
+        cls.RegisterWithPrice("AntShares.Input.GetHash", cls.Input_GetHash, 1)
+        cls.RegisterWithPrice("AntShares.Input.GetIndex", cls.Input_GetIndex, 1)
+        cls.RegisterWithPrice("AntShares.Output.GetAssetId", cls.Output_GetAssetId, 1)
+        cls.RegisterWithPrice("AntShares.Output.GetValue", cls.Output_GetValue, 1)
+        cls.RegisterWithPrice("AntShares.Output.GetScriptHash", cls.Output_GetScriptHash, 1)
+        cls.RegisterWithPrice("AntShares.Account.GetVotes", cls.Account_GetVotes, 1)
+        cls.RegisterWithPrice("AntShares.Account.GetBalance", cls.Account_GetBalance, 1)
+        cls.RegisterWithPrice("AntShares.Account.GetScriptHash", cls.Account_GetScriptHash, 1)
+        cls.Register("AntShares.Asset.Create", cls.Asset_Create)
+        cls.Register("AntShares.Asset.Renew", cls.Asset_Renew)
+        cls.RegisterWithPrice("AntShares.Asset.GetAssetId", cls.Asset_GetAssetId, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetAssetType", cls.Asset_GetAssetType, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetAmount", cls.Asset_GetAmount, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetAvailable", cls.Asset_GetAvailable, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetPrecision", cls.Asset_GetPrecision, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetOwner", cls.Asset_GetOwner, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetAdmin", cls.Asset_GetAdmin, 1)
+        cls.RegisterWithPrice("AntShares.Asset.GetIssuer", cls.Asset_GetIssuer, 1)
+        cls.Register("AntShares.Contract.Create", cls.Contract_Create)
+        cls.Register("AntShares.Contract.Migrate", cls.Contract_Migrate)
+        cls.RegisterWithPrice("AntShares.Contract.Destroy", cls.Contract_Destroy, 1)
+        cls.RegisterWithPrice("AntShares.Contract.GetScript", cls.Contract_GetScript, 1)
+        cls.RegisterWithPrice("AntShares.Contract.GetStorageContext", cls.Contract_GetStorageContext, 1)
+        cls.RegisterWithPrice("AntShares.Storage.GetContext", cls.Storage_GetContext, 1)
+        cls.RegisterWithPrice("AntShares.Storage.Get", cls.Storage_Get, 100)
+        cls.Register("AntShares.Storage.Put", cls.Storage_Put)
+        cls.RegisterWithPrice("Neo.Storage.Delete", cls.Storage_Delete, 100)
 
     def ExecutionCompleted(self, engine, success, error=None):
         super(StateMachine, self).ExecutionCompleted(engine, success, error)
@@ -891,3 +893,6 @@ class StateMachine(StateReader):
         result = ConcatenatedIterator(item1, item2)
         engine.CurrentContext.EvaluationStack.PushT(StackItem.FromInterface(result))
         return True
+
+
+StateMachine._RegisterInterops()
@@ -13,28 +13,27 @@ from neo.Core.BigInteger import BigInteger
 from neo.Core.UInt160 import UInt160
 from neo.Core.UInt256 import UInt256
 from neo.SmartContract.SmartContractEvent import SmartContractEvent, NotifyEvent
+from neo.EventHub import has_smart_contract_event_listeners
 from neo.SmartContract.ContractParameter import ContractParameter, ContractParameterType
 from neo.Core.Cryptography.ECCurve import ECDSA
 from neo.VM.InteropService import StackItem, ByteArray, Array, Map
 from neo.VM.ExecutionEngine import ExecutionEngine
 from neo.Settings import settings
-from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from neo.Core.IO.BinaryWriter import BinaryWriter
 from neo.IO.MemoryStream import StreamManager
 from neo.Core.State.ContractState import ContractState
 from neo.Core.State.StorageItem import StorageItem
 from neo.logging import log_manager
-import hashlib
 
 logger = log_manager.getLogger('vm')
 
 
 class StateReader(InteropService):
 
-    def RegisterWithPrice(self, method, func, price):
-        hashed_method = int.from_bytes(hashlib.sha256(method.encode()).digest()[:4], 'little', signed=False)
-        self._dictionary[hashed_method] = func
-        self.prices.update({hashed_method: price})
+    @classmethod
+    def RegisterWithPrice(cls, method, func, price):
+        cls.Register(method, func, price)
 
     def __init__(self, trigger_type, snapshot):
 
@@ -44,45 +43,48 @@ class StateReader(InteropService):
 
         self.notifications = []
         self.events_to_dispatch = []
-        self.prices = {}
+        # event type -> whether anybody listens for the events, see `HasEventListeners`
+        self._event_listeners = {}
         self._hashes_for_verifying = None
         self._accounts = None
         self._assets = None
         self._contracts = None
         self._storages = None
 
+    @classmethod
+    def _RegisterInterops(cls):
         # TODO: move ExecutionEngine calls here as well from /neo/VM/InteropService/
 
         # Standard Library
-        self.RegisterWithPrice("System.Runtime.Platform", self.Runtime_Platform, 1)
-        self.RegisterWithPrice("System.Runtime.GetTrigger", self.Runtime_GetTrigger, 1)
-        self.RegisterWithPrice("System.Runtime.CheckWitness", self.Runtime_CheckWitness, 200)
-        self.RegisterWithPrice("System.Runtime.Notify", self.Runtime_Notify, 1)
-        self.RegisterWithPrice("System.Runtime.Log", self.Runtime_Log, 1)
-        self.RegisterWithPrice("System.Runtime.GetTime", self.Runtime_GetCurrentTime, 1)
-        self.RegisterWithPrice("System.Runtime.Serialize", self.Runtime_Serialize, 1)
-        self.RegisterWithPrice("System.Runtime.Deserialize", self.Runtime_Deserialize, 1)
-        self.RegisterWithPrice("System.Blockchain.GetHeight", self.Blockchain_GetHeight, 1)
-        self.RegisterWithPrice("System.Blockchain.GetHeader", self.Blockchain_GetHeader, 100)
-        self.RegisterWithPrice("System.Blockchain.GetBlock", self.Blockchain_GetBlock, 200)
-        self.RegisterWithPrice("System.Blockchain.GetTransaction", self.Blockchain_GetTransaction, 200)
-        self.RegisterWithPrice("System.Blockchain.GetTransactionHeight", self.Blockchain_GetTransactionHeight, 100)
-        self.RegisterWithPrice("System.Blockchain.GetContract", self.Blockchain_GetContract, 100)
-        self.RegisterWithPrice("System.Header.GetIndex", self.Header_GetIndex, 1)
-        self.RegisterWithPrice("System.Header.GetHash", self.Header_GetHash, 1)
-        self.RegisterWithPrice("System.Header.GetPrevHash", self.Header_GetPrevHash, 1)
-        self.RegisterWithPrice("System.Header.GetTimestamp", self.Header_GetTimestamp, 1)
-        self.RegisterWithPrice("System.Block.GetTransactionCount", self.Block_GetTransactionCount, 1)
-        self.RegisterWithPrice("System.Block.GetTransactions", self.Block_GetTransactions, 1)
-        self.RegisterWithPrice("System.Block.GetTransaction", self.Block_GetTransaction, 1)
-        self.RegisterWithPrice("System.Transaction.GetHash", self.Transaction_GetHash, 1)
-        self.RegisterWithPrice("System.Storage.GetContext", self.Storage_GetContext, 1)
-        self.RegisterWithPrice("System.Storage.GetReadOnlyContext", self.Storage_GetReadOnlyContext, 1)
-        self.RegisterWithPrice("System.Storage.Get", self.Storage_Get, 100)
-        self.Register("System.Storage.Put", self.Storage_Put)
-        self.Register("System.Storage.PutEx", self.Storage_PutEx)
-        self.RegisterWithPrice("System.Storage.Delete", self.Storage_Delete, 100)
-        self.RegisterWithPrice("System.StorageContext.AsReadOnly", self.StorageContext_AsReadOnly, 1)
+        cls.RegisterWithPrice("System.Runtime.Platform", cls.Runtime_Platform, 1)
+        cls.RegisterWithPrice("System.Runtime.GetTrigger", cls.Runtime_GetTrigger, 1)
+        cls.RegisterWithPrice("System.Runtime.CheckWitness", cls.Runtime_CheckWitness, 200)
+        cls.RegisterWithPrice("System.Runtime.Notify", cls.Runtime_Notify, 1)
+        cls.RegisterWithPrice("System.Runtime.Log", cls.Runtime_Log, 1)
+        cls.RegisterWithPrice("System.Runtime.GetTime", cls.Runtime_GetCurrentTime, 1)
+        cls.RegisterWithPrice("System.Runtime.Serialize", cls.Runtime_Serialize, 1)
+        cls.RegisterWithPrice("System.Runtime.Deserialize", cls.Runtime_Deserialize, 1)
+        cls.RegisterWithPrice("System.Blockchain.GetHeight", cls.Blockchain_GetHeight, 1)
+        cls.RegisterWithPrice("System.Blockchain.GetHeader", cls.Blockchain_GetHeader, 100)
+        cls.RegisterWithPrice("System.Blockchain.GetBlock", cls.Blockchain_GetBlock, 200)
+        cls.RegisterWithPrice("System.Blockchain.GetTransaction", cls.Blockchain_GetTransaction, 200)
+        cls.RegisterWithPrice("System.Blockchain.GetTransactionHeight", cls.Blockchain_GetTransactionHeight, 100)
+        cls.RegisterWithPrice("System.Blockchain.GetContract", cls.Blockchain_GetContract, 100)
+        cls.RegisterWithPrice("System.Header.GetIndex", cls.Header_GetIndex, 1)
+        cls.RegisterWithPrice("System.Header.GetHash", cls.Header_GetHash, 1)
+        cls.RegisterWithPrice("System.Header.GetPrevHash", cls.Header_GetPrevHash, 1)
+        cls.RegisterWithPrice("System.Header.GetTimestamp", cls.Header_GetTimestamp, 1)
+        cls.RegisterWithPrice("System.Block.GetTransactionCount", cls.Block_GetTransactionCount, 1)
+        cls.RegisterWithPrice("System.Block.GetTransactions", cls.Block_GetTransactions, 1)
+        cls.RegisterWithPrice("System.Block.GetTransaction", cls.Block_GetTransaction, 1)
+        cls.RegisterWithPrice("System.Transaction.GetHash", cls.Transaction_GetHash, 1)
+        cls.RegisterWithPrice("System.Storage.GetContext", cls.Storage_GetContext, 1)
+        cls.RegisterWithPrice("System.Storage.GetReadOnlyContext", cls.Storage_GetReadOnlyContext, 1)
+        cls.RegisterWithPrice("System.Storage.Get", cls.Storage_Get, 100)
+        cls.Register("System.Storage.Put", cls.Storage_Put)
+        cls.Register("System.Storage.PutEx", cls.Storage_PutEx)
+        cls.RegisterWithPrice("System.Storage.Delete", cls.Storage_Delete, 100)
+        cls.RegisterWithPrice("System.StorageContext.AsReadOnly", cls.StorageContext_AsReadOnly, 1)
 
     def CheckStorageContext(self, context):
         if context is None:
@@ -99,10 +101,37 @@ class StateReader(InteropService):
 
         return False
 
-    def GetPrice(self, hash: int):
-        return self.prices.get(hash, 0)
+    def HasEventListeners(self, event_type):
+        """
+        Check if anybody listens for smart contract events of `event_type`, otherwise they don't have to be created.
+        The subscriptions are looked up once per instance.
+
+        Args:
+            event_type (str): the event type, e.g. `SmartContractEvent.STORAGE_GET`.
+
+        Returns:
+            bool:
+        """
+        listened = self._event_listeners.get(event_type, None)
+        if listened is None:
+            listened = has_smart_contract_event_listeners(event_type)
+            self._event_listeners[event_type] = listened
+        return listened
 
     def ExecutionCompleted(self, engine, success, error=None):
+        if success:
+            event_type = SmartContractEvent.EXECUTION_SUCCESS if self.Trigger == TriggerType.Application else SmartContractEvent.VERIFICATION_SUCCESS
+            notifications = self.notifications if self.HasEventListeners(SmartContractEvent.RUNTIME_NOTIFY) else []
+        else:
+            event_type = SmartContractEvent.EXECUTION_FAIL if self.Trigger == TriggerType.Application else SmartContractEvent.VERIFICATION_FAIL
+            notifications = []
+
+        self.notifications = []
+
+        dispatch_completed = self.HasEventListeners(event_type)
+        if not dispatch_completed and not notifications:
+            return
+
         height = GetBlockchain().Height + 1
         tx_hash = None
 
@@ -124,48 +153,39 @@ class StateReader(InteropService):
         except Exception as e:
             logger.error("Could not get entry script: %s " % e)
 
-        payload = ContractParameter(ContractParameterType.Array, value=[])
-        for item in engine.ResultStack.Items:
-            payload.Value.append(ContractParameter.ToParameter(item))
-
-        if success:
+        # dispatch all notify events, along with the success of the contract execution
+        for notify_event_args in notifications:
+            self.events_to_dispatch.append(NotifyEvent(SmartContractEvent.RUNTIME_NOTIFY, notify_event_args.State,
+                                                       notify_event_args.ScriptHash, height, tx_hash,
+                                                       success, engine.testMode))
 
-            # dispatch all notify events, along with the success of the contract execution
-            for notify_event_args in self.notifications:
-                self.events_to_dispatch.append(NotifyEvent(SmartContractEvent.RUNTIME_NOTIFY, notify_event_args.State,
-                                                           notify_event_args.ScriptHash, height, tx_hash,
-                                                           success, engine.testMode))
+        if not dispatch_completed:
+            return
 
-            if self.Trigger == TriggerType.Application:
-                self.events_to_dispatch.append(SmartContractEvent(SmartContractEvent.EXECUTION_SUCCESS, payload, entry_script,
-                                                                  height, tx_hash, success, engine.testMode))
-            else:
-                self.events_to_dispatch.append(SmartContractEvent(SmartContractEvent.VERIFICATION_SUCCESS, payload, entry_script,
-                                                                  height, tx_hash, success, engine.testMode))
+        # the payload is only converted when read, but the stacks can change until then
+        items = list(engine.ResultStack.Items)
 
-        else:
+        if not success:
             # when a contract exits in a faulted state
             # we should display that in the notification
             if not error:
                 error = 'Execution exited in a faulted state. Any payload besides this message contained in this event is the contents of the EvaluationStack of the current script context.'
 
-            payload.Value.append(ContractParameter(ContractParameterType.String, error))
-
             # If we do not add the eval stack, then exceptions that are raised in a contract
             # are not displayed to the event consumer
             if engine._InvocationStack.Count > 1:
-                [payload.Value.append(ContractParameter.ToParameter(item)) for item in engine.CurrentContext.EvaluationStack.Items]
-
-            if self.Trigger == TriggerType.Application:
-                self.events_to_dispatch.append(
-                    SmartContractEvent(SmartContractEvent.EXECUTION_FAIL, payload,
-                                       entry_script, height, tx_hash, success, engine.testMode))
+                error_items = list(engine.CurrentContext.EvaluationStack.Items)
             else:
-                self.events_to_dispatch.append(
-                    SmartContractEvent(SmartContractEvent.VERIFICATION_FAIL, payload,
-                                       entry_script, height, tx_hash, success, engine.testMode))
+                error_items = []
 
-        self.notifications = []
+        def payload():
+            result = ContractParameter(ContractParameterType.Array, value=[ContractParameter.ToParameter(item) for item in items])
+            if not success:
+                result.Value.append(ContractParameter(ContractParameterType.String, error))
+                result.Value.extend(ContractParameter.ToParameter(item) for item in error_items)
+            return result
+
+        self.events_to_dispatch.append(SmartContractEvent(event_type, payload, entry_script, height, tx_hash, success, engine.testMode))
 
     def Runtime_Platform(self, engine):
         engine.CurrentContext.EvaluationStack.PushT(b'\x4e\x45\x4f')  # NEO
@@ -225,7 +245,7 @@ class StateReader(InteropService):
 
         self.notifications.append(args)
 
-        if settings.emit_notify_events_on_sc_execution_error:
+        if settings.emit_notify_events_on_sc_execution_error and self.HasEventListeners(SmartContractEvent.RUNTIME_NOTIFY):
             # emit Notify events even if the SC execution might fail.
             tx_hash = engine.ScriptContainer.Hash
             height = GetBlockchain().Height + 1
@@ -253,12 +273,13 @@ class StateReader(InteropService):
         engine.write_log(str(message))
 
         # Build and emit smart contract event
-        self.events_to_dispatch.append(SmartContractEvent(SmartContractEvent.RUNTIME_LOG,
-                                                          ContractParameter(ContractParameterType.String, value=message),
-                                                          hash,
-                                                          GetBlockchain().Height + 1,
-                                                          tx_hash,
-                                                          test_mode=engine.testMode))
+        if self.HasEventListeners(SmartContractEvent.RUNTIME_LOG):
+            self.events_to_dispatch.append(SmartContractEvent(SmartContractEvent.RUNTIME_LOG,
+                                                              ContractParameter(ContractParameterType.String, value=message),
+                                                              hash,
+                                                              GetBlockchain().Height + 1,
+                                                              tx_hash,
+                                                              test_mode=engine.testMode))
 
         return True
 
@@ -297,16 +318,13 @@ class StateReader(InteropService):
     def Runtime_Deserialize(self, engine: ExecutionEngine):
         data = engine.CurrentContext.EvaluationStack.Pop().GetByteArray()
 
-        ms = StreamManager.GetStream(data=data)
-        reader = BinaryReader(ms)
+        reader = BufferReader(data)
         try:
             stack_item = StackItem.DeserializeStackItem(reader)
             engine.CurrentContext.EvaluationStack.PushT(stack_item)
         except ValueError as e:
             # can't deserialize type
             return False
-        finally:
-            StreamManager.ReleaseStream(ms)
         return True
 
     def Blockchain_GetHeight(self, engine: ExecutionEngine):
@@ -524,26 +542,21 @@ class StateReader(InteropService):
         storage_key = StorageKey(script_hash=context.ScriptHash, key=key)
         item = self.Snapshot.Storages.TryGet(storage_key.ToArray())
 
-        keystr = key
-
-        valStr = bytearray(0)
-
-        if item is not None:
-            valStr = bytearray(item.Value)
-
         if item is not None:
             engine.CurrentContext.EvaluationStack.PushT(bytearray(item.Value))
 
         else:
             engine.CurrentContext.EvaluationStack.PushT(bytearray(0))
 
-        tx_hash = None
-        if engine.ScriptContainer:
-            tx_hash = engine.ScriptContainer.Hash
+        if self.HasEventListeners(SmartContractEvent.STORAGE_GET):
+            tx_hash = None
+            if engine.ScriptContainer:
+                tx_hash = engine.ScriptContainer.Hash
 
-        self.events_to_dispatch.append(
-            SmartContractEvent(SmartContractEvent.STORAGE_GET, ContractParameter(ContractParameterType.String, value='%s -> %s' % (keystr, valStr)),
-                               context.ScriptHash, GetBlockchain().Height + 1, tx_hash, test_mode=engine.testMode))
+            value = item.Value if item is not None else b''
+            self.events_to_dispatch.append(
+                SmartContractEvent(SmartContractEvent.STORAGE_GET, lambda: ContractParameter(ContractParameterType.String, value='%s -> %s' % (key, bytearray(value))),
+                                   context.ScriptHash, GetBlockchain().Height + 1, tx_hash, test_mode=engine.testMode))
 
         return True
 
@@ -568,19 +581,17 @@ class StateReader(InteropService):
         item = self.Snapshot.Storages.GetAndChange(storage_key.ToArray(), lambda: StorageItem())
         item.Value = value
 
-        keystr = key
-        valStr = bytearray(item.Value)
-
-        if type(engine) == ExecutionEngine:
-            test_mode = False
-        else:
-            test_mode = engine.testMode
+        if self.HasEventListeners(SmartContractEvent.STORAGE_PUT):
+            if type(engine) == ExecutionEngine:
+                test_mode = False
+            else:
+                test_mode = engine.testMode
 
-        self.events_to_dispatch.append(
-            SmartContractEvent(SmartContractEvent.STORAGE_PUT, ContractParameter(ContractParameterType.String, '%s -> %s' % (keystr, valStr)),
-                               context.ScriptHash, GetBlockchain().Height + 1,
-                               engine.ScriptContainer.Hash if engine.ScriptContainer else None,
-                               test_mode=test_mode))
+            self.events_to_dispatch.append(
+                SmartContractEvent(SmartContractEvent.STORAGE_PUT, lambda: ContractParameter(ContractParameterType.String, '%s -> %s' % (key, bytearray(value))),
+                                   context.ScriptHash, GetBlockchain().Height + 1,
+                                   engine.ScriptContainer.Hash if engine.ScriptContainer else None,
+                                   test_mode=test_mode))
 
         return True
 
@@ -647,14 +658,15 @@ class StateReader(InteropService):
         key = engine.CurrentContext.EvaluationStack.Pop().GetByteArray()
         storage_key = StorageKey(script_hash=context.ScriptHash, key=key)
 
-        if type(engine) == ExecutionEngine:
-            test_mode = False
-        else:
-            test_mode = engine.testMode
-        self.events_to_dispatch.append(SmartContractEvent(SmartContractEvent.STORAGE_DELETE, ContractParameter(ContractParameterType.String, key),
-                                                          context.ScriptHash, GetBlockchain().Height + 1,
-                                                          engine.ScriptContainer.Hash if engine.ScriptContainer else None,
-                                                          test_mode=test_mode))
+        if self.HasEventListeners(SmartContractEvent.STORAGE_DELETE):
+            if type(engine) == ExecutionEngine:
+                test_mode = False
+            else:
+                test_mode = engine.testMode
+            self.events_to_dispatch.append(SmartContractEvent(SmartContractEvent.STORAGE_DELETE, ContractParameter(ContractParameterType.String, key),
+                                                              context.ScriptHash, GetBlockchain().Height + 1,
+                                                              engine.ScriptContainer.Hash if engine.ScriptContainer else None,
+                                                              test_mode=test_mode))
 
         item = self.Snapshot.Storages.TryGet(storage_key.ToArray())
         if item and item.IsConstant:
@@ -663,3 +675,6 @@ class StateReader(InteropService):
         self.Snapshot.Storages.Delete(storage_key.ToArray())
 
         return True
+
+
+StateReader._RegisterInterops()
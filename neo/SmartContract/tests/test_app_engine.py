@@ -5,6 +5,10 @@ from neo.VM.ExecutionContext import ExecutionContext
 from neo.SmartContract import TriggerType
 from mock import Mock, MagicMock
 from neo.VM.Script import Script
+from neo.VM import OpCode
+from neo.VM.InteropService import InteropService
+from neo.SmartContract.StateReader import StateReader
+from neo.SmartContract.StateMachine import StateMachine
 
 
 class TestApplicationEngine(NeoTestCase):
@@ -36,3 +40,57 @@ class TestApplicationEngine(NeoTestCase):
             stack_item_list += execution_context.EvaluationStack.Items + execution_context.AltStack.Items
 
         self.assertEqual(7, self.engine.GetItemCount(stack_item_list))
+
+    def test_get_price(self):
+        Script.ClearInstructionCache()
+        name = b'Neo.Storage.Put'
+        script = OpCode.CHECKSIG + OpCode.SYSCALL + bytes([len(name)]) + name + OpCode.CHECKMULTISIG
+        self.engine.LoadScript(script)
+        context = self.engine.CurrentContext
+
+        # static prices are resolved once and cached on the instruction
+        self.assertEqual(100, self.engine.GetPrice())
+        self.assertEqual(100, context.CurrentInstruction.Price)
+
+        # dynamic prices are computed from the evaluation stack on every call
+        context.InstructionPointer = 1
+        context.EvaluationStack.PushT(b'value')
+        context.EvaluationStack.PushT(b'key')
+        context.EvaluationStack.PushT(b'context')
+        self.assertEqual(1000, self.engine.GetPrice())
+
+        context.EvaluationStack.Clear()
+        context.EvaluationStack.PushT(b'\x01' * 2000)
+        context.EvaluationStack.PushT(b'key')
+        context.EvaluationStack.PushT(b'context')
+        self.assertEqual(2000, self.engine.GetPrice())
+        self.assertFalse(isinstance(context.CurrentInstruction.Price, int))
+
+        context.InstructionPointer = 18
+        context.EvaluationStack.PushT(3)
+        self.assertEqual(300, self.engine.GetPrice())
+
+    def test_interop_registry(self):
+        service = self.engine._Service
+        self.assertIsInstance(service, StateMachine)
+
+        # the interops are registered once per class, StateMachine extends the registrations of StateReader
+        interop_id = InteropService.GetInteropId("Neo.Runtime.CheckWitness")
+        self.assertIn(interop_id, StateMachine._interops)
+        self.assertNotIn(interop_id, StateReader._interops)
+        self.assertIn(InteropService.GetInteropId("System.Runtime.CheckWitness"), StateReader._interops)
+        self.assertIn(InteropService.GetInteropId("System.ExecutionEngine.GetScriptContainer"), StateMachine._interops)
+        self.assertEqual(200, service.GetPrice(interop_id))
+        self.assertEqual(0, service.GetPrice(InteropService.GetInteropId("Neo.Storage.Put")))
+        self.assertEqual(0, service.GetPrice(12345))
+
+        # ids can be given by name, as 4 byte operand or as int
+        self.assertEqual(interop_id, InteropService.GetInteropId(interop_id.to_bytes(4, 'little')))
+        self.assertEqual(interop_id, InteropService.GetInteropId(b'Neo.Runtime.CheckWitness'))
+
+        # handlers are bound to the instance on first use
+        self.engine.LoadScript(b'')
+        self.assertTrue(service.Invoke(InteropService.GetInteropId("Neo.Runtime.GetTrigger"), self.engine))
+        self.assertEqual(TriggerType.Application[0], self.engine.CurrentContext.EvaluationStack.Pop().GetBigInteger())
+        self.assertTrue(service.Invoke(b'Neo.Runtime.GetTrigger', self.engine))
+        self.assertFalse(service.Invoke(b'Neo.Runtime.Unknown', self.engine))
@@ -6,6 +6,8 @@ from neo.Core.BigInteger import BigInteger
 from neo.IO.MemoryStream import StreamManager
 from neo.Core.IO.BinaryWriter import BinaryWriter
 from neo.SmartContract.ContractParameter import ContractParameter, ContractParameterType
+from neo.EventHub import events, has_smart_contract_event_listeners
+from mock import patch
 
 
 class EventTestCase(TestCase):
@@ -206,3 +208,41 @@ class EventTestCase(TestCase):
         self.assertEqual(new_event.Amount, 123000)
         self.assertEqual(new_event.is_standard_notify, True)
         self.assertEqual(new_event.ShouldPersist, True)
+
+    def test_lazy_payload(self):
+        calls = []
+
+        def payload():
+            calls.append(1)
+            return ContractParameter(ContractParameterType.String, 'lazy')
+
+        sc = SmartContractEvent(SmartContractEvent.STORAGE_GET, payload, self.contract_hash, 99, self.event_tx)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(sc.event_payload.Value, 'lazy')
+        self.assertEqual(sc.event_payload.Value, 'lazy')
+        self.assertEqual(calls, [1])
+
+        sc = SmartContractEvent(SmartContractEvent.STORAGE_GET, lambda: None, self.contract_hash, 99, self.event_tx)
+        self.assertEqual(sc.event_payload.Type, ContractParameterType.Array)
+
+        with self.assertRaises(Exception):
+            SmartContractEvent(SmartContractEvent.STORAGE_GET, 'not a parameter', self.contract_hash, 99, self.event_tx)
+
+    def test_event_listeners(self):
+        def on_storage(sc_event):
+            pass
+
+        events.on(SmartContractEvent.STORAGE, on_storage)
+        try:
+            self.assertIn(on_storage, events.listeners_of(SmartContractEvent.STORAGE_PUT))
+            self.assertNotIn(on_storage, events.listeners_of(SmartContractEvent.RUNTIME_LOG))
+            self.assertTrue(has_smart_contract_event_listeners(SmartContractEvent.STORAGE_GET))
+        finally:
+            events.off(SmartContractEvent.STORAGE, on_storage)
+
+        self.assertNotIn(on_storage, events.listeners_of(SmartContractEvent.STORAGE_PUT))
+
+        with patch('neo.EventHub.settings') as settings:
+            settings.log_smart_contract_events = True
+            self.assertTrue(has_smart_contract_event_listeners(SmartContractEvent.STORAGE_GET))
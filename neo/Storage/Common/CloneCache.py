@@ -12,9 +12,10 @@ class CloneCache(DataCache):
     def DeleteInternal(self, key):
         self.innerCache.Delete(key)
 
-    def FindInternal(self, key_prefix):
+    def FindInternal(self, key_prefix, tracked_keys=frozenset()):
         for k, v in self.innerCache.Find(key_prefix):
-            yield k, v.Clone()
+            # tracked items take precedence in `Find`, no need to clone the inner item
+            yield k, None if k in tracked_keys else v.Clone()
 
     def GetInternal(self, key):
         return self.innerCache[key].Clone()
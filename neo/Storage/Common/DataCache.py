@@ -84,19 +84,52 @@ class DataCache:
                 trackable.State = TrackState.DELETED
 
     def Find(self, key_prefix=None):
-        if key_prefix is None:
-            key_prefix = b''
+        """
+        Find the items of which the key starts with `key_prefix`, ordered by key.
+
+        The items of `FindInternal` are streamed and merged with the tracked items, which take precedence. Tracked items
+        are taken as they are when calling `Find`, values are only decoded while iterating. Keys read or changed while
+        iterating therefore don't change the items found.
+
+        Args:
+            key_prefix (bytes): [optional] the raw key prefix.
+
+        Yields:
+            tuple: (key, item)
+        """
+        key_prefix = bytes(key_prefix) if key_prefix else b''
+
+        tracked = sorted((k, v) for k, v in self.dictionary.items() if k.startswith(key_prefix))
+        tracked_keys = frozenset(k for k, _ in tracked)
+        tracked_count = len(tracked)
+        i = 0
+
+        for k, v in self.FindInternal(key_prefix, tracked_keys):
+            while i < tracked_count and tracked[i][0] < k:
+                trackable = tracked[i][1]
+                i += 1
+                if trackable.State != TrackState.DELETED:
+                    yield trackable.Key, trackable.Item
 
-        for k, v in self.FindInternal(key_prefix):
-            if k not in self.dictionary:
+            if k not in tracked_keys:
                 yield k, v
 
-        for k, v in self.dictionary.items():
-            if v.State != TrackState.DELETED and (key_prefix is None or key_prefix in k):
-                yield k, v.Item
+        for _, trackable in tracked[i:]:
+            if trackable.State != TrackState.DELETED:
+                yield trackable.Key, trackable.Item
 
-    def FindInternal(self, key_prefix) -> dict:
-        # should be equal to DBInterface.Find
+    def FindInternal(self, key_prefix, tracked_keys=frozenset()):
+        """
+        Find the stored items of which the key starts with `key_prefix`, ordered by key. The item of a key in
+        `tracked_keys` is ignored by `Find` and may be None.
+
+        Args:
+            key_prefix (bytes): the raw key prefix.
+            tracked_keys (frozenset): the keys tracked by this cache when `Find` was called.
+
+        Yields:
+            tuple: (key, item)
+        """
         raise NotImplementedError()
 
     def GetAndChange(self, key, factory=None):
@@ -109,6 +142,7 @@ class DataCache:
                 trackable.Item = factory()
                 trackable.State = TrackState.CHANGED
             elif trackable.State == TrackState.NONE:
+                trackable.Item = self.GetWritableInternal(key, trackable.Item)
                 trackable.State = TrackState.CHANGED
         else:
             trackable = Trackable(key, self.TryGetInternal(key), TrackState.NONE)
@@ -118,6 +152,7 @@ class DataCache:
                 trackable.Item = factory()
                 trackable.State = TrackState.ADDED
             else:
+                trackable.Item = self.GetWritableInternal(key, trackable.Item)
                 trackable.State = TrackState.CHANGED
             self.dictionary.update({key: trackable})
 
@@ -141,6 +176,11 @@ class DataCache:
     def GetInternal(self, key):
         raise NotImplementedError()
 
+    def GetWritableInternal(self, key, item):
+        # called before an item read through `GetInternal`/`TryGetInternal` is changed. Implementations handing out
+        # shared items have to return a private copy
+        return item
+
     def TryGet(self, key):
         """
         Get Item, by key
@@ -0,0 +1,158 @@
+import binascii
+import os
+import shutil
+
+from neo.Core.Blockchain import Blockchain
+from neo.Storage.Common.DBPrefix import DBPrefix
+from neo.Storage.Implementation.DBFactory import getBlockchainDB
+from neo.Storage.Interface.DBProperties import DBProperties
+from neo.logging import log_manager
+
+logger = log_manager.getLogger('db')
+
+"""
+Description:
+    Offline migration of a blockchain database from the hex encoded schema
+    (`schema v.0.8.5`) to the binary schema (`schema v.0.9.2`).
+
+    The binary schema stores all values as raw bytes instead of hexlified
+    bytes, and uses raw 32 byte hashes instead of 64 character hex hashes in
+    the keys of blocks and transactions.
+
+Usage:
+    from neo.Storage.Common.Migration import migrateDatabaseAt
+    migrateDatabaseAt(settings.chain_leveldb_path)
+"""
+
+_HEX_VALUE_PREFIXES = {DBPrefix.ST_Account, DBPrefix.ST_Coin, DBPrefix.ST_SpentCoin, DBPrefix.ST_Validator,
+                       DBPrefix.ST_Asset, DBPrefix.ST_Contract, DBPrefix.ST_Storage, DBPrefix.IX_HeaderHashList}
+
+
+def convertRecord(key, value):
+    """
+    Converts a record of the hex encoded schema to the binary schema.
+
+    Args:
+        key (bytes): the key as stored in the hex encoded schema.
+        value (bytes): the value as stored in the hex encoded schema.
+
+    Returns:
+        tuple: (key, value) for the binary schema.
+    """
+    prefix = key[:1]
+
+    if prefix == DBPrefix.DATA_Block:
+        # 8 bytes system fee + hex trimmed block (or header)
+        return prefix + binascii.unhexlify(key[1:]), value[:8] + binascii.unhexlify(value[8:])
+
+    if prefix == DBPrefix.DATA_Transaction:
+        # 4 bytes block height + hex transaction
+        return prefix + binascii.unhexlify(key[1:]), value[:4] + binascii.unhexlify(value[4:])
+
+    if prefix in _HEX_VALUE_PREFIXES:
+        return key, binascii.unhexlify(value)
+
+    if prefix == DBPrefix.SYS_CurrentBlock or prefix == DBPrefix.SYS_CurrentHeader:
+        # hex hash + 4 bytes height
+        return key, binascii.unhexlify(value[:64]) + value[64:]
+
+    if prefix == DBPrefix.SYS_Version:
+        return key, Blockchain._sysversion
+
+    return key, value
+
+
+def migrateDatabase(source, destination, batch_size=10000, progress=None):
+    """
+    Copies all records of `source` into `destination`, converting them to the binary schema.
+
+    The schema version is written last, so an interrupted migration never results in a database marked as current.
+
+    Args:
+        source (AbstractDBImplementation): the hex encoded database.
+        destination (AbstractDBImplementation): an empty database.
+        batch_size (int): the number of records to write per batch.
+        progress (callable): [optional] called with the number of converted records after every batch.
+
+    Returns:
+        int: the number of converted records.
+    """
+    count = 0
+    records = []
+
+    def write_records():
+        with destination.getBatch() as wb:
+            for key, value in records:
+                wb.put(key, value)
+        records.clear()
+        if progress:
+            progress(count)
+
+    with source.openIter(DBProperties(include_value=True)) as it:
+        for key, value in it:
+            if key == DBPrefix.SYS_Version:
+                continue
+
+            records.append(convertRecord(key, value))
+            count += 1
+
+            if len(records) >= batch_size:
+                write_records()
+
+    if records:
+        write_records()
+
+    destination.write(DBPrefix.SYS_Version, Blockchain._sysversion)
+    return count
+
+
+def migrateDatabaseAt(path, force=False, keep_legacy=False, progress=None):
+    """
+    Migrates the hex encoded blockchain database at `path` to the binary schema.
+
+    The database is converted into a new directory next to `path`, which then replaces the original one.
+
+    Args:
+        path (str): full path to the blockchain database directory.
+        force (bool): migrate any database not having the current schema version, e.g. one without a version.
+        keep_legacy (bool): keep the original database in `<path>.legacy` instead of removing it.
+        progress (callable): [optional] called with the number of converted records after every batch.
+
+    Returns:
+        bool: True if the database was migrated. False if it does not need to (or cannot) be migrated.
+    """
+    path = os.path.normpath(path)
+    migrating_path = path + '.migrating'
+    legacy_path = path + '.legacy'
+
+    if not os.path.isdir(path):
+        return False
+
+    source = getBlockchainDB(path)
+    try:
+        version = source.get(DBPrefix.SYS_Version)
+        if version == Blockchain._sysversion or (version != Blockchain._legacy_sysversion and not force):
+            return False
+
+        logger.info("Migrating database %s from %s to %s" % (path, version, Blockchain._sysversion))
+
+        if os.path.exists(migrating_path):
+            shutil.rmtree(migrating_path)
+
+        destination = getBlockchainDB(migrating_path)
+        try:
+            count = migrateDatabase(source, destination, progress=progress)
+        finally:
+            destination.closeDB()
+    finally:
+        source.closeDB()
+
+    if os.path.exists(legacy_path):
+        shutil.rmtree(legacy_path)
+    os.rename(path, legacy_path)
+    os.rename(migrating_path, path)
+    if not keep_legacy:
+        shutil.rmtree(legacy_path)
+
+    logger.info("Migrated %s records" % count)
+    return True
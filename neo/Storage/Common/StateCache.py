@@ -0,0 +1,144 @@
+import threading
+from collections import OrderedDict
+
+
+class StateCache:
+    """
+    Size bounded LRU cache of decoded state items (e.g. accounts, assets, contracts and storage items), shared by all
+    snapshots of a database.
+
+    Items are keyed by their full database key (prefix + key) and kept together with their raw value, which is used to
+    bound the size of the cache and to decode a private copy when a snapshot wants to change an item. Cached items are
+    shared and must never be changed in place.
+
+    Every write of a cached key has to be followed by `Invalidate`. Readers pass the `Generation` their (point-in-time)
+    view of the database corresponds to. Items are only added if no invalidation happened since, so a concurrent commit
+    can't leave stale items behind, and only items added up to that generation are returned, so readers never see an
+    item newer than their view.
+    """
+
+    DEFAULT_MAX_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Create an instance.
+
+        Args:
+            max_size (int): the maximum total size in bytes of the raw values of the cached items.
+        """
+        self.max_size = max_size
+        self._items = OrderedDict()
+        self._size = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def Generation(self):
+        """
+        The number of invalidations so far. Get it together with the view of the database to read from, and pass it
+        to `TryGet` and `Add`.
+
+        Returns:
+            int:
+        """
+        return self._generation
+
+    def TryGet(self, key, generation):
+        """
+        Get a cached item.
+
+        Args:
+            key (bytes): the database key of the item.
+            generation (int): the `Generation` of the view of the reader.
+
+        Returns:
+            tuple: (item, raw value) or None if the item is not cached (for `generation`).
+        """
+        with self._lock:
+            entry = self._items.get(key, None)
+            # items added after `generation` might have been changed since
+            if entry is None or entry[2] > generation:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._items.move_to_end(key)
+            return entry[0], entry[1]
+
+    def Add(self, key, item, raw, generation):
+        """
+        Add an item read from the database.
+
+        Args:
+            key (bytes): the database key of the item.
+            item (object): the decoded item.
+            raw (bytes): the raw value of the item.
+            generation (int): the `Generation` of the view the item was read from.
+        """
+        if len(raw) > self.max_size:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._size -= len(old[1])
+
+            self._items[key] = (item, raw, generation)
+            self._size += len(raw)
+
+            while self._size > self.max_size:
+                _, (_, old_raw, _) = self._items.popitem(last=False)
+                self._size -= len(old_raw)
+                self._evictions += 1
+
+    def Invalidate(self, keys):
+        """
+        Remove items after their keys were written to the database.
+
+        Args:
+            keys (iterable): the database keys of the items.
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                entry = self._items.pop(key, None)
+                if entry is not None:
+                    self._size -= len(entry[1])
+
+    def Clear(self):
+        """
+        Remove all items and reset the statistics.
+        """
+        with self._lock:
+            self._generation += 1
+            self._items.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def Stats(self):
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            dict: with the number of cached items (`size`), their raw size in bytes (`bytes`), `hits`, `misses`,
+                  `evictions` and the `hit_rate` (0.0 - 1.0).
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._items),
+                'bytes': self._size,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0
+            }
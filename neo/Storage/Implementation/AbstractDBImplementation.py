@@ -64,6 +64,22 @@ class AbstractDBImplementation(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def getMany(self, keys):
+        """
+        Retrieves the values of multiple keys from the database, e.g. all
+        transactions of a block, in a single pass where the backend allows it.
+
+        Args:
+            keys (iterable): of prefixed bytearrays, for prefixes check
+                             neo.Storage.Common.DBPrefix
+
+        Returns:
+            dict: key (bytes) -> value (bytearray), without the keys that
+                  do not exist.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, key):
         """
@@ -174,6 +190,67 @@ class AbstractDBImplementation(ABC):
 
         raise NotImplementedError
 
+    @abstractmethod
+    def beginCoalescedWrites(self):
+        """
+        Starts buffering all writes (including batches) in memory until
+        `flushCoalescedWrites` or `endCoalescedWrites` is called.
+
+        Buffered writes have to be visible to `get` and `openIter` as if they
+        were already persisted. This allows writing the changes of several
+        blocks with a single atomic batch while catching up.
+
+        Calling it while writes are already being buffered has no effect.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def flushCoalescedWrites(self):
+        """
+        Atomically persists all buffered writes, buffering continues afterwards.
+
+        Args:
+            None
+
+        Returns:
+            int: the number of keys written.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def endCoalescedWrites(self):
+        """
+        Flushes all buffered writes and stops buffering.
+
+        Args:
+            None
+
+        Returns:
+            int: the number of keys written.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def coalescedWriteSize(self):
+        """
+        Returns the approximate size in bytes of the buffered writes, 0 if
+        writes are not being buffered.
+
+        Returns:
+            int
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     def getPrefixedDB(self, prefix):
         """
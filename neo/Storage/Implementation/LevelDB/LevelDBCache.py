@@ -1,19 +1,33 @@
 from neo.Storage.Interface.DBProperties import DBProperties
 from neo.Storage.Common.DataCache import DataCache
-import binascii
 from neo.IO.MemoryStream import StreamManager
 from neo.Core.IO.BinaryWriter import BinaryWriter
-from neo.Core.IO.BinaryReader import BinaryReader
+from neo.Core.IO.BufferReader import BufferReader
 from contextlib import suppress
 
 
 class LevelDBCache(DataCache):
-    def __init__(self, db, batch, prefix, classref):
+    def __init__(self, db, batch, prefix, classref, state_cache=None, state_generation=None):
+        """
+        Args:
+            db (LevelDBSnapshotView): the database (view) to read from.
+            batch: the write batch changes are committed to.
+            prefix (bytes): the DBPrefix of the items.
+            classref (class): the class of the items.
+            state_cache (StateCache): [optional] shared cache of decoded items to read through.
+            state_generation (int): the `StateCache.Generation` the reads of `db` correspond to.
+        """
         super().__init__()
         self.db = db
         self.batch = batch
         self.prefix = prefix
         self.ClassRef = classref
+        self.state_cache = state_cache
+        self.state_generation = state_generation
+        # raw values of the items handed out from the state cache, which have to be copied before being changed
+        self.shared = {}
+        # keys written to the batch, which have to be invalidated in the state cache once the batch is written
+        self.written_keys = []
 
     def AddInternal(self, key, value):
         if self.batch:
@@ -21,32 +35,26 @@ class LevelDBCache(DataCache):
             bw = BinaryWriter(stream)
             value.Serialize(bw)
 
-            self.batch.put(self.prefix + key, stream.ToArray())
+            self.batch.put(self.prefix + key, stream.getvalue())
             StreamManager.ReleaseStream(stream)
+            self._Written(key)
 
     def DeleteInternal(self, key):
         if self.batch:
             self.batch.delete(self.prefix + key)
+            self._Written(key)
 
-    def FindInternal(self, key_prefix):
-        try:
-            intermediate_prefix = bytearray(binascii.unhexlify(key_prefix))
-        except binascii.Error:
-            intermediate_prefix = bytearray(key_prefix)
-
-        key_prefix = self.prefix + intermediate_prefix
-        res = {}
+    def FindInternal(self, key_prefix, tracked_keys=frozenset()):
+        key_prefix = self.prefix + bytes(key_prefix)
         with self.db.openIter(DBProperties(key_prefix, include_value=True)) as it:
             for key, val in it:
-                # we want the storage item, not the raw bytes
-                item = self.ClassRef.DeserializeFromDB(binascii.unhexlify(val))
-                # also here we need to skip the 1 byte storage prefix
-                res_key = key[1:]
-                res[res_key] = item
-
-        # yielding outside of iterator to make sure the db iterator is closed
-        for k, v in res.items():
-            yield k, v
+                # skip the 1 byte storage prefix
+                key = key[1:]
+                if key in tracked_keys:
+                    # tracked items take precedence in `Find`, no need to decode it
+                    yield key, None
+                else:
+                    yield key, self.ClassRef.DeserializeFromDB(val)
 
     def GetInternal(self, key):
         result = self.TryGetInternal(key)
@@ -56,19 +64,43 @@ class LevelDBCache(DataCache):
         return result
 
     def TryGetInternal(self, key):
-        data = self.db.get(self.prefix + key)
-        if data is None:
-            return data
+        if self.state_cache is None:
+            data = self.db.get(self.prefix + key)
+            if data is None:
+                return data
+
+            return self._Deserialize(data)
+
+        db_key = bytes(self.prefix + key)
+        entry = self.state_cache.TryGet(db_key, self.state_generation)
+        if entry is not None:
+            obj, data = entry
+        else:
+            data = self.db.get(db_key)
+            if data is None:
+                return data
+
+            obj = self._Deserialize(data)
+            self.state_cache.Add(db_key, obj, data, self.state_generation)
+
+        self.shared[db_key] = data
+        return obj
 
-        data = binascii.unhexlify(data)
+    def GetWritableInternal(self, key, item):
+        # copy on write, decode a private copy of items shared through the state cache
+        data = self.shared.pop(bytes(self.prefix + key), None)
+        if data is None:
+            return item
 
-        stream = StreamManager.GetStream(data)
-        br = BinaryReader(stream)
-        obj = self.ClassRef()
-        obj.Deserialize(br)
-        StreamManager.ReleaseStream(stream)
+        return self._Deserialize(data)
 
-        return obj
+    def InvalidateStateCache(self):
+        """
+        Remove the keys written by `Commit` from the state cache. Has to be called after the batch is written.
+        """
+        if self.state_cache is not None and self.written_keys:
+            self.state_cache.Invalidate(self.written_keys)
+        self.written_keys = []
 
     def UpdateInternal(self, key, value):
         if self.batch:
@@ -76,5 +108,16 @@ class LevelDBCache(DataCache):
             bw = BinaryWriter(stream)
             value.Serialize(bw)
 
-            self.batch.put(self.prefix + key, stream.ToArray())
+            self.batch.put(self.prefix + key, stream.getvalue())
             StreamManager.ReleaseStream(stream)
+            self._Written(key)
+
+    def _Written(self, key):
+        if self.state_cache is not None:
+            self.written_keys.append(bytes(self.prefix + key))
+
+    def _Deserialize(self, data):
+        obj = self.ClassRef()
+        obj.Deserialize(BufferReader(data))
+
+        return obj
@@ -1,5 +1,6 @@
 import plyvel
 import threading
+import weakref
 
 
 from contextlib import contextmanager
@@ -8,6 +9,7 @@ from neo.Storage.Implementation.AbstractDBImplementation import (
     AbstractDBImplementation
 )
 from neo.Storage.Common.DBPrefix import DBPrefix
+from neo.Storage.Common.StateCache import StateCache
 from neo.Storage.Interface.DBProperties import DBProperties
 import neo.Storage.Implementation.LevelDB.LevelDBSnapshot
 from neo.logging import log_manager
@@ -15,6 +17,8 @@ from neo.logging import log_manager
 
 logger = log_manager.getLogger()
 
+_NOT_PENDING = object()
+
 """
 Description:
     Backend implementation for the LevelDB database.
@@ -34,11 +38,30 @@ class LevelDBImpl(AbstractDBImplementation):
     # the instance of the database
     _db = None
 
-    _lock = threading.RLock()
+    _path = None
+
+    _state_cache = None
+
+    # guards the buffered writes, one per database instance
+    _lock = None
+
+    # buffered writes while coalescing, maps a key to its value or `None` if it was deleted
+    _pending = None
+    _pending_size = 0
+
+    # sequence number of the last write
+    _seq = 0
+
+    # while coalescing, the snapshot views reading the buffered writes and the previous buffered values of the keys
+    # written since they were created (key -> list of (write sequence number, previous value))
+    _views = None
+    _undo = None
 
     def __init__(self, path):
         try:
             self._path = path
+            self._state_cache = StateCache()
+            self._lock = threading.RLock()
             self._db = plyvel.DB(self._path, create_if_missing=True,
                                  max_open_files=100,
                                  lru_cache_size=10 * 1024 * 1024)
@@ -46,18 +69,74 @@ class LevelDBImpl(AbstractDBImplementation):
         except Exception as e:
             raise Exception("leveldb exception [ %s ]" % e)
 
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def stateCache(self):
+        # decoded state items shared by all snapshots of the database
+        return self._state_cache
+
     def write(self, key, value):
-        self._db.put(key, value)
+        if self._pending is not None:
+            with self._lock:
+                self._seq += 1
+                self._putPending(key, value)
+        else:
+            self._db.put(key, value)
 
     def get(self, key, default=None):
+        if self._pending:
+            value = self._pending.get(bytes(key), _NOT_PENDING)
+            if value is not _NOT_PENDING:
+                return default if value is None else value
+
         return self._db.get(key, default)
 
+    def getMany(self, keys):
+        """
+        Get the values of multiple keys, reading them in key order with a single iterator instead of a lookup per key.
+
+        Args:
+            keys (iterable): the keys.
+
+        Returns:
+            dict: key -> value, without the keys that don't exist.
+        """
+        result = {}
+        remaining = []
+        for key in sorted(set(bytes(k) for k in keys)):
+            if self._pending:
+                value = self._pending.get(key, _NOT_PENDING)
+                if value is not _NOT_PENDING:
+                    if value is not None:
+                        result[key] = value
+                    continue
+            remaining.append(key)
+
+        if remaining:
+            _iter = self._db.iterator(start=remaining[0], stop=remaining[-1], include_stop=True)
+            for key in remaining:
+                _iter.seek(key)
+                entry = next(_iter, None)
+                if entry is not None and entry[0] == key:
+                    result[key] = entry[1]
+            _iter.close()
+
+        return result
+
     def delete(self, key):
-        self._db.delete(key)
+        if self._pending is not None:
+            with self._lock:
+                self._seq += 1
+                self._putPending(key, None)
+        else:
+            self._db.delete(key)
 
     def cloneDatabaseStorage(self, clone_storage):
         db_snapshot = self.createSnapshot()
-        with db_snapshot.db.openIter(DBProperties(prefix=DBPrefix.ST_Storage, include_value=True)) as iterator:
+        with db_snapshot.snapshot.openIter(DBProperties(prefix=DBPrefix.ST_Storage, include_value=True)) as iterator:
             for key, value in iterator:
                 clone_storage.write(key, value)
         return clone_storage
@@ -65,8 +144,27 @@ class LevelDBImpl(AbstractDBImplementation):
     def createSnapshot(self):
         return neo.Storage.Implementation.LevelDB.LevelDBSnapshot.LevelDBSnapshot(self)
 
+    def createSnapshotView(self):
+        """
+        Returns a read only, point-in-time view of the database, see `LevelDBSnapshotView`.
+        """
+        return LevelDBSnapshotView(self)
+
     @contextmanager
     def openIter(self, properties):
+        if self._pending:
+            prefix = properties.prefix
+            if prefix is None:
+                pending = sorted(self._pending.items())
+            else:
+                prefix = bytes(prefix)
+                pending = sorted((k, v) for k, v in self._pending.items() if k.startswith(prefix))
+
+            _iter = self._db.iterator(prefix=properties.prefix, include_value=True)
+            yield _mergePending(_iter, properties, pending)
+            _iter.close()
+            return
+
         _iter = self._db.iterator(
             prefix=properties.prefix,
             include_value=properties.include_value,
@@ -79,10 +177,74 @@ class LevelDBImpl(AbstractDBImplementation):
     def getBatch(self):
 
         with self._lock:
-            _batch = self._db.write_batch()
+            _batch = self.writeBatch()
             yield _batch
             _batch.write()
 
+    def writeBatch(self):
+        """
+        Returns a new write batch, which is buffered in memory instead while coalescing writes.
+        """
+        if self._pending is not None:
+            return CoalescedWriteBatch(self)
+        return self._db.write_batch()
+
+    def beginCoalescedWrites(self):
+        with self._lock:
+            if self._pending is None:
+                self._startPending()
+
+    def flushCoalescedWrites(self):
+        with self._lock:
+            if not self._pending:
+                return 0
+
+            with self._db.write_batch() as wb:
+                for key, value in self._pending.items():
+                    if value is None:
+                        wb.delete(key)
+                    else:
+                        wb.put(key, value)
+
+            count = len(self._pending)
+            # views created before keep reading the flushed writes, so they are replaced instead of cleared
+            self._startPending()
+            return count
+
+    def endCoalescedWrites(self):
+        with self._lock:
+            count = self.flushCoalescedWrites()
+            self._pending = None
+            self._views = None
+            self._undo = None
+            return count
+
+    def coalescedWriteSize(self):
+        return self._pending_size
+
+    def _startPending(self):
+        self._pending = {}
+        self._pending_size = 0
+        self._views = weakref.WeakSet()
+        self._undo = {}
+
+    def _putPending(self, key, value):
+        # has to be called holding the lock, after incrementing the write sequence number
+        key = bytes(key)
+        if value is not None:
+            value = bytes(value)
+            self._pending_size += len(key) + len(value)
+        else:
+            self._pending_size += len(key)
+
+        if self._views:
+            # keep the previous value for the views created before this write
+            self._undo.setdefault(key, []).append((self._seq, self._pending.get(key, _NOT_PENDING)))
+        elif self._undo:
+            self._undo = {}
+
+        self._pending[key] = value
+
     def getPrefixedDB(self, prefix):
         return PrefixedLevelDBImpl(self._db.prefixed_db(prefix))
 
@@ -90,6 +252,148 @@ class LevelDBImpl(AbstractDBImplementation):
         self._db.close()
 
 
+class CoalescedWriteBatch:
+    """
+    Mimics a LevelDB write batch, applying its changes to the buffered writes of `db` when written.
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._changes = []
+
+    def put(self, key, value):
+        self._changes.append((key, value))
+
+    def delete(self, key):
+        self._changes.append((key, None))
+
+    def clear(self):
+        self._changes = []
+
+    def write(self):
+        with self._db._lock:
+            if self._db._pending is None:
+                # coalescing ended in the meantime
+                with self._db._db.write_batch() as wb:
+                    for key, value in self._changes:
+                        if value is None:
+                            wb.delete(key)
+                        else:
+                            wb.put(key, value)
+            else:
+                self._db._seq += 1
+                for key, value in self._changes:
+                    self._db._putPending(key, value)
+        self._changes = []
+
+
+class LevelDBSnapshotView:
+    """
+    Read only, point-in-time view of a `LevelDBImpl`.
+
+    Reads go through a LevelDB snapshot. While writes are being coalesced, the buffered writes are part of the view as
+    they were when the view was created: later writes keep the previous values for the view, and flushing replaces the
+    buffered writes instead of clearing them. All reads therefore see the database as of the creation of the view, also
+    while another thread is writing.
+    """
+
+    def __init__(self, db):
+        self._lock = db._lock
+        with self._lock:
+            self._snapshot = db._db.snapshot()
+            self._pending = db._pending
+            self._undo = db._undo
+            self._seq = db._seq
+            self._views = db._views
+            self.state_generation = db._state_cache.Generation if db._state_cache is not None else None
+            if self._views is not None:
+                self._views.add(self)
+
+    def get(self, key, default=None):
+        if self._pending is not None:
+            value = self._getPending(bytes(key))
+            if value is not _NOT_PENDING:
+                return default if value is None else value
+
+        return self._snapshot.get(key, default)
+
+    @contextmanager
+    def openIter(self, properties):
+        pending = None
+        if self._pending:
+            prefix = None if properties.prefix is None else bytes(properties.prefix)
+            with self._lock:
+                keys = [k for k in self._pending.keys() if prefix is None or k.startswith(prefix)]
+            pending = []
+            for key in sorted(keys):
+                value = self._getPending(key)
+                if value is not _NOT_PENDING:
+                    pending.append((key, value))
+
+        if pending:
+            _iter = self._snapshot.iterator(prefix=properties.prefix, include_value=True)
+            yield _mergePending(_iter, properties, pending)
+        else:
+            _iter = self._snapshot.iterator(
+                prefix=properties.prefix,
+                include_value=properties.include_value,
+                include_key=properties.include_key)
+            yield _iter
+
+        _iter.close()
+
+    def close(self):
+        if self._views is not None:
+            self._views.discard(self)
+        self._snapshot.close()
+
+    def _getPending(self, key):
+        with self._lock:
+            value = self._pending.get(key, _NOT_PENDING)
+            if value is not _NOT_PENDING:
+                # undo the writes made after the view was created
+                for seq, previous in reversed(self._undo.get(key, ())):
+                    if seq <= self._seq:
+                        break
+                    value = previous
+        return value
+
+
+def _mergePending(_iter, properties, pending):
+    """
+    Merges buffered writes (sorted (key, value) tuples, a value of `None` marks a deleted key) into the (sorted) database
+    iterator.
+    """
+    include_key = properties.include_key
+    include_value = properties.include_value
+
+    def merged():
+        idx = 0
+        count = len(pending)
+        for key, value in _iter:
+            while idx < count and pending[idx][0] <= key:
+                pending_key, pending_value = pending[idx]
+                idx += 1
+                if pending_key == key:
+                    value = pending_value
+                elif pending_value is not None:
+                    yield pending_key, pending_value
+            if value is not None:
+                yield key, value
+        for pending_key, pending_value in pending[idx:]:
+            if pending_value is not None:
+                yield pending_key, pending_value
+
+    for key, value in merged():
+        if include_key and include_value:
+            yield key, value
+        elif include_key:
+            yield key
+        else:
+            yield value
+
+
 class PrefixedLevelDBImpl(LevelDBImpl):
     def __init__(self, prefixed_db):
         self._db = prefixed_db
+        self._lock = threading.RLock()
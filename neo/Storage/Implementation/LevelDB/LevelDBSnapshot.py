@@ -21,21 +21,31 @@ class LevelDBSnapshot(neo.Storage.Common.Snapshot.Snapshot):
     def __init__(self, _db):
         super(LevelDBSnapshot, self).__init__()
         self.db = _db  # type: LevelDBImpl
-        self.snapshot = self.db._db.snapshot()
-        self.batch = self.db._db.write_batch()
-        self.Blocks = LevelDBCache(self.db, self.batch, DBPrefix.DATA_Block, BlockState)
-        self.Transactions = LevelDBCache(self.db, self.batch, DBPrefix.DATA_Transaction, TransactionState)
-        self.Accounts = LevelDBCache(self.db, self.batch, DBPrefix.ST_Account, AccountState)
-        self.UnspentCoins = LevelDBCache(self.db, self.batch, DBPrefix.ST_Coin, UnspentCoinState)
-        self.SpentCoins = LevelDBCache(self.db, self.batch, DBPrefix.ST_SpentCoin, SpentCoinState)
-        self.Assets = LevelDBCache(self.db, self.batch, DBPrefix.ST_Asset, AssetState)
-        self.Validators = LevelDBCache(self.db, self.batch, DBPrefix.ST_Validator, ValidatorState)
-        self.Contracts = LevelDBCache(self.db, self.batch, DBPrefix.ST_Contract, ContractState)
-        self.Storages = LevelDBCache(self.db, self.batch, DBPrefix.ST_Storage, StorageItem)
+        # all reads go through a point-in-time view of the database
+        self.snapshot = self.db.createSnapshotView()
+        self.batch = self.db.writeBatch()
+        self.Blocks = LevelDBCache(self.snapshot, self.batch, DBPrefix.DATA_Block, BlockState)
+        self.Transactions = LevelDBCache(self.snapshot, self.batch, DBPrefix.DATA_Transaction, TransactionState)
+        # frequently read state is shared between snapshots through the state cache of the database
+        state_cache = self.db.stateCache
+        generation = self.snapshot.state_generation
+        self.Accounts = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_Account, AccountState, state_cache, generation)
+        self.UnspentCoins = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_Coin, UnspentCoinState)
+        self.SpentCoins = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_SpentCoin, SpentCoinState)
+        self.Assets = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_Asset, AssetState, state_cache, generation)
+        self.Validators = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_Validator, ValidatorState, state_cache, generation)
+        self.Contracts = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_Contract, ContractState, state_cache, generation)
+        self.Storages = LevelDBCache(self.snapshot, self.batch, DBPrefix.ST_Storage, StorageItem, state_cache, generation)
 
     def Commit(self):
         super(LevelDBSnapshot, self).Commit()
-        self.batch.write()
+
+        # new views must not see the written keys in the state cache
+        with self.db._lock:
+            self.batch.write()
+
+            for cache in (self.Accounts, self.Assets, self.Validators, self.Contracts, self.Storages):
+                cache.InvalidateStateCache()
 
     def Dispose(self):
         self.snapshot.close()
@@ -54,11 +64,8 @@ class LevelDBSnapshot(neo.Storage.Common.Snapshot.Snapshot):
         # if tx is not None:
         #     return tx
 
-        out = self.db.get(DBPrefix.DATA_Transaction + hash)
+        out = self.snapshot.get(DBPrefix.DATA_Transaction + binascii.unhexlify(hash))
         if out is not None:
-            out = bytearray(out)
             height = int.from_bytes(out[:4], 'little')
-            out = out[4:]
-            outhex = binascii.unhexlify(out)
-            return Transaction.DeserializeFromBufer(outhex, 0), height
+            return Transaction.DeserializeFromBufer(memoryview(out)[4:], 0), height
         return None, -1
@@ -179,3 +179,183 @@ class LevelDBTest(TestCase):
 
         self.assertEqual(self._db.get(b'00001.x'), b'batch_x')
         self.assertIsNone(self._db.get(b'00002.x'))
+
+    def test_coalesced_writes(self):
+        from neo.Storage.Interface.DBProperties import DBProperties
+
+        self._db.write(b'00003.x', b'x')
+        self._db.write(b'00003.y', b'y')
+
+        self._db.beginCoalescedWrites()
+        try:
+            self._db.write(b'00003.w', b'w')
+            self._db.delete(b'00003.x')
+
+            with self._db.getBatch() as batch:
+                batch.put(b'00003.z', b'z')
+                batch.put(b'00003.y', b'batch_y')
+
+            # buffered writes are visible, but not persisted yet
+            self.assertEqual(self._db.get(b'00003.w'), b'w')
+            self.assertIsNone(self._db.get(b'00003.x'))
+            self.assertEqual(self._db.get(b'00003.x', b'default'), b'default')
+            self.assertEqual(self._db.get(b'00003.y'), b'batch_y')
+            self.assertEqual(self._db._db.get(b'00003.x'), b'x')
+            self.assertIsNone(self._db._db.get(b'00003.w'))
+            self.assertGreater(self._db.coalescedWriteSize(), 0)
+
+            with self._db.openIter(DBProperties(prefix=b'00003', include_value=True)) as iterator:
+                self.assertEqual(list(iterator), [(b'00003.w', b'w'), (b'00003.y', b'batch_y'), (b'00003.z', b'z')])
+
+            with self._db.openIter(DBProperties(prefix=b'00003', include_value=False)) as iterator:
+                self.assertEqual(list(iterator), [b'00003.w', b'00003.y', b'00003.z'])
+
+            self.assertEqual(self._db.flushCoalescedWrites(), 4)
+            self.assertEqual(self._db.coalescedWriteSize(), 0)
+            self.assertEqual(self._db._db.get(b'00003.w'), b'w')
+            self.assertIsNone(self._db._db.get(b'00003.x'))
+
+            self._db.write(b'00003.v', b'v')
+        finally:
+            self.assertEqual(self._db.endCoalescedWrites(), 1)
+
+        self.assertEqual(self._db._db.get(b'00003.v'), b'v')
+
+        # writes go straight to the database again
+        self._db.write(b'00003.u', b'u')
+        self.assertEqual(self._db._db.get(b'00003.u'), b'u')
+
+        for key in [b'00003.u', b'00003.v', b'00003.w', b'00003.y', b'00003.z']:
+            self._db.delete(key)
+
+    def test_instance_locks(self):
+        prefixed_db = self._db.getPrefixedDB(b'00006')
+        view = self._db.createSnapshotView()
+
+        # every database guards its own buffered writes, snapshot views share the lock of their database
+        self.assertIsNot(prefixed_db._lock, self._db._lock)
+        self.assertIs(view._lock, self._db._lock)
+
+        view.close()
+
+    def test_get_many(self):
+        self._db.write(b'00005.x', b'x')
+        self._db.write(b'00005.y', b'y')
+        self._db.write(b'00005.z', b'z')
+
+        self.assertEqual(self._db.getMany([b'00005.z', b'00005.a', b'00005.x', b'00005.x']), {b'00005.x': b'x', b'00005.z': b'z'})
+        self.assertEqual(self._db.getMany([]), {})
+
+        # includes buffered writes
+        self._db.beginCoalescedWrites()
+        try:
+            self._db.write(b'00005.w', b'w')
+            self._db.delete(b'00005.x')
+            self.assertEqual(self._db.getMany([b'00005.w', b'00005.x', b'00005.y']), {b'00005.w': b'w', b'00005.y': b'y'})
+        finally:
+            self._db.endCoalescedWrites()
+
+        for key in [b'00005.w', b'00005.x', b'00005.y', b'00005.z']:
+            self._db.delete(key)
+
+    def test_snapshot_view(self):
+        from neo.Storage.Interface.DBProperties import DBProperties
+
+        def items(view):
+            with view.openIter(DBProperties(prefix=b'00004', include_value=True)) as iterator:
+                return list(iterator)
+
+        self._db.write(b'00004.x', b'x')
+        view = self._db.createSnapshotView()
+
+        self._db.write(b'00004.x', b'x2')
+        self._db.write(b'00004.y', b'y')
+        self.assertEqual(view.get(b'00004.x'), b'x')
+        self.assertIsNone(view.get(b'00004.y'))
+        self.assertEqual(items(view), [(b'00004.x', b'x')])
+        view.close()
+
+        self._db.beginCoalescedWrites()
+        try:
+            self._db.write(b'00004.z', b'z')
+            view_1 = self._db.createSnapshotView()
+
+            with self._db.getBatch() as batch:
+                batch.put(b'00004.z', b'z2')
+                batch.delete(b'00004.x')
+            self._db.write(b'00004.w', b'w')
+            view_2 = self._db.createSnapshotView()
+
+            self._db.write(b'00004.z', b'z3')
+
+            # views see the buffered writes as they were when created
+            self.assertEqual(view_1.get(b'00004.z'), b'z')
+            self.assertEqual(view_1.get(b'00004.x'), b'x2')
+            self.assertIsNone(view_1.get(b'00004.w'))
+            self.assertEqual(items(view_1), [(b'00004.x', b'x2'), (b'00004.y', b'y'), (b'00004.z', b'z')])
+            self.assertEqual(items(view_2), [(b'00004.w', b'w'), (b'00004.y', b'y'), (b'00004.z', b'z2')])
+
+            # also after the buffered writes are flushed
+            self._db.flushCoalescedWrites()
+            self._db.write(b'00004.y', b'y2')
+            self.assertEqual(items(view_1), [(b'00004.x', b'x2'), (b'00004.y', b'y'), (b'00004.z', b'z')])
+            self.assertEqual(items(view_2), [(b'00004.w', b'w'), (b'00004.y', b'y'), (b'00004.z', b'z2')])
+            self.assertEqual(items(self._db.createSnapshotView()), [(b'00004.w', b'w'), (b'00004.y', b'y2'), (b'00004.z', b'z3')])
+
+            view_1.close()
+            view_2.close()
+        finally:
+            self._db.endCoalescedWrites()
+
+        for key in [b'00004.w', b'00004.x', b'00004.y', b'00004.z']:
+            self._db.delete(key)
+
+    def test_snapshot_find(self):
+        from neo.Core.State.StorageItem import StorageItem
+
+        def found(cache, prefix):
+            return [(k, v.Value) for k, v in cache.Find(prefix)]
+
+        snapshot = self._db.createSnapshot()
+        for key in [b'ab1', b'ab3', b'ab5', b'ac1', b'xab']:
+            snapshot.Storages.Add(key, StorageItem(key))
+        snapshot.Commit()
+
+        snapshot = self._db.createSnapshot()
+        snapshot.Storages.Add(b'ab2', StorageItem(b'new'))
+        snapshot.Storages.Add(b'xab2', StorageItem(b'new'))
+        snapshot.Storages.GetAndChange(b'ab3').Value = b'changed'
+        snapshot.Storages.Delete(b'ab5')
+
+        # ordered, tracked items take precedence and only keys starting with the (raw) prefix match
+        expected = [(b'ab1', b'ab1'), (b'ab2', b'new'), (b'ab3', b'changed')]
+        self.assertEqual(found(snapshot.Storages, b'ab'), expected)
+        self.assertEqual(found(snapshot.Storages, bytearray(b'ab')), expected)
+        self.assertEqual(found(snapshot.Storages.CreateSnapshot(), b'ab'), expected)
+        self.assertEqual(len(found(snapshot.Storages, None)), 6)
+
+        # changes made while iterating don't break the iteration
+        found_keys = []
+        for k, v in snapshot.Storages.Find(b'ab'):
+            found_keys.append(k)
+            snapshot.Storages.Delete(k)
+        self.assertEqual(found_keys, [b'ab1', b'ab2', b'ab3'])
+        self.assertEqual(found(snapshot.Storages, b'ab'), [])
+        snapshot.Dispose()
+
+        # reading keys while iterating doesn't drop them from the iteration
+        snapshot = self._db.createSnapshot()
+        for cache in [snapshot.Storages, snapshot.Storages.CreateSnapshot()]:
+            found_items = []
+            for k, v in cache.Find(b'ab'):
+                found_items.append((k, v.Value))
+                if k == b'ab1':
+                    cache.TryGet(b'ab3')
+                    cache.GetAndChange(b'ab5')
+            self.assertEqual(found_items, [(b'ab1', b'ab1'), (b'ab3', b'ab3'), (b'ab5', b'ab5')])
+        snapshot.Dispose()
+
+        snapshot = self._db.createSnapshot()
+        for key in [b'ab1', b'ab3', b'ab5', b'ac1', b'xab']:
+            snapshot.Storages.Delete(key)
+        snapshot.Commit()
@@ -2,6 +2,11 @@ from neo.Utils.NeoTestCase import NeoTestCase
 from neo.Storage.Implementation.DBFactory import getBlockchainDB
 from neo.Core.Blockchain import Blockchain
 from neo.IO.Helper import Helper
+from neo.Network.common import wait_for
+from neo.Storage.Common.DBPrefix import DBPrefix
+from neo.Core.TX.Transaction import ContractTransaction
+from neo.Core.CoinReference import CoinReference
+from types import SimpleNamespace
 from neo.Settings import settings
 import shutil
 import binascii
@@ -59,6 +64,107 @@ class LevelDBTest(NeoTestCase):
         self._blockchain.AddBlock(block_one)
         self.assertEqual(self._blockchain.HeaderHeight, 1)
 
+    def test_persist_coalesced(self):
+        hexdata = binascii.unhexlify(self.block_one_raw)
+        block_one = Helper.AsSerializableWithType(hexdata, 'neo.Core.Block.Block')
+
+        if self._blockchain.HeaderHeight == 0:
+            self._blockchain.AddBlock(block_one)
+
+        # pretend to be catching up, so the block is buffered instead of written
+        Blockchain.CATCHUP_DISTANCE = 0
+        try:
+            wait_for(self._blockchain.Persist(block_one))
+        finally:
+            Blockchain.CATCHUP_DISTANCE = 1000
+
+        db = self._blockchain._db
+        tx_key = DBPrefix.DATA_Transaction + binascii.unhexlify(block_one.Transactions[0].Hash.ToBytes())
+        current_block = binascii.unhexlify(block_one.Hash.ToBytes()) + block_one.IndexBytes()
+        self.assertEqual(self._blockchain.Height, 1)
+        self.assertIsNotNone(db.get(tx_key))
+        self.assertIsNone(db._db.get(tx_key))
+        self.assertEqual(db.get(DBPrefix.SYS_CurrentBlock), current_block)
+        self.assertNotEqual(db._db.get(DBPrefix.SYS_CurrentBlock), current_block)
+
+        self._blockchain.FlushBlockWrites()
+        self.assertEqual(db.coalescedWriteSize(), 0)
+        self.assertIsNotNone(db._db.get(tx_key))
+        self.assertEqual(db._db.get(DBPrefix.SYS_CurrentBlock), current_block)
+
+    def test_get_input_transactions(self):
+        genesis_tx = self._genesis.Transactions[-1]
+        self._blockchain._db.write(DBPrefix.DATA_Transaction + binascii.unhexlify(genesis_tx.Hash.ToBytes()),
+                                   self._genesis.IndexBytes() + binascii.unhexlify(genesis_tx.ToArray()))
+
+        tx1 = ContractTransaction(inputs=[CoinReference(genesis_tx.Hash, 0), CoinReference(genesis_tx.Hash, 1)])
+        tx2 = ContractTransaction(inputs=[CoinReference(tx1.Hash, 0), CoinReference(genesis_tx.Hash, 2)])
+        block = SimpleNamespace(Transactions=[tx1, tx2])
+
+        self.assertEqual(self._blockchain._GetInputHashes(block), [genesis_tx.Hash.ToBytes()])
+
+        prev_txs = self._blockchain.GetInputTransactions(block)
+        self.assertEqual(list(prev_txs.keys()), [genesis_tx.Hash.ToBytes()])
+        prev_tx, height = prev_txs[genesis_tx.Hash.ToBytes()]
+        self.assertEqual(prev_tx.Hash, genesis_tx.Hash)
+        self.assertEqual(height, 0)
+
+    def test_header_index_snapshot(self):
+        current_hash = self._blockchain.CurrentHeaderHash
+        height = self._blockchain.HeaderHeight
+
+        self.assertTrue(self._blockchain.SaveHeaderIndexSnapshot())
+        self.assertTrue(self._blockchain.LoadHeaderIndexSnapshot(current_hash, height))
+        self.assertEqual(self._blockchain.CurrentHeaderHash, current_hash)
+        self.assertEqual(self._blockchain.HeaderHeight, height)
+
+        # a snapshot ahead of the stored headers is not used
+        self.assertFalse(self._blockchain.LoadHeaderIndexSnapshot(current_hash, height - 1))
+
+        os.remove(self._blockchain._header_index_path)
+        self.assertFalse(self._blockchain.LoadHeaderIndexSnapshot(current_hash, height))
+
+    def write_genesis_block(self):
+        db = self._blockchain._db
+        db.write(DBPrefix.DATA_Block + binascii.unhexlify(self._genesis.Hash.ToBytes()), bytes(8) + self._genesis.Trim())
+        for tx in self._genesis.Transactions:
+            db.write(DBPrefix.DATA_Transaction + binascii.unhexlify(tx.Hash.ToBytes()),
+                     self._genesis.IndexBytes() + binascii.unhexlify(tx.ToArray()))
+
+    def test_get_block(self):
+        self.write_genesis_block()
+        tx_hashes = [tx.Hash for tx in self._genesis.Transactions]
+
+        block = self._blockchain.GetBlockByHeight(0)
+        self.assertEqual(block.Hash, self._genesis.Hash)
+        self.assertEqual([tx.Hash for tx in block.Transactions], tx_hashes)
+
+        # recently read blocks are cached
+        self.assertIs(self._blockchain.GetBlockByHeight(0), block)
+        self.assertIs(self._blockchain.GetBlock(self._genesis.Hash.ToBytes()), block)
+
+        unknown = b'00' * 32
+        txs = self._blockchain.GetTransactions([unknown] + tx_hashes[::-1])
+        self.assertIsNone(txs[0])
+        self.assertEqual([tx.Hash for tx in txs[1:]], tx_hashes[::-1])
+
+    def test_get_raw_block(self):
+        # a header stored before its block is persisted
+        db = self._blockchain._db
+        db.write(DBPrefix.DATA_Block + binascii.unhexlify(self._genesis.Hash.ToBytes()),
+                 bytes(8) + binascii.unhexlify(self._genesis.Header.ToArray()))
+        self.assertIsNone(self._blockchain.GetRawBlock(0))
+        self.assertIsNone(self._blockchain.GetRawBlock(self._genesis.Hash.ToBytes()))
+
+        self.write_genesis_block()
+        raw_block = binascii.unhexlify(self._genesis.ToArray())
+
+        self.assertEqual(self._blockchain.GetRawBlock(0), raw_block)
+        self.assertEqual(self._blockchain.GetRawBlock(self._genesis.Hash.ToBytes()), raw_block)
+        self.assertEqual(self._blockchain.GetRawBlock('0x' + self._genesis.Hash.ToString()), raw_block)
+        self.assertIsNone(self._blockchain.GetRawBlock(b'aa' * 32))
+        self.assertIsNone(self._blockchain.GetRawBlock(100))
+
     def test_sys_block_fees(self):
 
         block_num = 14103
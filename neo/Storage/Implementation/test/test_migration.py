@@ -0,0 +1,74 @@
+from unittest import TestCase
+from neo.Storage.Common.Migration import convertRecord, migrateDatabaseAt
+from neo.Storage.Common.DBPrefix import DBPrefix
+from neo.Storage.Implementation.DBFactory import getBlockchainDB
+from neo.Core.Blockchain import Blockchain
+from neo.Settings import settings
+import binascii
+import shutil
+import os
+
+
+class MigrationTest(TestCase):
+    DB_TESTPATH = os.path.join(settings.DATA_DIR_PATH, 'UnitTestMigration')
+
+    tx_hash = b'8d9adc0e47a4849a4ef8f8cd6b6da6e7ee05e2e93d5f8d3c4f6de4c0b8bd4b11'
+    block_hash = b'996e37358dc369912041f966f8c5d8d3a8255ba5dcbd3447f8a82b55db869099'
+
+    def tearDown(self):
+        for path in [self.DB_TESTPATH, self.DB_TESTPATH + '.legacy', self.DB_TESTPATH + '.migrating']:
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def test_convert_record(self):
+        raw_tx_hash = binascii.unhexlify(self.tx_hash)
+
+        key, value = convertRecord(DBPrefix.DATA_Transaction + self.tx_hash, b'\x01\x00\x00\x00' + b'0001ff')
+        self.assertEqual(key, DBPrefix.DATA_Transaction + raw_tx_hash)
+        self.assertEqual(value, b'\x01\x00\x00\x00\x00\x01\xff')
+
+        key, value = convertRecord(DBPrefix.DATA_Block + self.block_hash, bytes(8) + b'abcd')
+        self.assertEqual(key, DBPrefix.DATA_Block + binascii.unhexlify(self.block_hash))
+        self.assertEqual(value, bytes(8) + b'\xab\xcd')
+
+        key, value = convertRecord(DBPrefix.ST_Coin + self.tx_hash, b'000102')
+        self.assertEqual(key, DBPrefix.ST_Coin + self.tx_hash)
+        self.assertEqual(value, b'\x00\x01\x02')
+
+        key, value = convertRecord(DBPrefix.SYS_CurrentBlock, self.block_hash + b'\x02\x00\x00\x00')
+        self.assertEqual(value, binascii.unhexlify(self.block_hash) + b'\x02\x00\x00\x00')
+
+        key, value = convertRecord(DBPrefix.SYS_Version, Blockchain._legacy_sysversion)
+        self.assertEqual(value, Blockchain._sysversion)
+
+    def test_migrate_database(self):
+        db = getBlockchainDB(self.DB_TESTPATH)
+        db.write(DBPrefix.SYS_Version, Blockchain._legacy_sysversion)
+        db.write(DBPrefix.DATA_Transaction + self.tx_hash, b'\x01\x00\x00\x00' + b'0001ff')
+        db.write(DBPrefix.ST_Storage + b'\x01\x02', b'abcd')
+        db.closeDB()
+
+        self.assertTrue(migrateDatabaseAt(self.DB_TESTPATH, keep_legacy=True))
+        self.assertTrue(os.path.exists(self.DB_TESTPATH + '.legacy'))
+        self.assertFalse(os.path.exists(self.DB_TESTPATH + '.migrating'))
+
+        db = getBlockchainDB(self.DB_TESTPATH)
+        self.assertEqual(db.get(DBPrefix.SYS_Version), Blockchain._sysversion)
+        self.assertEqual(db.get(DBPrefix.DATA_Transaction + binascii.unhexlify(self.tx_hash)), b'\x01\x00\x00\x00\x00\x01\xff')
+        self.assertIsNone(db.get(DBPrefix.DATA_Transaction + self.tx_hash))
+        self.assertEqual(db.get(DBPrefix.ST_Storage + b'\x01\x02'), b'\xab\xcd')
+        db.closeDB()
+
+        # already migrated
+        self.assertFalse(migrateDatabaseAt(self.DB_TESTPATH))
+
+    def test_migrate_unknown_database(self):
+        self.assertFalse(migrateDatabaseAt(self.DB_TESTPATH))
+        self.assertFalse(os.path.exists(self.DB_TESTPATH))
+
+        db = getBlockchainDB(self.DB_TESTPATH)
+        db.closeDB()
+
+        # without a version a database is only migrated when forced
+        self.assertFalse(migrateDatabaseAt(self.DB_TESTPATH))
+        self.assertTrue(migrateDatabaseAt(self.DB_TESTPATH, force=True))
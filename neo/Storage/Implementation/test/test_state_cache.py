@@ -0,0 +1,112 @@
+from neo.Storage.Implementation.DBFactory import getBlockchainDB
+from neo.Storage.Common.StateCache import StateCache
+from neo.Core.State.StorageItem import StorageItem
+from neo.Settings import settings
+from unittest import TestCase
+import shutil
+import os
+
+
+class StateCacheTest(TestCase):
+
+    def test_lru(self):
+        cache = StateCache(max_size=10)
+
+        cache.Add(b'a', 'item a', b'1234', cache.Generation)
+        cache.Add(b'b', 'item b', b'1234', cache.Generation)
+        self.assertEqual(cache.TryGet(b'a', cache.Generation), ('item a', b'1234'))
+
+        # evicts the least recently used item
+        cache.Add(b'c', 'item c', b'1234', cache.Generation)
+        self.assertIsNone(cache.TryGet(b'b', cache.Generation))
+        self.assertEqual(cache.TryGet(b'c', cache.Generation), ('item c', b'1234'))
+
+        # too big to be cached
+        cache.Add(b'd', 'item d', b'12345678901', cache.Generation)
+        self.assertIsNone(cache.TryGet(b'd', cache.Generation))
+
+        self.assertEqual(cache.Stats(), {'size': 2, 'bytes': 8, 'hits': 2, 'misses': 2, 'evictions': 1, 'hit_rate': 0.5})
+
+        cache.Clear()
+        self.assertEqual(cache.Stats(), {'size': 0, 'bytes': 0, 'hits': 0, 'misses': 0, 'evictions': 0, 'hit_rate': 0.0})
+
+    def test_invalidate(self):
+        cache = StateCache()
+
+        cache.Add(b'a', 'item a', b'1', cache.Generation)
+        cache.Add(b'b', 'item b', b'2', cache.Generation)
+
+        generation = cache.Generation
+        cache.Invalidate([b'a'])
+        self.assertIsNone(cache.TryGet(b'a', cache.Generation))
+        self.assertEqual(cache.TryGet(b'b', cache.Generation), ('item b', b'2'))
+
+        # read before the invalidation, might be stale
+        cache.Add(b'a', 'old item a', b'0', generation)
+        self.assertIsNone(cache.TryGet(b'a', cache.Generation))
+
+
+class LevelDBStateCacheTest(TestCase):
+
+    DB_TESTPATH = os.path.join(settings.DATA_DIR_PATH, 'UnitTestStateCache/')
+    _db = None
+
+    @classmethod
+    def setUpClass(cls):
+        settings.setup_unittest_net()
+        cls._db = getBlockchainDB(cls.DB_TESTPATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._db.closeDB()
+        shutil.rmtree(cls.DB_TESTPATH)
+
+    def test_read_through(self):
+        snapshot = self._db.createSnapshot()
+        snapshot.Storages.Add(b'key1', StorageItem(b'value1'))
+        snapshot.Commit()
+
+        self._db.stateCache.Clear()
+
+        item = self._db.createSnapshot().Storages.TryGet(b'key1')
+        self.assertEqual(item.Value, b'value1')
+
+        # a new snapshot gets the cached item
+        self.assertIs(self._db.createSnapshot().Storages.TryGet(b'key1'), item)
+        stats = self._db.stateCache.Stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+        # changing the item does not change the cached item
+        snapshot = self._db.createSnapshot()
+        changed = snapshot.Storages.GetAndChange(b'key1')
+        self.assertIsNot(changed, item)
+        changed.Value = b'value2'
+        self.assertEqual(item.Value, b'value1')
+        self.assertEqual(self._db.createSnapshot().Storages.TryGet(b'key1').Value, b'value1')
+
+        # committing invalidates the cached item
+        snapshot.Commit()
+        self.assertEqual(self._db.createSnapshot().Storages.TryGet(b'key1').Value, b'value2')
+
+        snapshot = self._db.createSnapshot()
+        snapshot.Storages.Delete(b'key1')
+        snapshot.Commit()
+        self.assertIsNone(self._db.createSnapshot().Storages.TryGet(b'key1'))
+
+    def test_point_in_time(self):
+        snapshot = self._db.createSnapshot()
+        snapshot.Storages.Add(b'key2', StorageItem(b'value1'))
+        snapshot.Commit()
+
+        old_snapshot = self._db.createSnapshot()
+
+        snapshot = self._db.createSnapshot()
+        snapshot.Storages.GetAndChange(b'key2').Value = b'value2'
+        snapshot.Commit()
+
+        # cached by a newer snapshot, but not used by the older one
+        self.assertEqual(self._db.createSnapshot().Storages.TryGet(b'key2').Value, b'value2')
+        self.assertEqual(old_snapshot.Storages.TryGet(b'key2').Value, b'value1')
+        self.assertEqual(self._db.createSnapshot().Storages.TryGet(b'key2').Value, b'value2')
+        old_snapshot.Dispose()
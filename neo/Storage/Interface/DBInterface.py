@@ -1,5 +1,8 @@
 import binascii
 from neo.SmartContract.Iterable import EnumeratorBase
+from neo.Storage.Interface.DBProperties import DBProperties
+from neo.IO.MemoryStream import StreamManager
+from neo.Core.IO.BinaryWriter import BinaryWriter
 from neo.logging import log_manager
 
 logger = log_manager.getLogger()
@@ -60,9 +63,9 @@ class DBInterface(object):
             item = self.Collection[keyval]
             if item:
                 if not wb:
-                    self.DB.write(self.Prefix + keyval, self.Collection[keyval].ToByteArray())
+                    self.DB.write(self.Prefix + keyval, self._Serialize(item))
                 else:
-                    wb.put(self.Prefix + keyval, self.Collection[keyval].ToByteArray())
+                    wb.put(self.Prefix + keyval, self._Serialize(item))
         for keyval in self.Deleted:
             if not wb:
                 self.DB.delete(self.Prefix + keyval)
@@ -182,7 +185,7 @@ class DBInterface(object):
         try:
             buffer = self.DB.get(self.Prefix + keyval)
             if buffer:
-                item = self.ClassRef.DeserializeFromDB(binascii.unhexlify(buffer))
+                item = self.ClassRef.DeserializeFromDB(buffer)
                 self.Collection[keyval] = item
                 return item
             return None
@@ -191,6 +194,14 @@ class DBInterface(object):
 
         return None
 
+    @staticmethod
+    def _Serialize(item):
+        stream = StreamManager.GetStream()
+        item.Serialize(BinaryWriter(stream))
+        data = stream.getvalue()
+        StreamManager.ReleaseStream(stream)
+        return data
+
     def Add(self, keyval, item):
         if self.Prefix == b'\x70':  # Storage Prefix
             found = self.DB.get(self.Prefix + keyval) is not None
@@ -239,7 +250,7 @@ class DBInterface(object):
         with self.DB.openIter(DBProperties(key_prefix, include_value=True)) as it:
             for key, val in it:
                 # we want the storage item, not the raw bytes
-                item = self.ClassRef.DeserializeFromDB(binascii.unhexlify(val)).Value
+                item = self.ClassRef.DeserializeFromDB(val).Value
                 # also here we need to skip the 1 byte storage prefix
                 res_key = key[21:]
                 res[res_key] = item
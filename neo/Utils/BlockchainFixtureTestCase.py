@@ -12,6 +12,7 @@ from neo.Utils.NeoTestCase import NeoTestCase
 from neo.Storage.Implementation.DBFactory import getBlockchainDB
 from neo.Storage.Interface.DBInterface import DBInterface
 from neo.Storage.Common.DBPrefix import DBPrefix
+from neo.Storage.Common.Migration import migrateDatabaseAt
 from neo.SmartContract.ApplicationEngine import ApplicationEngine
 from neo.Core.Blockchain import Blockchain
 from neo.Core.Fixed8 import Fixed8
@@ -104,8 +105,8 @@ def MonkeyPatchPersist(self, block, snapshot=None):
 
                     sc = snapshot.SpentCoins.TryGet(input.PrevHash.ToBytes())
                     if sc and sc.HasIndex(input.PrevIndex):
+                        sc = snapshot.SpentCoins.GetAndChange(input.PrevHash.ToBytes())
                         sc.DeleteIndex(input.PrevIndex)
-                        snapshot.SpentCoins.GetAndChange(input.PrevHash.ToBytes())
 
             elif tx.Type == TransactionType.EnrollmentTransaction:
 
@@ -246,6 +247,9 @@ class BlockchainFixtureTestCase(NeoTestCase):
         if not os.path.exists(cls.leveldb_testpath()):
             raise Exception("Error downloading fixtures at %s" % cls.leveldb_testpath())
 
+        # the fixtures are stored with the hex encoded database schema
+        migrateDatabaseAt(cls.leveldb_testpath(), force=True)
+
         settings.setup_unittest_net()
 
         cls._blockchain = Blockchain(getBlockchainDB(path=cls.leveldb_testpath()), skip_version_check=True)
@@ -12,7 +12,6 @@ if TYPE_CHECKING:
 class ExecutionContext:
 
     def __init__(self, script: 'Script', rvcount: int):
-        self.instructions = {}
         self._EvaluationStack = RandomAccessStack(name='Evaluation')
         self._AltStack = RandomAccessStack(name='Alt')
         self.InstructionPointer = 0
@@ -44,15 +43,7 @@ class ExecutionContext:
         return self.Script.ScriptHash
 
     def GetInstruction(self, ip) -> Instruction:
-        if ip >= self.Script.Length:
-            return Instruction.RET()
-        instruction = self.instructions.get(ip, None)
-
-        if instruction is None:
-            instruction = Instruction.FromScriptAndIP(self.Script, ip)
-            self.instructions.update({ip: instruction})
-
-        return instruction
+        return self.Script.GetInstruction(ip)
 
     def MoveNext(self):
         self.InstructionPointer += self.CurrentInstruction.Size
@@ -51,6 +51,7 @@ class ExecutionEngine:
         self._ExecutedScriptHashes = []
         self.ops_processed = 0
         self._debug_map = None
+        self.debugger = None
         self._is_write_log = settings.log_vm_instructions
         self._is_stackitem_count_strict = True
         self._stackitem_count = 0
@@ -191,1022 +192,1058 @@ class ExecutionEngine:
             with open(self.log_file_name, 'w') as self.log_file:
                 self.write_log(str(datetime.datetime.now()))
                 loop_stepinto()
+        elif self._CanExecuteFast():
+            self._ExecuteFast()
         else:
             loop_stepinto()
 
         return not self._VMState & VMState.FAULT > 0
 
-    def ExecuteInstruction(self):
-        context = self.CurrentContext
-        instruction = context.CurrentInstruction
-        opcode = instruction.OpCode
-        estack = context._EvaluationStack
-        istack = self._InvocationStack
-        astack = context._AltStack
-
-        if opcode >= PUSHBYTES1 and opcode <= PUSHDATA4:
-            if not self.CheckMaxItemSize(len(instruction.Operand)):
-                return False
-            estack.PushT(instruction.Operand)
-
-            if not self.CheckStackSize(True):
-                return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
-        else:
-
-            # push values
-            if opcode in [PUSHM1, PUSH1, PUSH2, PUSH3, PUSH4, PUSH5, PUSH6, PUSH7, PUSH8,
-                          PUSH9, PUSH10, PUSH11, PUSH12, PUSH13, PUSH14, PUSH15, PUSH16]:
-
-                topush = int.from_bytes(opcode, 'little') - int.from_bytes(PUSH1, 'little') + 1
-                estack.PushT(topush)
-
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
-
-            elif opcode == PUSH0:
-                estack.PushT(bytearray(0))
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
-
-            # control
-            elif opcode == NOP:
-                pass
-            elif opcode in [JMP, JMPIF, JMPIFNOT]:
-                offset = context.InstructionPointer + instruction.TokenI16
-
-                if offset < 0 or offset > context.Script.Length:
-                    return self.VM_FAULT_and_report(VMFault.INVALID_JUMP)
-
-                fValue = True
-                if opcode > JMP:
-                    self.CheckStackSize(False, -1)
-                    fValue = estack.Pop().GetBoolean()
-                    if opcode == JMPIFNOT:
-                        fValue = not fValue
-                if fValue:
-                    context.InstructionPointer = offset
-                    context.ins = context.GetInstruction(context.InstructionPointer)
-                else:
-                    context.InstructionPointer += 3
-                    context.ins = context.GetInstruction(context.InstructionPointer)
-                return True
-
-            elif opcode == CALL:
-                if not self.CheckMaxInvocationStack():
-                    return self.VM_FAULT_and_report(VMFault.CALL_EXCEED_MAX_INVOCATIONSTACK_SIZE)
-
-                context_call = self._LoadScriptInternal(context.Script)
-                context_call.InstructionPointer = context.InstructionPointer + instruction.TokenI16
-                if context_call.InstructionPointer < 0 or context_call.InstructionPointer > context_call.Script.Length:
-                    return False
-                context.EvaluationStack.CopyTo(context_call.EvaluationStack)
-                context.EvaluationStack.Clear()
-
-            elif opcode == RET:
-                context_pop: ExecutionContext = istack.Pop()
-                rvcount = context_pop._RVCount
-
-                if rvcount == -1:
-                    rvcount = context_pop.EvaluationStack.Count
-
-                if rvcount > 0:
-                    if context_pop.EvaluationStack.Count < rvcount:
-                        return self.VM_FAULT_and_report(VMFault.UNKNOWN1)
-
-                    if istack.Count == 0:
-                        stack_eval = self._ResultStack
-                    else:
-                        stack_eval = self.CurrentContext.EvaluationStack
-                    context_pop.EvaluationStack.CopyTo(stack_eval, rvcount)
-
-                if context_pop._RVCount == -1 and istack.Count > 0:
-                    context_pop.AltStack.CopyTo(self.CurrentContext.AltStack)
-
-                self.CheckStackSize(False, 0)
-
-                if istack.Count == 0:
-                    self._VMState = VMState.HALT
-                return True
-
-            elif opcode == APPCALL or opcode == TAILCALL:
-                if self._Table is None:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN2)
-
-                if opcode == APPCALL and not self.CheckMaxInvocationStack():
-                    return self.VM_FAULT_and_report(VMFault.APPCALL_EXCEED_MAX_INVOCATIONSTACK_SIZE)
+    def _CanExecuteFast(self):
+        """
+        Test if the engine can run without instrumentation, i.e. without a debugger, without instruction logging and
+        without overridden execution hooks (other than `PreExecuteInstruction`).
+        """
+        cls = type(self)
+        return self.debugger is None and not self._is_write_log and \
+            cls.ExecuteNext is ExecutionEngine.ExecuteNext and \
+            cls.ExecuteInstruction is ExecutionEngine.ExecuteInstruction and \
+            cls.PostExecuteInstruction is ExecutionEngine.PostExecuteInstruction
 
-                script_hash = instruction.Operand
+    def _ExecuteFast(self):
+        """
+        Execute until halted, faulted or on a break. Equivalent to calling `ExecuteNext` in a loop, minus the logging.
+        """
+        invocation_stack = self._InvocationStack
+        pre_execute = self.PreExecuteInstruction
+        dispatch_table = _dispatch_table
+        stop = VMState.HALT | VMState.FAULT | VMState.BREAK
 
-                is_normal_call = False
-                for b in script_hash:
-                    if b > 0:
-                        is_normal_call = True
+        while self._VMState & stop == 0:
+            # only re-entered after an instruction raised, instead of once per instruction
+            try:
+                while self._VMState & stop == 0:
+                    if invocation_stack.Count == 0:
+                        self._VMState = VMState.HALT
                         break
 
-                if not is_normal_call:
-                    script_hash = estack.Pop().GetByteArray()
-
-                context_new = self._LoadScriptByHash(script_hash)
-                if context_new is None:
-                    return self.VM_FAULT_and_report(VMFault.INVALID_CONTRACT, script_hash)
-
-                estack.CopyTo(context_new.EvaluationStack)
-
-                if opcode == TAILCALL:
-                    istack.Remove(1)
-                else:
-                    estack.Clear()
-
-                self.CheckStackSize(False, 0)
+                    self.ops_processed += 1
+                    context = invocation_stack.Peek()
+                    instruction = context.CurrentInstruction
 
-            elif opcode == SYSCALL:
-                if len(instruction.Operand) > 252:
-                    return False
+                    if not pre_execute():
+                        self._VMState = VMState.FAULT
 
-                if not self._Service.Invoke(instruction.Operand, self):
-                    return self.VM_FAULT_and_report(VMFault.SYSCALL_ERROR, instruction.Operand)
-
-                if not self.CheckStackSize(False, int_MaxValue):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
-
-            # stack operations
-            elif opcode == DUPFROMALTSTACK:
-                estack.PushT(astack.Peek())
-
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
-
-            elif opcode == TOALTSTACK:
-                astack.PushT(estack.Pop())
-
-            elif opcode == FROMALTSTACK:
-                estack.PushT(astack.Pop())
-
-            elif opcode == XDROP:
-                n = estack.Pop().GetBigInteger()
-                if n < 0:
+                    result = dispatch_table[instruction.OpCode](self, context, instruction, context._EvaluationStack)
+                    if result is None:
+                        context.MoveNext()
+                    elif not result:
+                        self._VMState = VMState.FAULT
+            except Exception:
+                if self._exit_on_error:
                     self._VMState = VMState.FAULT
-                    return
-                estack.Remove(n)
-                self.CheckStackSize(False, -2)
-
-            elif opcode == XSWAP:
-                n = estack.Pop().GetBigInteger()
 
-                if n < 0:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN3)
-
-                self.CheckStackSize(True, -1)
-
-                # if n == 0 break, same as do x if n > 0
-                if n > 0:
-                    item = estack.Peek(n)
-                    estack.Set(n, estack.Peek())
-                    estack.Set(0, item)
+    def ExecuteInstruction(self):
+        context = self.CurrentContext
+        instruction = context.CurrentInstruction
 
-            elif opcode == XTUCK:
-                n = estack.Pop().GetBigInteger()
+        # a handler returns None to continue with the next instruction, True when it has moved the instruction pointer
+        # itself (jumps and returns) and False when the instruction faulted
+        result = _dispatch_table[instruction.OpCode](self, context, instruction, context._EvaluationStack)
+        if result is None:
+            context.MoveNext()
+            return True
+        return result
 
-                if n <= 0:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN4)
+    # push values
+    def _Op_PUSHBYTES(self, context, instruction, estack):
+        if not self.CheckMaxItemSize(len(instruction.Operand)):
+            return False
+        estack.PushT(instruction.Operand)
 
-                estack.Insert(n, estack.Peek())
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == DEPTH:
-                estack.PushT(estack.Count)
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+    def _Op_PUSHNUMBER(self, context, instruction, estack):
+        # PUSHM1 (0x4F) up to PUSH16 (0x60)
+        estack.PushT(instruction.OpCode - 0x50)
 
-            elif opcode == DROP:
-                estack.Pop()
-                self.CheckStackSize(False, -1)
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == DUP:
-                estack.PushT(estack.Peek())
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+    def _Op_PUSH0(self, context, instruction, estack):
+        estack.PushT(bytearray(0))
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == NIP:
-                estack.Remove(1)
-                self.CheckStackSize(False, -1)
+    # control
+    def _Op_NOP(self, context, instruction, estack):
+        pass
 
-            elif opcode == OVER:
-                estack.PushT(estack.Peek(1))
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+    def _Op_JMP(self, context, instruction, estack):
+        return self._Jump(context, instruction, estack, None)
 
-            elif opcode == PICK:
+    def _Op_JMPIF(self, context, instruction, estack):
+        return self._Jump(context, instruction, estack, True)
 
-                n = estack.Pop().GetBigInteger()
-                if n < 0:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN5)
+    def _Op_JMPIFNOT(self, context, instruction, estack):
+        return self._Jump(context, instruction, estack, False)
 
-                estack.PushT(estack.Peek(n))
+    def _Jump(self, context, instruction, estack, condition):
+        offset = instruction.JumpTarget
 
-            elif opcode == ROLL:
+        if offset < 0 or offset > context.Script.Length:
+            return self.VM_FAULT_and_report(VMFault.INVALID_JUMP)
 
-                n = estack.Pop().GetBigInteger()
-                if n < 0:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN6)
-                self.CheckStackSize(True, -1)
+        fValue = True
+        if condition is not None:
+            self.CheckStackSize(False, -1)
+            fValue = estack.Pop().GetBoolean() == condition
+        if fValue:
+            context.InstructionPointer = offset
+            context.ins = context.GetInstruction(context.InstructionPointer)
+        else:
+            context.InstructionPointer += 3
+            context.ins = context.GetInstruction(context.InstructionPointer)
+        return True
 
-                if n > 0:
-                    estack.PushT(estack.Remove(n))
+    def _Op_CALL(self, context, instruction, estack):
+        if not self.CheckMaxInvocationStack():
+            return self.VM_FAULT_and_report(VMFault.CALL_EXCEED_MAX_INVOCATIONSTACK_SIZE)
 
-            elif opcode == ROT:
-                estack.PushT(estack.Remove(2))
+        context_call = self._LoadScriptInternal(context.Script)
+        context_call.InstructionPointer = instruction.JumpTarget
+        if context_call.InstructionPointer < 0 or context_call.InstructionPointer > context_call.Script.Length:
+            return False
+        context.EvaluationStack.CopyTo(context_call.EvaluationStack)
+        context.EvaluationStack.Clear()
 
-            elif opcode == SWAP:
-                estack.PushT(estack.Remove(1))
+    def _Op_RET(self, context, instruction, estack):
+        istack = self._InvocationStack
+        context_pop: ExecutionContext = istack.Pop()
+        rvcount = context_pop._RVCount
 
-            elif opcode == TUCK:
-                estack.Insert(2, estack.Peek())
-                if not self.CheckStackSize(True):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+        if rvcount == -1:
+            rvcount = context_pop.EvaluationStack.Count
 
-            elif opcode == CAT:
+        if rvcount > 0:
+            if context_pop.EvaluationStack.Count < rvcount:
+                return self.VM_FAULT_and_report(VMFault.UNKNOWN1)
 
-                x2 = estack.Pop().GetByteArray()
-                x1 = estack.Pop().GetByteArray()
-                if not self.CheckMaxItemSize(len(x1) + len(x2)):
-                    return self.VM_FAULT_and_report(VMFault.CAT_EXCEED_MAXITEMSIZE)
-                estack.PushT(x1 + x2)
-                self.CheckStackSize(True, -1)
+            if istack.Count == 0:
+                stack_eval = self._ResultStack
+            else:
+                stack_eval = self.CurrentContext.EvaluationStack
+            context_pop.EvaluationStack.CopyTo(stack_eval, rvcount)
 
-            elif opcode == SUBSTR:
+        if context_pop._RVCount == -1 and istack.Count > 0:
+            context_pop.AltStack.CopyTo(self.CurrentContext.AltStack)
 
-                count = estack.Pop().GetBigInteger()
-                if count < 0:
-                    return self.VM_FAULT_and_report(VMFault.SUBSTR_INVALID_LENGTH)
+        self.CheckStackSize(False, 0)
 
-                index = estack.Pop().GetBigInteger()
-                if index < 0:
-                    return self.VM_FAULT_and_report(VMFault.SUBSTR_INVALID_INDEX)
+        if istack.Count == 0:
+            self._VMState = VMState.HALT
+        return True
 
-                x = estack.Pop().GetByteArray()
+    def _Op_APPCALL(self, context, instruction, estack):
+        return self._AppCall(context, instruction, estack, False)
 
-                estack.PushT(x[index:count + index])
-                self.CheckStackSize(True, -2)
+    def _Op_TAILCALL(self, context, instruction, estack):
+        return self._AppCall(context, instruction, estack, True)
 
-            elif opcode == LEFT:
+    def _AppCall(self, context, instruction, estack, tail_call):
+        istack = self._InvocationStack
+        if self._Table is None:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN2)
 
-                count = estack.Pop().GetBigInteger()
-                if count < 0:
-                    return self.VM_FAULT_and_report(VMFault.LEFT_INVALID_COUNT)
+        if not tail_call and not self.CheckMaxInvocationStack():
+            return self.VM_FAULT_and_report(VMFault.APPCALL_EXCEED_MAX_INVOCATIONSTACK_SIZE)
 
-                x = estack.Pop().GetByteArray()
+        script_hash = instruction.Operand
 
-                if count >= len(x):
-                    estack.PushT(x)
-                else:
-                    estack.PushT(x[:count])
-                self.CheckStackSize(True, -1)
+        is_normal_call = False
+        for b in script_hash:
+            if b > 0:
+                is_normal_call = True
+                break
 
-            elif opcode == RIGHT:
+        if not is_normal_call:
+            script_hash = estack.Pop().GetByteArray()
 
-                count = estack.Pop().GetBigInteger()
-                if count < 0:
-                    return self.VM_FAULT_and_report(VMFault.RIGHT_INVALID_COUNT)
+        context_new = self._LoadScriptByHash(script_hash)
+        if context_new is None:
+            return self.VM_FAULT_and_report(VMFault.INVALID_CONTRACT, script_hash)
 
-                x = estack.Pop().GetByteArray()
-                if count > len(x):
-                    return self.VM_FAULT_and_report(VMFault.RIGHT_UNKNOWN)
+        estack.CopyTo(context_new.EvaluationStack)
 
-                if count == len(x):
-                    estack.PushT(x)
-                else:
-                    offset = len(x) - count
-                    estack.PushT(x[offset:offset + count])
-                self.CheckStackSize(True, -1)
+        if tail_call:
+            istack.Remove(1)
+        else:
+            estack.Clear()
 
-            elif opcode == SIZE:
+        self.CheckStackSize(False, 0)
 
-                x = estack.Pop()
-                estack.PushT(x.GetByteLength())
+    def _Op_SYSCALL(self, context, instruction, estack):
+        if len(instruction.Operand) > 252:
+            return False
 
-            elif opcode == INVERT:
+        if not self._Service.Invoke(instruction.InteropId, self):
+            return self.VM_FAULT_and_report(VMFault.SYSCALL_ERROR, instruction.Operand)
 
-                x = estack.Pop().GetBigInteger()
-                estack.PushT(~x)
+        if not self.CheckStackSize(False, int_MaxValue):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == AND:
+    # stack operations
+    def _Op_DUPFROMALTSTACK(self, context, instruction, estack):
+        astack = context._AltStack
+        estack.PushT(astack.Peek())
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                estack.PushT(x1 & x2)
-                self.CheckStackSize(True, -1)
+    def _Op_TOALTSTACK(self, context, instruction, estack):
+        astack = context._AltStack
+        astack.PushT(estack.Pop())
 
-            elif opcode == OR:
+    def _Op_FROMALTSTACK(self, context, instruction, estack):
+        astack = context._AltStack
+        estack.PushT(astack.Pop())
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+    def _Op_XDROP(self, context, instruction, estack):
+        n = estack.Pop().GetBigInteger()
+        if n < 0:
+            self._VMState = VMState.FAULT
+            return False
+        estack.Remove(n)
+        self.CheckStackSize(False, -2)
 
-                estack.PushT(x1 | x2)
-                self.CheckStackSize(True, -1)
+    def _Op_XSWAP(self, context, instruction, estack):
+        n = estack.Pop().GetBigInteger()
 
-            elif opcode == XOR:
+        if n < 0:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN3)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(x1 ^ x2)
-                self.CheckStackSize(True, -1)
+        # if n == 0 break, same as do x if n > 0
+        if n > 0:
+            item = estack.Peek(n)
+            estack.Set(n, estack.Peek())
+            estack.Set(0, item)
 
-            elif opcode == EQUAL:
-                x2 = estack.Pop()
-                x1 = estack.Pop()
-                estack.PushT(x1.Equals(x2))
-                self.CheckStackSize(False, -1)
+    def _Op_XTUCK(self, context, instruction, estack):
+        n = estack.Pop().GetBigInteger()
 
-            # numeric
-            elif opcode == INC:
+        if n <= 0:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN4)
 
-                x = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x) or not self.CheckBigInteger(x + 1):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
-                estack.PushT(x + 1)
+        estack.Insert(n, estack.Peek())
 
-            elif opcode == DEC:
+    def _Op_DEPTH(self, context, instruction, estack):
+        estack.PushT(estack.Count)
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                x = estack.Pop().GetBigInteger()  # type: BigInteger
-                if not self.CheckBigInteger(x) or (x.Sign <= 0 and not self.CheckBigInteger(x - 1)):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_DROP(self, context, instruction, estack):
+        estack.Pop()
+        self.CheckStackSize(False, -1)
 
-                estack.PushT(x - 1)
+    def _Op_DUP(self, context, instruction, estack):
+        estack.PushT(estack.Peek())
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == SIGN:
+    def _Op_NIP(self, context, instruction, estack):
+        estack.Remove(1)
+        self.CheckStackSize(False, -1)
 
-                # Make sure to implement sign for big integer
-                x = estack.Pop().GetBigInteger()
+    def _Op_OVER(self, context, instruction, estack):
+        estack.PushT(estack.Peek(1))
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                estack.PushT(x.Sign)
+    def _Op_PICK(self, context, instruction, estack):
+        n = estack.Pop().GetBigInteger()
+        if n < 0:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN5)
 
-            elif opcode == NEGATE:
+        estack.PushT(estack.Peek(n))
 
-                x = estack.Pop().GetBigInteger()
+    def _Op_ROLL(self, context, instruction, estack):
+        n = estack.Pop().GetBigInteger()
+        if n < 0:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN6)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(-x)
+        if n > 0:
+            estack.PushT(estack.Remove(n))
 
-            elif opcode == ABS:
+    def _Op_ROT(self, context, instruction, estack):
+        estack.PushT(estack.Remove(2))
 
-                x = estack.Pop().GetBigInteger()
+    def _Op_SWAP(self, context, instruction, estack):
+        estack.PushT(estack.Remove(1))
 
-                estack.PushT(abs(x))
+    def _Op_TUCK(self, context, instruction, estack):
+        estack.Insert(2, estack.Peek())
+        if not self.CheckStackSize(True):
+            return self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == NOT:
+    def _Op_CAT(self, context, instruction, estack):
+        x2 = estack.Pop().GetByteArray()
+        x1 = estack.Pop().GetByteArray()
+        if not self.CheckMaxItemSize(len(x1) + len(x2)):
+            return self.VM_FAULT_and_report(VMFault.CAT_EXCEED_MAXITEMSIZE)
+        estack.PushT(x1 + x2)
+        self.CheckStackSize(True, -1)
 
-                x = estack.Pop().GetBoolean()
-                estack.PushT(not x)
-                self.CheckStackSize(False, 0)
+    def _Op_SUBSTR(self, context, instruction, estack):
+        count = estack.Pop().GetBigInteger()
+        if count < 0:
+            return self.VM_FAULT_and_report(VMFault.SUBSTR_INVALID_LENGTH)
 
-            elif opcode == NZ:
+        index = estack.Pop().GetBigInteger()
+        if index < 0:
+            return self.VM_FAULT_and_report(VMFault.SUBSTR_INVALID_INDEX)
 
-                x = estack.Pop().GetBigInteger()
+        x = estack.Pop().GetByteArray()
 
-                estack.PushT(x is not 0)
+        estack.PushT(x[index:count + index])
+        self.CheckStackSize(True, -2)
 
-            elif opcode == ADD:
+    def _Op_LEFT(self, context, instruction, estack):
+        count = estack.Pop().GetBigInteger()
+        if count < 0:
+            return self.VM_FAULT_and_report(VMFault.LEFT_INVALID_COUNT)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x1) or not self.CheckBigInteger(x2) or not self.CheckBigInteger(x1 + x2):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+        x = estack.Pop().GetByteArray()
 
-                estack.PushT(x1 + x2)
-                self.CheckStackSize(True, -1)
+        if count >= len(x):
+            estack.PushT(x)
+        else:
+            estack.PushT(x[:count])
+        self.CheckStackSize(True, -1)
 
-            elif opcode == SUB:
+    def _Op_RIGHT(self, context, instruction, estack):
+        count = estack.Pop().GetBigInteger()
+        if count < 0:
+            return self.VM_FAULT_and_report(VMFault.RIGHT_INVALID_COUNT)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x1) or not self.CheckBigInteger(x2) or not self.CheckBigInteger(x1 - x2):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+        x = estack.Pop().GetByteArray()
+        if count > len(x):
+            return self.VM_FAULT_and_report(VMFault.RIGHT_UNKNOWN)
 
-                estack.PushT(x1 - x2)
-                self.CheckStackSize(True, -1)
+        if count == len(x):
+            estack.PushT(x)
+        else:
+            offset = len(x) - count
+            estack.PushT(x[offset:offset + count])
+        self.CheckStackSize(True, -1)
 
-            elif opcode == MUL:
+    def _Op_SIZE(self, context, instruction, estack):
+        x = estack.Pop()
+        estack.PushT(x.GetByteLength())
 
-                x2 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x2):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_INVERT(self, context, instruction, estack):
+        x = estack.Pop().GetBigInteger()
+        estack.PushT(~x)
 
-                x1 = estack.Pop().GetBigInteger()  # type: BigInteger
-                if not self.CheckBigInteger(x1):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_AND(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-                result = x1 * x2
-                if not self.CheckBigInteger(result):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+        estack.PushT(x1 & x2)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(result)
-                self.CheckStackSize(True, -1)
+    def _Op_OR(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-            elif opcode == DIV:
+        estack.PushT(x1 | x2)
+        self.CheckStackSize(True, -1)
 
-                x2 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x2):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_XOR(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-                x1 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x1) or not self.CheckBigInteger(x2):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+        estack.PushT(x1 ^ x2)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(x1 / x2)
-                self.CheckStackSize(True, -1)
+    def _Op_EQUAL(self, context, instruction, estack):
+        x2 = estack.Pop()
+        x1 = estack.Pop()
+        estack.PushT(x1.Equals(x2))
+        self.CheckStackSize(False, -1)
 
-            elif opcode == MOD:
+    # numeric
+    def _Op_INC(self, context, instruction, estack):
+        x = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x) or not self.CheckBigInteger(x + 1):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+        estack.PushT(x + 1)
 
-                x2 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x2):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_DEC(self, context, instruction, estack):
+        x = estack.Pop().GetBigInteger()  # type: BigInteger
+        if not self.CheckBigInteger(x) or (x.Sign <= 0 and not self.CheckBigInteger(x - 1)):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                x1 = estack.Pop().GetBigInteger()
-                if not self.CheckBigInteger(x1):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+        estack.PushT(x - 1)
 
-                estack.PushT(x1 % x2)
-                self.CheckStackSize(True, -1)
+    def _Op_SIGN(self, context, instruction, estack):
+        # Make sure to implement sign for big integer
+        x = estack.Pop().GetBigInteger()
 
-            elif opcode == SHL:
+        estack.PushT(x.Sign)
 
-                shift = estack.Pop().GetBigInteger()
-                if not self.CheckShift(shift):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_SHIFT)
+    def _Op_NEGATE(self, context, instruction, estack):
+        x = estack.Pop().GetBigInteger()
 
-                x = estack.Pop().GetBigInteger()
+        estack.PushT(-x)
 
-                if not self.CheckBigInteger(x):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_ABS(self, context, instruction, estack):
+        x = estack.Pop().GetBigInteger()
 
-                x = x << shift
+        estack.PushT(abs(x))
 
-                if not self.CheckBigInteger(x):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_NOT(self, context, instruction, estack):
+        x = estack.Pop().GetBoolean()
+        estack.PushT(not x)
+        self.CheckStackSize(False, 0)
 
-                estack.PushT(x)
-                self.CheckStackSize(True, -1)
+    def _Op_NZ(self, context, instruction, estack):
+        x = estack.Pop().GetBigInteger()
 
-            elif opcode == SHR:
+        estack.PushT(x is not 0)
 
-                shift = estack.Pop().GetBigInteger()
-                if not self.CheckShift(shift):
-                    return self.VM_FAULT_and_report(VMFault.INVALID_SHIFT)
+    def _Op_ADD(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x1) or not self.CheckBigInteger(x2) or not self.CheckBigInteger(x1 + x2):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                x = estack.Pop().GetBigInteger()
+        estack.PushT(x1 + x2)
+        self.CheckStackSize(True, -1)
 
-                if not self.CheckBigInteger(x):
-                    return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
+    def _Op_SUB(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x1) or not self.CheckBigInteger(x2) or not self.CheckBigInteger(x1 - x2):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                estack.PushT(x >> shift)
-                self.CheckStackSize(True, -1)
+        estack.PushT(x1 - x2)
+        self.CheckStackSize(True, -1)
 
-            elif opcode == BOOLAND:
+    def _Op_MUL(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x2):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                x2 = estack.Pop().GetBoolean()
-                x1 = estack.Pop().GetBoolean()
+        x1 = estack.Pop().GetBigInteger()  # type: BigInteger
+        if not self.CheckBigInteger(x1):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                estack.PushT(x1 and x2)
-                self.CheckStackSize(False, -1)
+        result = x1 * x2
+        if not self.CheckBigInteger(result):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-            elif opcode == BOOLOR:
+        estack.PushT(result)
+        self.CheckStackSize(True, -1)
 
-                x2 = estack.Pop().GetBoolean()
-                x1 = estack.Pop().GetBoolean()
+    def _Op_DIV(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x2):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                estack.PushT(x1 or x2)
-                self.CheckStackSize(False, -1)
+        x1 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x1) or not self.CheckBigInteger(x2):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-            elif opcode == NUMEQUAL:
+        estack.PushT(x1 / x2)
+        self.CheckStackSize(True, -1)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+    def _Op_MOD(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x2):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                estack.PushT(x2 == x1)
-                self.CheckStackSize(True, -1)
+        x1 = estack.Pop().GetBigInteger()
+        if not self.CheckBigInteger(x1):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-            elif opcode == NUMNOTEQUAL:
+        estack.PushT(x1 % x2)
+        self.CheckStackSize(True, -1)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+    def _Op_SHL(self, context, instruction, estack):
+        shift = estack.Pop().GetBigInteger()
+        if not self.CheckShift(shift):
+            return self.VM_FAULT_and_report(VMFault.INVALID_SHIFT)
 
-                estack.PushT(x1 != x2)
-                self.CheckStackSize(True, -1)
+        x = estack.Pop().GetBigInteger()
 
-            elif opcode == LT:
+        if not self.CheckBigInteger(x):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+        x = x << shift
 
-                estack.PushT(x1 < x2)
-                self.CheckStackSize(True, -1)
+        if not self.CheckBigInteger(x):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-            elif opcode == GT:
+        estack.PushT(x)
+        self.CheckStackSize(True, -1)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+    def _Op_SHR(self, context, instruction, estack):
+        shift = estack.Pop().GetBigInteger()
+        if not self.CheckShift(shift):
+            return self.VM_FAULT_and_report(VMFault.INVALID_SHIFT)
 
-                estack.PushT(x1 > x2)
-                self.CheckStackSize(True, -1)
+        x = estack.Pop().GetBigInteger()
 
-            elif opcode == LTE:
+        if not self.CheckBigInteger(x):
+            return self.VM_FAULT_and_report(VMFault.BIGINTEGER_EXCEED_LIMIT)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+        estack.PushT(x >> shift)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(x1 <= x2)
-                self.CheckStackSize(True, -1)
+    def _Op_BOOLAND(self, context, instruction, estack):
+        x2 = estack.Pop().GetBoolean()
+        x1 = estack.Pop().GetBoolean()
 
-            elif opcode == GTE:
+        estack.PushT(x1 and x2)
+        self.CheckStackSize(False, -1)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+    def _Op_BOOLOR(self, context, instruction, estack):
+        x2 = estack.Pop().GetBoolean()
+        x1 = estack.Pop().GetBoolean()
 
-                estack.PushT(x1 >= x2)
-                self.CheckStackSize(True, -1)
+        estack.PushT(x1 or x2)
+        self.CheckStackSize(False, -1)
 
-            elif opcode == MIN:
+    def _Op_NUMEQUAL(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+        estack.PushT(x2 == x1)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(min(x1, x2))
-                self.CheckStackSize(True, -1)
+    def _Op_NUMNOTEQUAL(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-            elif opcode == MAX:
+        estack.PushT(x1 != x2)
+        self.CheckStackSize(True, -1)
 
-                x2 = estack.Pop().GetBigInteger()
-                x1 = estack.Pop().GetBigInteger()
+    def _Op_LT(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-                estack.PushT(max(x1, x2))
-                self.CheckStackSize(True, -1)
+        estack.PushT(x1 < x2)
+        self.CheckStackSize(True, -1)
 
-            elif opcode == WITHIN:
+    def _Op_GT(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-                b = estack.Pop().GetBigInteger()
-                a = estack.Pop().GetBigInteger()
-                x = estack.Pop().GetBigInteger()
+        estack.PushT(x1 > x2)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(a <= x and x < b)
-                self.CheckStackSize(True, -2)
+    def _Op_LTE(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-            # CRyPTO
-            elif opcode == SHA1:
-                h = hashlib.sha1(estack.Pop().GetByteArray())
-                estack.PushT(h.digest())
+        estack.PushT(x1 <= x2)
+        self.CheckStackSize(True, -1)
 
-            elif opcode == SHA256:
-                h = hashlib.sha256(estack.Pop().GetByteArray())
-                estack.PushT(h.digest())
+    def _Op_GTE(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-            elif opcode == HASH160:
+        estack.PushT(x1 >= x2)
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(self.Crypto.Hash160(estack.Pop().GetByteArray()))
+    def _Op_MIN(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-            elif opcode == HASH256:
+        estack.PushT(min(x1, x2))
+        self.CheckStackSize(True, -1)
 
-                estack.PushT(self.Crypto.Hash256(estack.Pop().GetByteArray()))
+    def _Op_MAX(self, context, instruction, estack):
+        x2 = estack.Pop().GetBigInteger()
+        x1 = estack.Pop().GetBigInteger()
 
-            elif opcode == CHECKSIG:
+        estack.PushT(max(x1, x2))
+        self.CheckStackSize(True, -1)
 
-                pubkey = estack.Pop().GetByteArray()
-                sig = estack.Pop().GetByteArray()
-                container = self.ScriptContainer
-                if not container:
-                    logger.debug("Cannot check signature without container")
-                    estack.PushT(False)
-                    return
-                try:
-                    res = self.Crypto.VerifySignature(container.GetMessage(), sig, pubkey)
-                    estack.PushT(res)
-                except Exception as e:
-                    estack.PushT(False)
-                    logger.debug("Could not checksig: %s " % e)
-                self.CheckStackSize(True, -1)
+    def _Op_WITHIN(self, context, instruction, estack):
+        b = estack.Pop().GetBigInteger()
+        a = estack.Pop().GetBigInteger()
+        x = estack.Pop().GetBigInteger()
 
-            elif opcode == VERIFY:
-                pubkey = estack.Pop().GetByteArray()
-                sig = estack.Pop().GetByteArray()
-                message = estack.Pop().GetByteArray()
-                try:
-                    res = self.Crypto.VerifySignature(message, sig, pubkey, unhex=False)
-                    estack.PushT(res)
-                except Exception as e:
-                    estack.PushT(False)
-                    logger.debug("Could not verify: %s " % e)
-                self.CheckStackSize(True, -2)
+        estack.PushT(a <= x and x < b)
+        self.CheckStackSize(True, -2)
 
-            elif opcode == CHECKMULTISIG:
-                item = estack.Pop()
-                pubkeys = []
+    # crypto
+    def _Op_SHA1(self, context, instruction, estack):
+        h = hashlib.sha1(estack.Pop().GetByteArray())
+        estack.PushT(h.digest())
 
-                if isinstance(item, Array):
+    def _Op_SHA256(self, context, instruction, estack):
+        h = hashlib.sha256(estack.Pop().GetByteArray())
+        estack.PushT(h.digest())
 
-                    for p in item.GetArray():
-                        pubkeys.append(p.GetByteArray())
-                    n = len(pubkeys)
-                    if n == 0:
-                        return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_INVALID_PUBLICKEY_COUNT)
+    def _Op_HASH160(self, context, instruction, estack):
+        estack.PushT(self.Crypto.Hash160(estack.Pop().GetByteArray()))
 
-                    self.CheckStackSize(False, -1)
-                else:
-                    n = item.GetBigInteger()
+    def _Op_HASH256(self, context, instruction, estack):
+        estack.PushT(self.Crypto.Hash256(estack.Pop().GetByteArray()))
 
-                    if n < 1 or n > estack.Count:
-                        return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_INVALID_PUBLICKEY_COUNT)
+    def _Op_CHECKSIG(self, context, instruction, estack):
+        pubkey = estack.Pop().GetByteArray()
+        sig = estack.Pop().GetByteArray()
+        container = self.ScriptContainer
+        if not container:
+            logger.debug("Cannot check signature without container")
+            estack.PushT(False)
+            return False
+        try:
+            res = self.Crypto.VerifySignature(container.GetMessage(), sig, pubkey)
+            estack.PushT(res)
+        except Exception as e:
+            estack.PushT(False)
+            logger.debug("Could not checksig: %s " % e)
+        self.CheckStackSize(True, -1)
+
+    def _Op_VERIFY(self, context, instruction, estack):
+        pubkey = estack.Pop().GetByteArray()
+        sig = estack.Pop().GetByteArray()
+        message = estack.Pop().GetByteArray()
+        try:
+            res = self.Crypto.VerifySignature(message, sig, pubkey, unhex=False)
+            estack.PushT(res)
+        except Exception as e:
+            estack.PushT(False)
+            logger.debug("Could not verify: %s " % e)
+        self.CheckStackSize(True, -2)
+
+    def _Op_CHECKMULTISIG(self, context, instruction, estack):
+        item = estack.Pop()
+        pubkeys = []
+
+        if isinstance(item, Array):
+
+            for p in item.GetArray():
+                pubkeys.append(p.GetByteArray())
+            n = len(pubkeys)
+            if n == 0:
+                return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_INVALID_PUBLICKEY_COUNT)
+
+            self.CheckStackSize(False, -1)
+        else:
+            n = item.GetBigInteger()
 
-                    for i in range(0, n):
-                        pubkeys.append(estack.Pop().GetByteArray())
-                    self.CheckStackSize(True, -n - 1)
+            if n < 1 or n > estack.Count:
+                return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_INVALID_PUBLICKEY_COUNT)
 
-                item = estack.Pop()
-                sigs = []
+            for i in range(0, n):
+                pubkeys.append(estack.Pop().GetByteArray())
+            self.CheckStackSize(True, -n - 1)
 
-                if isinstance(item, Array):
-                    for s in item.GetArray():
-                        sigs.append(s.GetByteArray())
-                    m = len(sigs)
+        item = estack.Pop()
+        sigs = []
 
-                    if m == 0 or m > n:
-                        return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_SIGNATURE_ERROR, m, n)
-                    self.CheckStackSize(False, -1)
-                else:
-                    m = item.GetBigInteger()
+        if isinstance(item, Array):
+            for s in item.GetArray():
+                sigs.append(s.GetByteArray())
+            m = len(sigs)
 
-                    if m < 1 or m > n or m > estack.Count:
-                        return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_SIGNATURE_ERROR, m, n)
+            if m == 0 or m > n:
+                return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_SIGNATURE_ERROR, m, n)
+            self.CheckStackSize(False, -1)
+        else:
+            m = item.GetBigInteger()
 
-                    for i in range(0, m):
-                        sigs.append(estack.Pop().GetByteArray())
-                    self.CheckStackSize(True, -m - 1)
+            if m < 1 or m > n or m > estack.Count:
+                return self.VM_FAULT_and_report(VMFault.CHECKMULTISIG_SIGNATURE_ERROR, m, n)
 
-                message = self.ScriptContainer.GetMessage() if self.ScriptContainer else ''
+            for i in range(0, m):
+                sigs.append(estack.Pop().GetByteArray())
+            self.CheckStackSize(True, -m - 1)
 
-                fSuccess = True
+        message = self.ScriptContainer.GetMessage() if self.ScriptContainer else ''
 
-                try:
+        fSuccess = True
 
-                    i = 0
-                    j = 0
+        try:
 
-                    while fSuccess and i < m and j < n:
+            i = 0
+            j = 0
 
-                        if self.Crypto.VerifySignature(message, sigs[i], pubkeys[j]):
-                            i += 1
-                        j += 1
+            while fSuccess and i < m and j < n:
 
-                        if m - i > n - j:
-                            fSuccess = False
+                if self.Crypto.VerifySignature(message, sigs[i], pubkeys[j]):
+                    i += 1
+                j += 1
 
-                except Exception as e:
+                if m - i > n - j:
                     fSuccess = False
 
-                estack.PushT(fSuccess)
-
-            # lists
-            elif opcode == ARRAYSIZE:
+        except Exception as e:
+            fSuccess = False
 
-                item = estack.Pop()
+        estack.PushT(fSuccess)
 
-                if not item:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN7)
+    # lists
+    def _Op_ARRAYSIZE(self, context, instruction, estack):
+        item = estack.Pop()
 
-                if isinstance(item, CollectionMixin):
-                    estack.PushT(item.Count)
-                    self.CheckStackSize(False, 0)
+        if not item:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN7)
 
-                else:
-                    estack.PushT(len(item.GetByteArray()))
-                    self.CheckStackSize(True, 0)
+        if isinstance(item, CollectionMixin):
+            estack.PushT(item.Count)
+            self.CheckStackSize(False, 0)
 
-            elif opcode == PACK:
+        else:
+            estack.PushT(len(item.GetByteArray()))
+            self.CheckStackSize(True, 0)
 
-                size = estack.Pop().GetBigInteger()
+    def _Op_PACK(self, context, instruction, estack):
+        size = estack.Pop().GetBigInteger()
 
-                if size < 0 or size > estack.Count or not self.CheckArraySize(size):
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN8)
+        if size < 0 or size > estack.Count or not self.CheckArraySize(size):
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN8)
 
-                items = []
+        items = []
 
-                for i in range(0, size):
-                    topack = estack.Pop()
-                    items.append(topack)
+        for i in range(0, size):
+            topack = estack.Pop()
+            items.append(topack)
 
-                estack.PushT(items)
+        estack.PushT(items)
 
-            elif opcode == UNPACK:
-                item = estack.Pop()
+    def _Op_UNPACK(self, context, instruction, estack):
+        item = estack.Pop()
 
-                if not isinstance(item, Array):
-                    return self.VM_FAULT_and_report(VMFault.UNPACK_INVALID_TYPE, item)
+        if not isinstance(item, Array):
+            return self.VM_FAULT_and_report(VMFault.UNPACK_INVALID_TYPE, item)
 
-                items = item.GetArray()
-                items.reverse()
+        items = item.GetArray()
+        items.reverse()
 
-                [estack.PushT(i) for i in items]
+        [estack.PushT(i) for i in items]
 
-                estack.PushT(len(items))
-                if not self.CheckStackSize(False, len(items)):
-                    self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+        estack.PushT(len(items))
+        if not self.CheckStackSize(False, len(items)):
+            self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == PICKITEM:
+    def _Op_PICKITEM(self, context, instruction, estack):
+        key = estack.Pop()
 
-                key = estack.Pop()
+        if isinstance(key, CollectionMixin):
+            # key must be an array index or dictionary key, but not a collection
+            return self.VM_FAULT_and_report(VMFault.KEY_IS_COLLECTION, key)
 
-                if isinstance(key, CollectionMixin):
-                    # key must be an array index or dictionary key, but not a collection
-                    return self.VM_FAULT_and_report(VMFault.KEY_IS_COLLECTION, key)
+        collection = estack.Pop()
 
-                collection = estack.Pop()
+        if isinstance(collection, Array):
+            index = key.GetBigInteger()
+            if index < 0 or index >= collection.Count:
+                return self.VM_FAULT_and_report(VMFault.PICKITEM_INVALID_INDEX, index, collection.Count)
 
-                if isinstance(collection, Array):
-                    index = key.GetBigInteger()
-                    if index < 0 or index >= collection.Count:
-                        return self.VM_FAULT_and_report(VMFault.PICKITEM_INVALID_INDEX, index, collection.Count)
+            items = collection.GetArray()
+            to_pick = items[index]
+            estack.PushT(to_pick)
 
-                    items = collection.GetArray()
-                    to_pick = items[index]
-                    estack.PushT(to_pick)
+            if not self.CheckStackSize(False, -1):
+                self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                    if not self.CheckStackSize(False, -1):
-                        self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+        elif isinstance(collection, Map):
+            success, value = collection.TryGetValue(key)
 
-                elif isinstance(collection, Map):
-                    success, value = collection.TryGetValue(key)
+            if success:
+                estack.PushT(value)
 
-                    if success:
-                        estack.PushT(value)
+                if not self.CheckStackSize(False, -1):
+                    self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                        if not self.CheckStackSize(False, -1):
-                            self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+            else:
+                return self.VM_FAULT_and_report(VMFault.DICT_KEY_NOT_FOUND, key, collection.Keys)
+        else:
+            return self.VM_FAULT_and_report(VMFault.PICKITEM_INVALID_TYPE, key, collection)
 
-                    else:
-                        return self.VM_FAULT_and_report(VMFault.DICT_KEY_NOT_FOUND, key, collection.Keys)
-                else:
-                    return self.VM_FAULT_and_report(VMFault.PICKITEM_INVALID_TYPE, key, collection)
+    def _Op_SETITEM(self, context, instruction, estack):
+        value = estack.Pop()
 
-            elif opcode == SETITEM:
-                value = estack.Pop()
+        if isinstance(value, Struct):
+            value = value.Clone()
 
-                if isinstance(value, Struct):
-                    value = value.Clone()
+        key = estack.Pop()
 
-                key = estack.Pop()
+        if isinstance(key, CollectionMixin):
+            return self.VM_FAULT_and_report(VMFault.KEY_IS_COLLECTION)
 
-                if isinstance(key, CollectionMixin):
-                    return self.VM_FAULT_and_report(VMFault.KEY_IS_COLLECTION)
+        collection = estack.Pop()
 
-                collection = estack.Pop()
+        if isinstance(collection, Array):
 
-                if isinstance(collection, Array):
+            index = key.GetBigInteger()
 
-                    index = key.GetBigInteger()
+            if index < 0 or index >= collection.Count:
+                return self.VM_FAULT_and_report(VMFault.SETITEM_INVALID_INDEX)
 
-                    if index < 0 or index >= collection.Count:
-                        return self.VM_FAULT_and_report(VMFault.SETITEM_INVALID_INDEX)
+            items = collection.GetArray()
+            items[index] = value
 
-                    items = collection.GetArray()
-                    items[index] = value
+        elif isinstance(collection, Map):
+            if not collection.ContainsKey(key) and not self.CheckArraySize(collection.Count + 1):
+                return self.VM_FAULT_and_report(VMFault.SETITEM_INVALID_MAP)
 
-                elif isinstance(collection, Map):
-                    if not collection.ContainsKey(key) and not self.CheckArraySize(collection.Count + 1):
-                        return self.VM_FAULT_and_report(VMFault.SETITEM_INVALID_MAP)
+            collection.SetItem(key, value)
 
-                    collection.SetItem(key, value)
+        else:
+            return self.VM_FAULT_and_report(VMFault.SETITEM_INVALID_TYPE, key, collection)
 
-                else:
-                    return self.VM_FAULT_and_report(VMFault.SETITEM_INVALID_TYPE, key, collection)
+        if not self.CheckStackSize(False, int_MaxValue):
+            self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                if not self.CheckStackSize(False, int_MaxValue):
-                    self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+    def _Op_NEWARRAY(self, context, instruction, estack):
+        return self._NewArray(estack, False)
 
-            elif opcode in [NEWARRAY, NEWSTRUCT]:
-                item = estack.Pop()
-                if isinstance(item, Array):
-                    result = None
-                    if isinstance(item, Struct):
-                        if opcode == NEWSTRUCT:
-                            result = item
-                    else:
-                        if opcode == NEWARRAY:
-                            result = item
+    def _Op_NEWSTRUCT(self, context, instruction, estack):
+        return self._NewArray(estack, True)
 
-                    if result is None:
-                        result = Array(item) if opcode == NEWARRAY else Struct(item)
+    def _NewArray(self, estack, struct):
+        item = estack.Pop()
+        if isinstance(item, Array):
+            result = None
+            if isinstance(item, Struct):
+                if struct:
+                    result = item
+            else:
+                if not struct:
+                    result = item
 
-                    estack.PushT(result)
+            if result is None:
+                result = Struct(item) if struct else Array(item)
 
-                else:
-                    count = item.GetBigInteger()
-                    if count < 0:
-                        return self.VM_FAULT_and_report(VMFault.NEWARRAY_NEGATIVE_COUNT)
+            estack.PushT(result)
 
-                    if not self.CheckArraySize(count):
-                        return self.VM_FAULT_and_report(VMFault.NEWARRAY_EXCEED_ARRAYLIMIT)
+        else:
+            count = item.GetBigInteger()
+            if count < 0:
+                return self.VM_FAULT_and_report(VMFault.NEWARRAY_NEGATIVE_COUNT)
 
-                    items = [Boolean(False) for i in range(0, count)]
+            if not self.CheckArraySize(count):
+                return self.VM_FAULT_and_report(VMFault.NEWARRAY_EXCEED_ARRAYLIMIT)
 
-                    result = Array(items) if opcode == NEWARRAY else Struct(items)
+            items = [Boolean(False) for i in range(0, count)]
 
-                    estack.PushT(result)
+            result = Struct(items) if struct else Array(items)
 
-                    if not self.CheckStackSize(True, count):
-                        self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+            estack.PushT(result)
 
-            elif opcode == NEWMAP:
-                estack.PushT(Map())
-                if not self.CheckStackSize(True):
-                    self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+            if not self.CheckStackSize(True, count):
+                self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-            elif opcode == APPEND:
-                newItem = estack.Pop()
+    def _Op_NEWMAP(self, context, instruction, estack):
+        estack.PushT(Map())
+        if not self.CheckStackSize(True):
+            self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                if isinstance(newItem, Struct):
-                    newItem = newItem.Clone()
+    def _Op_APPEND(self, context, instruction, estack):
+        newItem = estack.Pop()
 
-                arrItem = estack.Pop()
+        if isinstance(newItem, Struct):
+            newItem = newItem.Clone()
 
-                if not isinstance(arrItem, Array):
-                    return self.VM_FAULT_and_report(VMFault.APPEND_INVALID_TYPE, arrItem)
+        arrItem = estack.Pop()
 
-                arr = arrItem.GetArray()
-                if not self.CheckArraySize(len(arr) + 1):
-                    return self.VM_FAULT_and_report(VMFault.APPEND_EXCEED_ARRAYLIMIT)
-                arr.append(newItem)
+        if not isinstance(arrItem, Array):
+            return self.VM_FAULT_and_report(VMFault.APPEND_INVALID_TYPE, arrItem)
 
-                if not self.CheckStackSize(False, int_MaxValue):
-                    self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+        arr = arrItem.GetArray()
+        if not self.CheckArraySize(len(arr) + 1):
+            return self.VM_FAULT_and_report(VMFault.APPEND_EXCEED_ARRAYLIMIT)
+        arr.append(newItem)
 
-            elif opcode == REVERSE:
+        if not self.CheckStackSize(False, int_MaxValue):
+            self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                arrItem = estack.Pop()
-                self.CheckStackSize(False, -1)
+    def _Op_REVERSE(self, context, instruction, estack):
+        arrItem = estack.Pop()
+        self.CheckStackSize(False, -1)
 
-                if not isinstance(arrItem, Array):
-                    return self.VM_FAULT_and_report(VMFault.REVERSE_INVALID_TYPE, arrItem)
+        if not isinstance(arrItem, Array):
+            return self.VM_FAULT_and_report(VMFault.REVERSE_INVALID_TYPE, arrItem)
 
-                arrItem.Reverse()
+        arrItem.Reverse()
 
-            elif opcode == REMOVE:
+    def _Op_REMOVE(self, context, instruction, estack):
+        key = estack.Pop()
 
-                key = estack.Pop()
+        if isinstance(key, CollectionMixin):
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN1)
 
-                if isinstance(key, CollectionMixin):
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN1)
+        collection = estack.Pop()
+        self.CheckStackSize(False, -2)
 
-                collection = estack.Pop()
-                self.CheckStackSize(False, -2)
+        if isinstance(collection, Array):
 
-                if isinstance(collection, Array):
+            index = key.GetBigInteger()
 
-                    index = key.GetBigInteger()
+            if index < 0 or index >= collection.Count:
+                return self.VM_FAULT_and_report(VMFault.REMOVE_INVALID_INDEX, index, collection.Count)
 
-                    if index < 0 or index >= collection.Count:
-                        return self.VM_FAULT_and_report(VMFault.REMOVE_INVALID_INDEX, index, collection.Count)
+            collection.RemoveAt(index)
 
-                    collection.RemoveAt(index)
+        elif isinstance(collection, Map):
 
-                elif isinstance(collection, Map):
+            collection.Remove(key)
 
-                    collection.Remove(key)
+        else:
 
-                else:
+            return self.VM_FAULT_and_report(VMFault.REMOVE_INVALID_TYPE, key, collection)
 
-                    return self.VM_FAULT_and_report(VMFault.REMOVE_INVALID_TYPE, key, collection)
+    def _Op_HASKEY(self, context, instruction, estack):
+        key = estack.Pop()
 
-            elif opcode == HASKEY:
+        if isinstance(key, CollectionMixin):
+            return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
 
-                key = estack.Pop()
+        collection = estack.Pop()
 
-                if isinstance(key, CollectionMixin):
-                    return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
+        if isinstance(collection, Array):
 
-                collection = estack.Pop()
+            index = key.GetBigInteger()
 
-                if isinstance(collection, Array):
+            if index < 0:
+                return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
 
-                    index = key.GetBigInteger()
+            estack.PushT(index < collection.Count)
 
-                    if index < 0:
-                        return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
+        elif isinstance(collection, Map):
 
-                    estack.PushT(index < collection.Count)
+            estack.PushT(collection.ContainsKey(key))
 
-                elif isinstance(collection, Map):
+        else:
 
-                    estack.PushT(collection.ContainsKey(key))
+            return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
+        self.CheckStackSize(False, -1)
 
-                else:
+    def _Op_KEYS(self, context, instruction, estack):
+        collection = estack.Pop()
 
-                    return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
-                self.CheckStackSize(False, -1)
+        if isinstance(collection, Map):
 
-            elif opcode == KEYS:
+            estack.PushT(Array(collection.Keys))
+            if not self.CheckStackSize(False, collection.Count):
+                self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+        else:
+            return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
 
-                collection = estack.Pop()
+    def _Op_VALUES(self, context, instruction, estack):
+        collection = estack.Pop()
+        values = []
 
-                if isinstance(collection, Map):
+        if isinstance(collection, Map):
+            values = collection.Values
 
-                    estack.PushT(Array(collection.Keys))
-                    if not self.CheckStackSize(False, collection.Count):
-                        self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
-                else:
-                    return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
+        elif isinstance(collection, Array):
+            values = collection
 
-            elif opcode == VALUES:
+        else:
+            return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
 
-                collection = estack.Pop()
-                values = []
+        newArray = Array()
+        for item in values:
+            if isinstance(item, Struct):
+                newArray.Add(item.Clone())
+            else:
+                newArray.Add(item)
 
-                if isinstance(collection, Map):
-                    values = collection.Values
+        estack.PushT(newArray)
+        if not self.CheckStackSize(False, int_MaxValue):
+            self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
 
-                elif isinstance(collection, Array):
-                    values = collection
+    # stack isolation
+    def _Op_CALL_I(self, context, instruction, estack):
+        if not self.CheckMaxInvocationStack():
+            return self.VM_FAULT_and_report(VMFault.CALL__I_EXCEED_MAX_INVOCATIONSTACK_SIZE)
+        rvcount = instruction.Operand[0]
+        pcount = instruction.Operand[1]
 
-                else:
-                    return self.VM_FAULT_and_report(VMFault.DICT_KEY_ERROR)
+        if estack.Count < pcount:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION)
 
-                newArray = Array()
-                for item in values:
-                    if isinstance(item, Struct):
-                        newArray.Add(item.Clone())
-                    else:
-                        newArray.Add(item)
+        context_call = self._LoadScriptInternal(context.Script, rvcount)
+        context_call.InstructionPointer = instruction.JumpTarget
 
-                estack.PushT(newArray)
-                if not self.CheckStackSize(False, int_MaxValue):
-                    self.VM_FAULT_and_report(VMFault.INVALID_STACKSIZE)
+        if context_call.InstructionPointer < 0 or context_call.InstructionPointer > context_call.Script.Length:
+            return False
 
-            # stack isolation
-            elif opcode == CALL_I:
-                if not self.CheckMaxInvocationStack():
-                    return self.VM_FAULT_and_report(VMFault.CALL__I_EXCEED_MAX_INVOCATIONSTACK_SIZE)
-                rvcount = instruction.Operand[0]
-                pcount = instruction.Operand[1]
+        estack.CopyTo(context_call.EvaluationStack, pcount)
 
-                if estack.Count < pcount:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION)
+        for i in range(0, pcount, 1):
+            estack.Pop()
 
-                context_call = self._LoadScriptInternal(context.Script, rvcount)
-                context_call.InstructionPointer = context.InstructionPointer + instruction.TokenI16_1 + 2
+    def _Op_CALL_E(self, context, instruction, estack):
+        return self._CallExternal(context, instruction, estack, False, False)
 
-                if context_call.InstructionPointer < 0 or context_call.InstructionPointer > context_call.Script.Length:
-                    return False
+    def _Op_CALL_ED(self, context, instruction, estack):
+        return self._CallExternal(context, instruction, estack, True, False)
 
-                estack.CopyTo(context_call.EvaluationStack, pcount)
+    def _Op_CALL_ET(self, context, instruction, estack):
+        return self._CallExternal(context, instruction, estack, False, True)
 
-                for i in range(0, pcount, 1):
-                    estack.Pop()
+    def _Op_CALL_EDT(self, context, instruction, estack):
+        return self._CallExternal(context, instruction, estack, True, True)
 
-            elif opcode in [CALL_E, CALL_ED, CALL_ET, CALL_EDT]:
-                if self._Table is None:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION2)
+    def _CallExternal(self, context, instruction, estack, dynamic, tail_call):
+        istack = self._InvocationStack
+        if self._Table is None:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION2)
 
-                rvcount = instruction.Operand[0]
-                pcount = instruction.Operand[1]
+        rvcount = instruction.Operand[0]
+        pcount = instruction.Operand[1]
 
-                if estack.Count < pcount:
-                    return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION)
+        if estack.Count < pcount:
+            return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION)
 
-                if opcode in [CALL_ET, CALL_EDT]:
-                    if context._RVCount != rvcount:
-                        return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION3)
-                else:
-                    if not self.CheckMaxInvocationStack():
-                        return self.VM_FAULT_and_report(VMFault.UNKNOWN_EXCEED_MAX_INVOCATIONSTACK_SIZE)
+        if tail_call:
+            if context._RVCount != rvcount:
+                return self.VM_FAULT_and_report(VMFault.UNKNOWN_STACKISOLATION3)
+        else:
+            if not self.CheckMaxInvocationStack():
+                return self.VM_FAULT_and_report(VMFault.UNKNOWN_EXCEED_MAX_INVOCATIONSTACK_SIZE)
 
-                if opcode in [CALL_ED, CALL_EDT]:
-                    script_hash = estack.Pop().GetByteArray()
-                    self.CheckStackSize(True, -1)
-                else:
-                    script_hash = instruction.ReadBytes(2, 20)
+        if dynamic:
+            script_hash = estack.Pop().GetByteArray()
+            self.CheckStackSize(True, -1)
+        else:
+            script_hash = instruction.ReadBytes(2, 20)
 
-                context_new = self._LoadScriptByHash(script_hash, rvcount)
-                if context_new is None:
-                    return self.VM_FAULT_and_report(VMFault.INVALID_CONTRACT, script_hash)
+        context_new = self._LoadScriptByHash(script_hash, rvcount)
+        if context_new is None:
+            return self.VM_FAULT_and_report(VMFault.INVALID_CONTRACT, script_hash)
 
-                estack.CopyTo(context_new.EvaluationStack, pcount)
+        estack.CopyTo(context_new.EvaluationStack, pcount)
 
-                if opcode in [CALL_ET, CALL_EDT]:
-                    istack.Remove(1)
-                else:
-                    for i in range(0, pcount, 1):
-                        estack.Pop()
+        if tail_call:
+            istack.Remove(1)
+        else:
+            for i in range(0, pcount, 1):
+                estack.Pop()
 
-            elif opcode == THROW:
-                return self.VM_FAULT_and_report(VMFault.THROW)
+    def _Op_THROW(self, context, instruction, estack):
+        return self.VM_FAULT_and_report(VMFault.THROW)
 
-            elif opcode == THROWIFNOT:
-                if not estack.Pop().GetBoolean():
-                    return self.VM_FAULT_and_report(VMFault.THROWIFNOT)
-                self.CheckStackSize(False, -1)
+    def _Op_THROWIFNOT(self, context, instruction, estack):
+        if not estack.Pop().GetBoolean():
+            return self.VM_FAULT_and_report(VMFault.THROWIFNOT)
+        self.CheckStackSize(False, -1)
 
-            else:
-                return self.VM_FAULT_and_report(VMFault.UNKNOWN_OPCODE, opcode)
-        context.MoveNext()
-        return True
+    def _Op_UNKNOWN(self, context, instruction, estack):
+        return self.VM_FAULT_and_report(VMFault.UNKNOWN_OPCODE, instruction.OpCode)
 
     def LoadScript(self, script: bytearray, rvcount: int = -1) -> ExecutionContext:
         # "raw" bytes
@@ -1254,15 +1291,15 @@ class ExecutionEngine:
                 instruction = self.CurrentContext.CurrentInstruction
 
                 if self._is_write_log:
-                    if instruction.InstructionName == "SYSCALL":
+                    if instruction.OpCode == SYSCALL[0]:
                         if len(instruction.Operand) > 4:
                             call = instruction.Operand.decode('ascii')
                             self.write_log("{} {} {} {}".format(self.ops_processed, instruction.InstructionName, call, self.CurrentContext.InstructionPointer))
                         else:
                             self.write_log("{} {} {} {}".format(self.ops_processed, instruction.InstructionName, instruction.TokenU32,
                                                                 self.CurrentContext.InstructionPointer))
-                else:
-                    self.write_log("{} {} {}".format(self.ops_processed, instruction.InstructionName, self.CurrentContext.InstructionPointer))
+                    else:
+                        self.write_log("{} {} {}".format(self.ops_processed, instruction.InstructionName, self.CurrentContext.InstructionPointer))
 
                 if not self.PreExecuteInstruction():
                     self._VMState = VMState.FAULT
@@ -1362,3 +1399,108 @@ class ExecutionEngine:
             logger.debug("({}) {}".format(self.ops_processed, error_msg))
 
         return False
+
+
+def _build_dispatch_table():
+    table = [ExecutionEngine._Op_UNKNOWN] * 256
+
+    for op in range(PUSHBYTES1[0], PUSHDATA4[0] + 1):
+        table[op] = ExecutionEngine._Op_PUSHBYTES
+
+    for op in [PUSHM1, PUSH1, PUSH2, PUSH3, PUSH4, PUSH5, PUSH6, PUSH7, PUSH8,
+               PUSH9, PUSH10, PUSH11, PUSH12, PUSH13, PUSH14, PUSH15, PUSH16]:
+        table[op[0]] = ExecutionEngine._Op_PUSHNUMBER
+    table[PUSH0[0]] = ExecutionEngine._Op_PUSH0
+    table[NOP[0]] = ExecutionEngine._Op_NOP
+    table[JMP[0]] = ExecutionEngine._Op_JMP
+    table[JMPIF[0]] = ExecutionEngine._Op_JMPIF
+    table[JMPIFNOT[0]] = ExecutionEngine._Op_JMPIFNOT
+    table[CALL[0]] = ExecutionEngine._Op_CALL
+    table[RET[0]] = ExecutionEngine._Op_RET
+    table[APPCALL[0]] = ExecutionEngine._Op_APPCALL
+    table[TAILCALL[0]] = ExecutionEngine._Op_TAILCALL
+    table[SYSCALL[0]] = ExecutionEngine._Op_SYSCALL
+    table[DUPFROMALTSTACK[0]] = ExecutionEngine._Op_DUPFROMALTSTACK
+    table[TOALTSTACK[0]] = ExecutionEngine._Op_TOALTSTACK
+    table[FROMALTSTACK[0]] = ExecutionEngine._Op_FROMALTSTACK
+    table[XDROP[0]] = ExecutionEngine._Op_XDROP
+    table[XSWAP[0]] = ExecutionEngine._Op_XSWAP
+    table[XTUCK[0]] = ExecutionEngine._Op_XTUCK
+    table[DEPTH[0]] = ExecutionEngine._Op_DEPTH
+    table[DROP[0]] = ExecutionEngine._Op_DROP
+    table[DUP[0]] = ExecutionEngine._Op_DUP
+    table[NIP[0]] = ExecutionEngine._Op_NIP
+    table[OVER[0]] = ExecutionEngine._Op_OVER
+    table[PICK[0]] = ExecutionEngine._Op_PICK
+    table[ROLL[0]] = ExecutionEngine._Op_ROLL
+    table[ROT[0]] = ExecutionEngine._Op_ROT
+    table[SWAP[0]] = ExecutionEngine._Op_SWAP
+    table[TUCK[0]] = ExecutionEngine._Op_TUCK
+    table[CAT[0]] = ExecutionEngine._Op_CAT
+    table[SUBSTR[0]] = ExecutionEngine._Op_SUBSTR
+    table[LEFT[0]] = ExecutionEngine._Op_LEFT
+    table[RIGHT[0]] = ExecutionEngine._Op_RIGHT
+    table[SIZE[0]] = ExecutionEngine._Op_SIZE
+    table[INVERT[0]] = ExecutionEngine._Op_INVERT
+    table[AND[0]] = ExecutionEngine._Op_AND
+    table[OR[0]] = ExecutionEngine._Op_OR
+    table[XOR[0]] = ExecutionEngine._Op_XOR
+    table[EQUAL[0]] = ExecutionEngine._Op_EQUAL
+    table[INC[0]] = ExecutionEngine._Op_INC
+    table[DEC[0]] = ExecutionEngine._Op_DEC
+    table[SIGN[0]] = ExecutionEngine._Op_SIGN
+    table[NEGATE[0]] = ExecutionEngine._Op_NEGATE
+    table[ABS[0]] = ExecutionEngine._Op_ABS
+    table[NOT[0]] = ExecutionEngine._Op_NOT
+    table[NZ[0]] = ExecutionEngine._Op_NZ
+    table[ADD[0]] = ExecutionEngine._Op_ADD
+    table[SUB[0]] = ExecutionEngine._Op_SUB
+    table[MUL[0]] = ExecutionEngine._Op_MUL
+    table[DIV[0]] = ExecutionEngine._Op_DIV
+    table[MOD[0]] = ExecutionEngine._Op_MOD
+    table[SHL[0]] = ExecutionEngine._Op_SHL
+    table[SHR[0]] = ExecutionEngine._Op_SHR
+    table[BOOLAND[0]] = ExecutionEngine._Op_BOOLAND
+    table[BOOLOR[0]] = ExecutionEngine._Op_BOOLOR
+    table[NUMEQUAL[0]] = ExecutionEngine._Op_NUMEQUAL
+    table[NUMNOTEQUAL[0]] = ExecutionEngine._Op_NUMNOTEQUAL
+    table[LT[0]] = ExecutionEngine._Op_LT
+    table[GT[0]] = ExecutionEngine._Op_GT
+    table[LTE[0]] = ExecutionEngine._Op_LTE
+    table[GTE[0]] = ExecutionEngine._Op_GTE
+    table[MIN[0]] = ExecutionEngine._Op_MIN
+    table[MAX[0]] = ExecutionEngine._Op_MAX
+    table[WITHIN[0]] = ExecutionEngine._Op_WITHIN
+    table[SHA1[0]] = ExecutionEngine._Op_SHA1
+    table[SHA256[0]] = ExecutionEngine._Op_SHA256
+    table[HASH160[0]] = ExecutionEngine._Op_HASH160
+    table[HASH256[0]] = ExecutionEngine._Op_HASH256
+    table[CHECKSIG[0]] = ExecutionEngine._Op_CHECKSIG
+    table[VERIFY[0]] = ExecutionEngine._Op_VERIFY
+    table[CHECKMULTISIG[0]] = ExecutionEngine._Op_CHECKMULTISIG
+    table[ARRAYSIZE[0]] = ExecutionEngine._Op_ARRAYSIZE
+    table[PACK[0]] = ExecutionEngine._Op_PACK
+    table[UNPACK[0]] = ExecutionEngine._Op_UNPACK
+    table[PICKITEM[0]] = ExecutionEngine._Op_PICKITEM
+    table[SETITEM[0]] = ExecutionEngine._Op_SETITEM
+    table[NEWARRAY[0]] = ExecutionEngine._Op_NEWARRAY
+    table[NEWSTRUCT[0]] = ExecutionEngine._Op_NEWSTRUCT
+    table[NEWMAP[0]] = ExecutionEngine._Op_NEWMAP
+    table[APPEND[0]] = ExecutionEngine._Op_APPEND
+    table[REVERSE[0]] = ExecutionEngine._Op_REVERSE
+    table[REMOVE[0]] = ExecutionEngine._Op_REMOVE
+    table[HASKEY[0]] = ExecutionEngine._Op_HASKEY
+    table[KEYS[0]] = ExecutionEngine._Op_KEYS
+    table[VALUES[0]] = ExecutionEngine._Op_VALUES
+    table[CALL_I[0]] = ExecutionEngine._Op_CALL_I
+    table[CALL_E[0]] = ExecutionEngine._Op_CALL_E
+    table[CALL_ED[0]] = ExecutionEngine._Op_CALL_ED
+    table[CALL_ET[0]] = ExecutionEngine._Op_CALL_ET
+    table[CALL_EDT[0]] = ExecutionEngine._Op_CALL_EDT
+    table[THROW[0]] = ExecutionEngine._Op_THROW
+    table[THROWIFNOT[0]] = ExecutionEngine._Op_THROWIFNOT
+
+    return table
+
+
+_dispatch_table = _build_dispatch_table()
@@ -1,64 +1,70 @@
+import hashlib
 from neo.VM import OpCode
 from typing import TYPE_CHECKING
-from functools import lru_cache
-import binascii
 
 if TYPE_CHECKING:
     from neo.VM.Script import Script
 
-_OperandSizeTable = {}
-start = int.from_bytes(OpCode.PUSHBYTES1, 'little')
-end = int.from_bytes(OpCode.PUSHBYTES75, 'little') + 1
-for op_num in range(start, end):
-    _OperandSizeTable[int.to_bytes(op_num, 1, 'little')] = op_num
-_OperandSizeTable[OpCode.JMP] = 2
-_OperandSizeTable[OpCode.JMPIF] = 2
-_OperandSizeTable[OpCode.JMPIFNOT] = 2
-_OperandSizeTable[OpCode.CALL] = 2
-_OperandSizeTable[OpCode.APPCALL] = 20
-_OperandSizeTable[OpCode.TAILCALL] = 20
-_OperandSizeTable[OpCode.CALL_I] = 4
-_OperandSizeTable[OpCode.CALL_E] = 22
-_OperandSizeTable[OpCode.CALL_ED] = 2
-_OperandSizeTable[OpCode.CALL_ET] = 22
-_OperandSizeTable[OpCode.CALL_EDT] = 2
+# operand sizes indexed by (integer) opcode
+_OperandSizeTable = [0] * 256
+for op_num in range(OpCode.PUSHBYTES1[0], OpCode.PUSHBYTES75[0] + 1):
+    _OperandSizeTable[op_num] = op_num
+_OperandSizeTable[OpCode.JMP[0]] = 2
+_OperandSizeTable[OpCode.JMPIF[0]] = 2
+_OperandSizeTable[OpCode.JMPIFNOT[0]] = 2
+_OperandSizeTable[OpCode.CALL[0]] = 2
+_OperandSizeTable[OpCode.APPCALL[0]] = 20
+_OperandSizeTable[OpCode.TAILCALL[0]] = 20
+_OperandSizeTable[OpCode.CALL_I[0]] = 4
+_OperandSizeTable[OpCode.CALL_E[0]] = 22
+_OperandSizeTable[OpCode.CALL_ED[0]] = 2
+_OperandSizeTable[OpCode.CALL_ET[0]] = 22
+_OperandSizeTable[OpCode.CALL_EDT[0]] = 2
+
+# size of the length prefix of variable sized operands, indexed by (integer) opcode
+_OperandSizePrefixTable = [0] * 256
+_OperandSizePrefixTable[OpCode.PUSHDATA1[0]] = 1
+_OperandSizePrefixTable[OpCode.PUSHDATA2[0]] = 2
+_OperandSizePrefixTable[OpCode.PUSHDATA4[0]] = 4
+_OperandSizePrefixTable[OpCode.SYSCALL[0]] = 1
+
+_JumpOpCodes = {OpCode.JMP[0], OpCode.JMPIF[0], OpCode.JMPIFNOT[0], OpCode.CALL[0]}
 
 
 class Instruction:
+    """
+    A decoded VM instruction.
+
+    Instructions are decoded once per script (see `Script.Instructions`) and shared between execution contexts, so
+    everything the engine needs per step is computed up front and the instance should be treated as immutable.
+    """
+    __slots__ = ['OpCode', 'Operand', 'Size', 'TokenI16', 'TokenU32', 'JumpTarget', 'InteropId', 'Price']
 
     @classmethod
     def RET(cls):
         return cls(0x66)
 
     def __init__(self, opcode: int):
-        self.OpCode = int.to_bytes(opcode, 1, 'little')
+        self.OpCode = opcode
         self.Operand = bytearray()
-        self._OperandSizeTable = _OperandSizeTable
-        self._OperandSizePrefixTable = {}
-
-    @property
-    @lru_cache()
-    def OperandSizePrefixTable(self):
-
-        self._OperandSizePrefixTable[OpCode.PUSHDATA1] = 1
-        self._OperandSizePrefixTable[OpCode.PUSHDATA2] = 2
-        self._OperandSizePrefixTable[OpCode.PUSHDATA4] = 4
-        self._OperandSizePrefixTable[OpCode.SYSCALL] = 1
-        return self._OperandSizePrefixTable
-
-    @property
-    @lru_cache()
-    def OperandSizeTable(self):
-        return self._OperandSizeTable
+        self.JumpTarget = None
+        self.InteropId = None
+        # execution cost, resolved and cached by the `ApplicationEngine` the first time the instruction is priced
+        self.Price = None
+        prefix_size = _OperandSizePrefixTable[opcode]
+        self.Size = 1 + prefix_size if prefix_size > 0 else 1 + _OperandSizeTable[opcode]
+        self.TokenI16 = 0
+        self.TokenU32 = 0
 
     @classmethod
     def FromScriptAndIP(clss, script: 'Script', ip: int):
+        start = ip
         ins = clss(script[ip])
         ip += 1
-        operand_size = ins.OperandSizePrefixTable.get(ins.OpCode, 0)
+        operand_size = _OperandSizePrefixTable[ins.OpCode]
 
         if operand_size == 0:
-            operand_size = ins.OperandSizeTable.get(ins.OpCode, 0)
+            operand_size = _OperandSizeTable[ins.OpCode]
         elif operand_size == 1:
             ip, operand_size = ins.ReadByte(script, ip)
         elif operand_size == 2:
@@ -68,33 +74,36 @@ class Instruction:
 
         if (operand_size > 0):
             ins.Operand = ins.ReadExactBytes(script, ip, operand_size)
+            ip += operand_size
+
+            # the tokens are only meaningful for short operands, e.g. jump offsets and interop ids
+            if operand_size <= 4:
+                ins.TokenI16 = int.from_bytes(ins.Operand, 'little', signed=True)
+                ins.TokenU32 = int.from_bytes(ins.Operand, 'little', signed=False)
+
+        ins.Size = ip - start
+
+        # resolve the absolute jump target once, instead of on every execution
+        if ins.OpCode in _JumpOpCodes:
+            ins.JumpTarget = start + ins.TokenI16
+        elif ins.OpCode == OpCode.CALL_I[0]:
+            ins.JumpTarget = start + ins.TokenI16_1 + 2
+        elif ins.OpCode == OpCode.SYSCALL[0]:
+            # interop methods are called either by their 4 byte id or by their name
+            if len(ins.Operand) == 4:
+                ins.InteropId = ins.TokenU32
+            else:
+                ins.InteropId = int.from_bytes(hashlib.sha256(ins.Operand).digest()[:4], 'little', signed=False)
         return ins
 
     @property
     def InstructionName(self):
         return OpCode.ToName(self.OpCode)
 
-    @property
-    def Size(self):
-        prefixSize = self.OperandSizePrefixTable.get(self.OpCode, 0)
-
-        if prefixSize > 0:
-            return 1 + prefixSize + len(self.Operand)
-        else:
-            return 1 + self.OperandSizeTable.get(self.OpCode, 0)
-
-    @property
-    def TokenI16(self):
-        return int.from_bytes(self.Operand, 'little', signed=True)
-
     @property
     def TokenI16_1(self):
         return int.from_bytes(self.Operand[2:], 'little', signed=True)
 
-    @property
-    def TokenU32(self):
-        return int.from_bytes(self.Operand, 'little', signed=False)
-
     @property
     def TokenString(self):
         return self.Operand.decode('ascii')
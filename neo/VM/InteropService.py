@@ -599,29 +599,92 @@ class Map(StackItem, CollectionMixin):
 
 
 class InteropService:
+    # interop id -> (handler, price), shared by all instances of a class and filled once when its module is imported.
+    # The handler is the name of a method of the class, bound to the instance the first time it is invoked.
+    _interops = {}
 
     def __init__(self):
-        self._dictionary = {}
-        self.Register("System.ExecutionEngine.GetScriptContainer", self.GetScriptContainer)
-        self.Register("System.ExecutionEngine.GetExecutingScriptHash", self.GetExecutingScriptHash)
-        self.Register("System.ExecutionEngine.GetCallingScriptHash", self.GetCallingScriptHash)
-        self.Register("System.ExecutionEngine.GetEntryScriptHash", self.GetEntryScriptHash)
+        # interop id -> bound handler
+        self._handlers = {}
 
-    def Register(self, method, func):
-        hashed_method = int.from_bytes(hashlib.sha256(method.encode()).digest()[:4], 'little', signed=False)
-        self._dictionary[hashed_method] = func
+    @staticmethod
+    def GetInteropId(method):
+        """
+        Get the id of an interop method.
+
+        Args:
+            method (str, bytes, bytearray): the name of the method, or its 4 byte id.
+
+        Returns:
+            int: the id.
+        """
+        if isinstance(method, str):
+            method = method.encode()
+        elif len(method) == 4:
+            return int.from_bytes(method, 'little', signed=False)
+        return int.from_bytes(hashlib.sha256(method).digest()[:4], 'little', signed=False)
+
+    @classmethod
+    def Register(cls, method, func, price=0):
+        """
+        Register an interop method for all instances of the class (and its subclasses).
+
+        Args:
+            method (str): the name of the interop method.
+            func (callable): the handler, a method of the class or any callable taking the engine.
+            price (int): (Optional) the execution price, 0 if it has to be computed by the engine.
+        """
+        if '_interops' not in vars(cls):
+            # copy the registrations of the base class instead of changing them
+            cls._interops = dict(cls._interops)
+
+        name = getattr(func, '__name__', None)
+        handler = name if name is not None and getattr(cls, name, None) is func else func
+        cls._interops[cls.GetInteropId(method)] = (handler, price)
+
+    @classmethod
+    def _RegisterInterops(cls):
+        cls.Register("System.ExecutionEngine.GetScriptContainer", cls.GetScriptContainer)
+        cls.Register("System.ExecutionEngine.GetExecutingScriptHash", cls.GetExecutingScriptHash)
+        cls.Register("System.ExecutionEngine.GetCallingScriptHash", cls.GetCallingScriptHash)
+        cls.Register("System.ExecutionEngine.GetEntryScriptHash", cls.GetEntryScriptHash)
 
     def Invoke(self, method, engine):
-        if len(method) == 4:
-            hashed_method = int.from_bytes(method, 'little', signed=False)
-        else:
-            hashed_method = int.from_bytes(hashlib.sha256(method).digest()[:4], 'little', signed=False)
-        if hashed_method not in self._dictionary.keys():
-            logger.debug("method %s not found" % method)
-            return False
-        func = self._dictionary[hashed_method]
+        """
+        Invoke an interop method.
+
+        Args:
+            method (int, bytes, bytearray): the id of the method (see `Instruction.InteropId`), or the SYSCALL operand.
+            engine (ExecutionEngine): the executing engine.
+
+        Returns:
+            bool: False if the method does not exist or failed.
+        """
+        interop_id = method if type(method) is int else self.GetInteropId(method)
+        func = self._handlers.get(interop_id, None)
+        if func is None:
+            entry = self._interops.get(interop_id, None)
+            if entry is None:
+                logger.debug("method %s not found" % method)
+                return False
+            handler = entry[0]
+            func = getattr(self, handler) if isinstance(handler, str) else handler
+            self._handlers[interop_id] = func
         return func(engine)
 
+    def GetPrice(self, hash: int):
+        """
+        Get the execution price of an interop method.
+
+        Args:
+            hash (int): the id of the method.
+
+        Returns:
+            int: the price, 0 if it is unknown or has to be computed by the engine.
+        """
+        entry = self._interops.get(hash, None)
+        return 0 if entry is None else entry[1]
+
     @staticmethod
     def GetScriptContainer(engine):
         engine.CurrentContext.EvaluationStack.PushT(StackItem.FromInterface(engine.ScriptContainer))
@@ -641,3 +704,6 @@ class InteropService:
     def GetEntryScriptHash(engine):
         engine.CurrentContext.EvaluationStack.PushT(engine.EntryContext.ScriptHash())
         return True
+
+
+InteropService._RegisterInterops()
@@ -217,27 +217,16 @@ THROWIFNOT = b'\xF1'
 module = importlib.import_module('neo.VM.OpCode')
 items = dir(sys.modules[__name__])
 
+# integer opcode -> name. Aliases resolve to the name that sorts first (e.g. PUSH0 instead of PUSHF)
+_names = {}
+for item in items:
+    n = getattr(module, item)
+    if type(n) is bytes and len(n) == 1 and n[0] not in _names:
+        _names[n[0]] = item
+
 
 def ToName(op):
     if type(op) is bytes:
         op = int.from_bytes(op, 'little')
 
-    for item in items:
-        n = getattr(module, item)
-
-        try:
-            nn = int(binascii.hexlify(n), 16)
-
-            if op == nn:
-                return item
-        except Exception as e:
-            pass
-
-        try:
-            nn2 = int.from_bytes(n, 'little')
-            if op == nn2:
-                return item
-        except Exception as e:
-            pass
-
-    return None
+    return _names.get(op, None)
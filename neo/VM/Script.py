@@ -1,8 +1,22 @@
+from collections import OrderedDict
+from neo.VM.Instruction import Instruction
+
+# instructions are immutable once decoded, so a single implicit RET can be shared
+_RET = Instruction.RET()
+
+
 class Script:
+    # decoded instruction tables of scripts loaded by script hash (contracts), shared by all contexts and engines
+    _instruction_tables = OrderedDict()
+    MaxCachedInstructionTables = 1024
+
     def __init__(self, crypto, script):
         self._crypto = crypto
         self._value = script
         self._script_hash = None
+        self._instructions = None
+        # whether the instruction table is shared through the script hash cache, see `FromHash`
+        self._shared = False
 
     @property
     def ScriptHash(self) -> bytearray:
@@ -14,6 +28,66 @@ class Script:
     def Length(self) -> int:
         return len(self._value)
 
+    @property
+    def Instructions(self) -> dict:
+        """
+        Get the decoded instruction table of the script.
+
+        The table maps an instruction pointer to its `Instruction` and is decoded once per script. The table of a
+        contract script (see `FromHash`) is shared by every `ExecutionContext` running it, across engines, for as long as
+        it stays in the script hash cache. Other scripts, e.g. witness and invocation scripts that are mostly run once,
+        keep a table of their own and are neither hashed nor cached.
+
+        Returns:
+            dict: {ip: Instruction}
+        """
+        if self._instructions is None:
+            if not self._shared:
+                self._instructions = self._Decode()
+                return self._instructions
+
+            key = self._script_hash
+            if isinstance(key, bytearray):
+                key = bytes(key)
+
+            tables = Script._instruction_tables
+            instructions = tables.get(key, None)
+            if instructions is None:
+                instructions = self._Decode()
+                tables[key] = instructions
+                if len(tables) > self.MaxCachedInstructionTables:
+                    tables.popitem(last=False)
+            else:
+                tables.move_to_end(key)
+            self._instructions = instructions
+        return self._instructions
+
+    def _Decode(self) -> dict:
+        instructions = {}
+        ip = 0
+        length = self.Length
+        while ip < length:
+            try:
+                instruction = Instruction.FromScriptAndIP(self, ip)
+            except ValueError:
+                # leave malformed trailing data to fault when (and if) it is reached
+                break
+            instructions[ip] = instruction
+            ip += instruction.Size
+        return instructions
+
+    def GetInstruction(self, ip) -> Instruction:
+        if ip >= self.Length:
+            return _RET
+
+        instructions = self.Instructions
+        instruction = instructions.get(ip, None)
+        if instruction is None:
+            # jump targets are not required to be aligned with the linear decoding
+            instruction = Instruction.FromScriptAndIP(self, ip)
+            instructions[ip] = instruction
+        return instruction
+
     def __call__(self, *args, **kwargs):
         index = args[0]
         return self._value[index]
@@ -25,4 +99,9 @@ class Script:
     def FromHash(cls, scrip_hash, script):
         o = cls(None, script)
         o._script_hash = scrip_hash
+        o._shared = scrip_hash is not None
         return o
+
+    @classmethod
+    def ClearInstructionCache(cls):
+        cls._instruction_tables.clear()
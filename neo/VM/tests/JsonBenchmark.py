@@ -0,0 +1,109 @@
+"""
+VM micro-benchmark built from the official NEO-VM JSON test vectors.
+
+Every test script in the vectors is loaded once and then executed `iterations` times with a fresh engine, without a
+debugger, so the numbers reflect the production execution path.
+
+Usage:
+    python -m neo.VM.tests.JsonBenchmark <path to the extracted neo-vm tests> [-i iterations]
+
+The vectors can be obtained from the NEO-VM repository tarball referenced in `neo.Utils.VMJSONTestCase`.
+"""
+import argparse
+import binascii
+import glob
+import io
+import json
+import os
+import time
+from neo.VM.ExecutionEngine import ExecutionEngine
+from neo.VM import InteropService
+from neo.Core.Cryptography.Crypto import Crypto
+from neo.VM.tests.JsonTester import MessageProvider, ScriptTable
+
+
+def _unhex(data: str) -> bytes:
+    if data.startswith('0x'):
+        data = data[2:]
+    return binascii.unhexlify(data)
+
+
+def load_tests(path: str) -> list:
+    """
+    Collect the runnable scripts from all JSON test files found under `path`.
+
+    Returns:
+        list: of (name, script, script table, message) tuples.
+    """
+    tests = []
+    for filename in sorted(glob.glob(os.path.join(path, "**/*.json"), recursive=True)):
+        with io.open(filename, 'r', encoding='utf-8-sig') as f:  # uses dirty UTF-8 BOM header *sigh*
+            data = json.load(f)
+
+        for test in data.get('tests', []):
+            steps = test.get('steps', [])
+            # only use vectors that are expected to run to completion
+            if not steps or steps[-1]['result']['state'].upper() not in ['HALT', 'FAULT']:
+                continue
+
+            try:
+                script = _unhex(test['script'])
+                scripts = [_unhex(entry['script']) for entry in test.get('scriptTable', [])]
+            except binascii.Error:
+                continue
+
+            script_table = None
+            if scripts:
+                script_table = ScriptTable()
+                for s in scripts:
+                    script_table.Add(s)
+
+            name = f"{data['category']}-{data['name']}-{test.get('name', '')}"
+            tests.append((name, script, script_table, test.get('message', None)))
+    return tests
+
+
+def run(tests: list, iterations: int) -> tuple:
+    """
+    Execute all tests `iterations` times.
+
+    Returns:
+        tuple: (total instructions executed, elapsed seconds)
+    """
+    crypto = Crypto.Default()
+    service = InteropService.InteropService()
+    ops = 0
+    elapsed = 0.0
+
+    for _ in range(iterations):
+        for name, script, script_table, message in tests:
+            container = MessageProvider(message) if message else None
+            engine = ExecutionEngine(crypto=crypto, service=service, container=container, table=script_table, exit_on_error=True)
+
+            start = time.perf_counter()
+            engine.LoadScript(script)
+            engine.Execute()
+            elapsed += time.perf_counter() - start
+
+            ops += engine.ops_processed
+    return ops, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the VM using the NEO-VM JSON test vectors")
+    parser.add_argument("path", help="directory containing the extracted JSON test vectors")
+    parser.add_argument("-i", "--iterations", type=int, default=10, help="number of times to execute every test")
+    args = parser.parse_args()
+
+    tests = load_tests(args.path)
+    if not tests:
+        print(f"No JSON test vectors found in {args.path}")
+        return
+
+    ops, elapsed = run(tests, args.iterations)
+    print(f"Executed {len(tests)} test(s) {args.iterations} time(s): {ops} instructions in {elapsed:.3f}s "
+          f"({ops / elapsed:,.0f} instructions/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@ from unittest import TestCase
 from neo.VM.InteropService import StackItem, ByteArray
 from neo.VM.ExecutionEngine import ExecutionEngine
 from neo.VM.ExecutionEngine import ExecutionContext
-from neo.VM import OpCode
+from neo.VM import OpCode, VMState
 from neo.VM.Script import Script
 from neo.Core.Cryptography.Crypto import Crypto
 from mock import patch
@@ -79,3 +79,33 @@ class VMTestCase(TestCase):
 
         res = self.econtext.EvaluationStack.Pop()
         self.assertEqual(res, StackItem.New(False))
+
+    def test_execute_fast_path(self):
+        # count to 10 in a loop
+        script = OpCode.PUSH0 + OpCode.INC + OpCode.DUP + OpCode.PUSH10 + OpCode.LT + OpCode.JMPIF + b'\xfc\xff' + OpCode.RET
+
+        engine = ExecutionEngine(crypto=Crypto.Default())
+        engine.LoadScript(script)
+        self.assertTrue(engine._CanExecuteFast())
+        self.assertTrue(engine.Execute())
+
+        stepped = ExecutionEngine(crypto=Crypto.Default())
+        stepped.LoadScript(script)
+        while stepped.State & (VMState.HALT | VMState.FAULT) == 0:
+            stepped.ExecuteNext()
+
+        self.assertEqual(engine.State, stepped.State)
+        self.assertEqual(engine.ops_processed, stepped.ops_processed)
+        self.assertEqual(engine.ResultStack.Peek(), StackItem.New(10))
+        self.assertEqual(stepped.ResultStack.Peek(), StackItem.New(10))
+
+    def test_execute_with_post_execute_hook(self):
+        class HookedEngine(ExecutionEngine):
+            def PostExecuteInstruction(self):
+                return self.ops_processed < 2
+
+        engine = HookedEngine(crypto=Crypto.Default())
+        engine.LoadScript(OpCode.PUSH1 + OpCode.PUSH2 + OpCode.PUSH3 + OpCode.RET)
+        self.assertFalse(engine._CanExecuteFast())
+        self.assertFalse(engine.Execute())
+        self.assertEqual(engine.ops_processed, 2)
@@ -0,0 +1,59 @@
+from unittest import TestCase
+from neo.VM.Script import Script
+from neo.VM.ExecutionContext import ExecutionContext
+from neo.VM import OpCode
+from neo.Core.Cryptography.Crypto import Crypto
+
+
+class ScriptTestCase(TestCase):
+
+    def setUp(self):
+        Script.ClearInstructionCache()
+
+    def test_instruction_table_is_shared(self):
+        raw = OpCode.PUSH1 + OpCode.JMP + b'\x03\x00' + OpCode.NOP + OpCode.RET
+        script_hash = Crypto.Default().Hash160(raw)
+        script1 = Script.FromHash(script_hash, raw)
+        script2 = Script.FromHash(script_hash, raw)
+
+        ctx1 = ExecutionContext(script1, -1)
+        ctx2 = ExecutionContext(script2, -1)
+
+        self.assertIs(script1.Instructions, script2.Instructions)
+        self.assertIs(ctx1.GetInstruction(1), ctx2.GetInstruction(1))
+        self.assertEqual(sorted(script1.Instructions.keys()), [0, 1, 4, 5])
+        self.assertEqual(len(Script._instruction_tables), 1)
+
+    def test_loaded_scripts_are_not_cached(self):
+        raw = OpCode.PUSH1 + OpCode.RET
+        script1 = Script(Crypto.Default(), raw)
+        script2 = Script(Crypto.Default(), raw)
+
+        self.assertIsNot(script1.Instructions, script2.Instructions)
+        self.assertIs(script1.Instructions, script1.Instructions)
+        self.assertIsNone(script1._script_hash)
+        self.assertEqual(len(Script._instruction_tables), 0)
+
+    def test_jump_targets_are_resolved(self):
+        raw = OpCode.NOP + OpCode.JMP + b'\x03\x00' + OpCode.CALL + b'\xfd\xff' + OpCode.RET
+        script = Script(Crypto.Default(), raw)
+
+        self.assertEqual(script.GetInstruction(1).JumpTarget, 4)
+        self.assertEqual(script.GetInstruction(4).JumpTarget, 1)
+        self.assertIsNone(script.GetInstruction(0).JumpTarget)
+
+    def test_unaligned_and_malformed_instructions(self):
+        # PUSHDATA1 with a truncated operand is only decoded (and fails) when reached
+        raw = OpCode.PUSHBYTES1 + OpCode.NOP + OpCode.PUSHDATA1 + b'\x05\x00'
+        script = Script(Crypto.Default(), raw)
+
+        self.assertEqual(sorted(script.Instructions.keys()), [0])
+
+        # jumping into the operand of the first instruction decodes it on demand
+        self.assertEqual(script.GetInstruction(1).OpCode, OpCode.NOP[0])
+        self.assertIn(1, script.Instructions)
+
+        with self.assertRaises(ValueError):
+            script.GetInstruction(2)
+
+        self.assertEqual(script.GetInstruction(10).OpCode, OpCode.RET[0])
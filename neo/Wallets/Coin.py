@@ -43,6 +43,8 @@ class Coin(TrackableMixin):
 
         self._address = None
         self._transaction = None
+        # the `CoinStore` holding the coin, notified of state changes
+        self._store = None
 
         if prev_hash and prev_index:
             self.Reference = CoinReference(prev_hash, prev_index)
@@ -87,7 +89,10 @@ class Coin(TrackableMixin):
         Args:
             value (neo.Core.State.CoinState): the new coin state.
         """
+        old_state = self._state
         self._state = value
+        if self._store is not None:
+            self._store.CoinStateChanged(self, old_state)
 
     def Equals(self, other):
         """
@@ -0,0 +1,173 @@
+"""
+Description:
+    Strategies selecting the coins to pay an amount of an asset with
+Usage:
+    from neo.Wallets.CoinSelection import FirstOf, ExactMatch, BranchAndBound, LargestFirst
+"""
+
+
+class CoinSelector:
+    """
+    Base class of the coin selection strategies.
+
+    A strategy gets the unspent coins of an asset ordered by value (`neo.Wallets.CoinStore.SortedCoins`) and only
+    looks at the coins it needs, so that its cost does not depend on the number of coins in the wallet.
+    """
+
+    def Select(self, coins, amount):
+        """
+        Select the coins to pay `amount` with.
+
+        Args:
+            coins (neo.Wallets.CoinStore.SortedCoins): the coins to choose from.
+            amount (Fixed8): the amount to pay.
+
+        Returns:
+            list: of neo.Wallets.Coin totalling at least `amount`, or None if the strategy found no selection.
+        """
+        raise NotImplementedError()
+
+
+class ExactMatch(CoinSelector):
+    """
+    Selects a single coin of exactly the amount.
+    """
+
+    def __init__(self, reverse=False):
+        """
+        Create an instance.
+
+        Args:
+            reverse (bool): (Optional) of several coins of the amount, select the last added one instead of the first.
+        """
+        self.reverse = reverse
+
+    def Select(self, coins, amount):
+        candidates = coins.Descending(amount.value) if self.reverse else coins.Ascending(amount.value)
+        for coin in candidates:
+            if coin.Output.Value.value == amount.value:
+                return [coin]
+            break
+        return None
+
+
+class SmallestFirst(CoinSelector):
+    """
+    Selects coins by increasing value until the amount is reached.
+    """
+
+    def Select(self, coins, amount):
+        return _Accumulate(coins.Ascending(), amount.value)
+
+
+class LargestFirst(CoinSelector):
+    """
+    Selects coins by decreasing value until the amount is reached, which uses the fewest coins.
+    """
+
+    def Select(self, coins, amount):
+        return _Accumulate(coins.Descending(), amount.value)
+
+
+class BranchAndBound(CoinSelector):
+    """
+    Searches for coins totalling exactly the amount, so that no change output is needed.
+
+    The search is a depth first search over the largest coins not exceeding the amount, including the largest coins
+    first and skipping branches that can't reach the amount anymore. It is bounded by the number of coins considered
+    (`max_candidates`) and of steps taken (`max_tries`), and gives up (returns None) when these are exhausted.
+    """
+
+    def __init__(self, max_candidates=100, max_tries=10000):
+        """
+        Create an instance.
+
+        Args:
+            max_candidates (int): the maximum number of coins to consider.
+            max_tries (int): the maximum number of search steps.
+        """
+        self.max_candidates = max_candidates
+        self.max_tries = max_tries
+
+    def Select(self, coins, amount):
+        target = amount.value
+        candidates = []
+        for coin in coins.Descending(target):
+            candidates.append(coin)
+            if len(candidates) == self.max_candidates:
+                break
+
+        values = [coin.Output.Value.value for coin in candidates]
+
+        # remaining[i] is the total of the coins from i on, the most the search can still add
+        remaining = [0] * (len(values) + 1)
+        for i in range(len(values) - 1, -1, -1):
+            remaining[i] = remaining[i + 1] + values[i]
+
+        selected = []
+        tries = [self.max_tries]
+
+        def search(index, total):
+            if total == target:
+                return True
+            if tries[0] <= 0 or total + remaining[index] < target:
+                return False
+            tries[0] -= 1
+
+            value = values[index]
+            if total + value <= target:
+                selected.append(index)
+                if search(index + 1, total + value):
+                    return True
+                selected.pop()
+
+            # leaving out a coin, the following coins of the same value lead to the same totals
+            index += 1
+            while index < len(values) and values[index] == value:
+                index += 1
+            return search(index, total)
+
+        if target <= 0 or not search(0, 0):
+            return None
+        return [candidates[index] for index in selected]
+
+
+class FirstOf(CoinSelector):
+    """
+    Uses the selection of the first strategy finding one.
+    """
+
+    def __init__(self, *selectors):
+        """
+        Create an instance.
+
+        Args:
+            *selectors (CoinSelector): the strategies to try, in order.
+        """
+        self.selectors = selectors
+
+    def Select(self, coins, amount):
+        for selector in self.selectors:
+            selection = selector.Select(coins, amount)
+            if selection is not None:
+                return selection
+        return None
+
+
+def _Accumulate(coins, target):
+    selected = []
+    total = 0
+    for coin in coins:
+        selected.append(coin)
+        total += coin.Output.Value.value
+        if total >= target:
+            break
+
+    return selected if total >= target else None
+
+
+# a single coin of the exact amount, otherwise the smallest coins
+DEFAULT_SELECTOR = FirstOf(ExactMatch(), SmallestFirst())
+
+# a single coin of the exact amount, otherwise the largest coins
+DEFAULT_REVERSE_SELECTOR = FirstOf(ExactMatch(reverse=True), LargestFirst())
@@ -0,0 +1,315 @@
+"""
+Description:
+    In memory store of the coins of a wallet, indexed by asset and address
+Usage:
+    from neo.Wallets.CoinStore import CoinStore
+"""
+import bisect
+from collections.abc import MutableMapping
+from neo.Core.State.CoinState import CoinState
+from neo.Core.Fixed8 import Fixed8
+
+# a confirmed coin having none of these states can be spent
+_UNAVAILABLE = CoinState.Spent | CoinState.Locked | CoinState.Frozen
+
+
+class CoinStore(MutableMapping):
+    """
+    The coins of a wallet, a mapping of `CoinReference` to `neo.Wallets.Coin` keyed by the reference of the coin.
+
+    Besides all coins, the store keeps an index of the unspent coins (confirmed and not spent, locked or frozen) by
+    asset, watch only state and address, ordered by value, together with their total values. Finding the unspent coins
+    or the balance of an asset therefore doesn't have to go through all coins of the wallet, and coins can be selected
+    by value (see `SortedUnspent`).
+
+    Stored coins report changes of their `State` to the store, so changing the state of a coin in place keeps the
+    index up to date. A coin can only be in one store at a time.
+    """
+
+    def __init__(self, coins=None):
+        """
+        Create an instance.
+
+        Args:
+            coins (dict): (Optional) CoinReference -> Coin, the initial coins.
+        """
+        self._coins = {}
+        # reference -> sequence number, unspent coins are returned in the order they were added
+        self._order = {}
+        self._seq = 0
+
+        # sorted lists of (value, sequence number, reference) of the unspent coins by (asset id, watch only state) and
+        # by (asset id, watch only state, script hash)
+        self._unspent = {}
+        self._unspent_by_address = {}
+        # total values (int) of the unspent coins by (asset id, watch only state) and by (asset id, watch only state, script hash)
+        self._asset_totals = {}
+        self._address_totals = {}
+
+        # asset id -> number of coins
+        self._asset_counts = {}
+
+        if coins:
+            for reference, coin in coins.items():
+                self[reference] = coin
+
+    def __getitem__(self, reference):
+        return self._coins[reference]
+
+    def __setitem__(self, reference, coin):
+        old = self._coins.get(reference, None)
+        if old is not None:
+            self._Remove(reference, old)
+        else:
+            self._order[reference] = self._seq
+            self._seq += 1
+
+        self._coins[reference] = coin
+        coin._store = self
+
+        asset_id = coin.Output.AssetId
+        self._asset_counts[asset_id] = self._asset_counts.get(asset_id, 0) + 1
+        self._Index(reference, coin, coin.State)
+
+    def __delitem__(self, reference):
+        coin = self._coins.pop(reference)
+        self._Remove(reference, coin)
+        del self._order[reference]
+
+    def __contains__(self, reference):
+        return reference in self._coins
+
+    def __iter__(self):
+        return iter(self._coins)
+
+    def __len__(self):
+        return len(self._coins)
+
+    def keys(self):
+        return self._coins.keys()
+
+    def values(self):
+        return self._coins.values()
+
+    def items(self):
+        return self._coins.items()
+
+    def CoinStateChanged(self, coin, old_state):
+        """
+        Update the index after the state of a stored coin changed, called by `Coin.State`.
+
+        Args:
+            coin (neo.Wallets.Coin): the coin.
+            old_state (int): the previous state of the coin.
+        """
+        reference = coin.Reference
+        if self._coins.get(reference, None) is not coin:
+            return
+
+        self._Unindex(reference, coin, old_state)
+        self._Index(reference, coin, coin.State)
+
+    def Unspent(self, asset_id=None, script_hash=None, watch_only_val=0, exclude=None):
+        """
+        Get the unspent coins, in the order they were added.
+
+        Args:
+            asset_id (UInt256): (Optional) only get the coins of this asset.
+            script_hash (UInt160): (Optional) only get the coins of this address.
+            watch_only_val (int): a flag ( 0 or 64 ) indicating whether or not to get coins that are in 'watch only' addresses.
+            exclude (set): (Optional) the references of coins not to get.
+
+        Returns:
+            list: of neo.Wallets.Coin.
+        """
+        if asset_id is not None and script_hash is not None:
+            entries = self._unspent_by_address.get((asset_id, watch_only_val, script_hash), ())
+        elif asset_id is not None:
+            entries = self._unspent.get((asset_id, watch_only_val), ())
+        elif script_hash is not None:
+            entries = [entry for (_, watch_only, address), address_entries in self._unspent_by_address.items()
+                       if watch_only == watch_only_val and address == script_hash for entry in address_entries]
+        else:
+            entries = [entry for (_, watch_only), asset_entries in self._unspent.items()
+                       if watch_only == watch_only_val for entry in asset_entries]
+
+        if exclude:
+            entries = [entry for entry in entries if entry[2] not in exclude]
+        entries = sorted(entries, key=lambda entry: entry[1])
+
+        coins = self._coins
+        return [coins[entry[2]] for entry in entries]
+
+    def SortedUnspent(self, asset_id, script_hash=None, watch_only_val=0, exclude=None, predicate=None):
+        """
+        Get the unspent coins of an asset ordered by value, to select coins from.
+
+        Args:
+            asset_id (UInt256): the asset.
+            script_hash (UInt160): (Optional) only get the coins of this address.
+            watch_only_val (int): a flag ( 0 or 64 ) indicating whether or not to get coins that are in 'watch only' addresses.
+            exclude (set): (Optional) the references of coins not to get.
+            predicate (callable): (Optional) only get the coins for which `predicate(coin)` is True.
+
+        Returns:
+            SortedCoins:
+        """
+        if script_hash is None:
+            entries = self._unspent.get((asset_id, watch_only_val), [])
+        else:
+            entries = self._unspent_by_address.get((asset_id, watch_only_val, script_hash), [])
+
+        total = self.Balance(asset_id, script_hash=script_hash, watch_only_val=watch_only_val).value
+        if exclude:
+            for reference in exclude:
+                coin = self._coins.get(reference, None)
+                if coin is not None:
+                    entry = (coin.Output.Value.value, self._order[reference], reference)
+                    index = bisect.bisect_left(entries, entry)
+                    if index < len(entries) and entries[index] == entry:
+                        total -= entry[0]
+
+        return SortedCoins(self._coins, entries, total, exclude, predicate)
+
+    def Balance(self, asset_id, script_hash=None, watch_only_val=0):
+        """
+        Get the total value of the unspent coins of an asset.
+
+        Args:
+            asset_id (UInt256): the asset.
+            script_hash (UInt160): (Optional) only count the coins of this address.
+            watch_only_val (int): a flag ( 0 or 64 ) indicating whether or not to count coins that are in 'watch only' addresses.
+
+        Returns:
+            Fixed8: total balance.
+        """
+        if script_hash is None:
+            return Fixed8(self._asset_totals.get((asset_id, watch_only_val), 0))
+        return Fixed8(self._address_totals.get((asset_id, watch_only_val, script_hash), 0))
+
+    def Assets(self):
+        """
+        Get the assets of all coins in the store.
+
+        Returns:
+            list: of UInt256 asset ids.
+        """
+        return list(self._asset_counts.keys())
+
+    def _Remove(self, reference, coin):
+        if coin._store is self:
+            coin._store = None
+
+        asset_id = coin.Output.AssetId
+        count = self._asset_counts[asset_id] - 1
+        if count:
+            self._asset_counts[asset_id] = count
+        else:
+            del self._asset_counts[asset_id]
+
+        self._Unindex(reference, coin, coin.State)
+
+    def _Index(self, reference, coin, state):
+        if state & CoinState.Confirmed == 0 or state & _UNAVAILABLE:
+            return
+
+        output = coin.Output
+        value = output.Value.value
+        asset_key = (output.AssetId, state & CoinState.WatchOnly)
+        address_key = asset_key + (output.ScriptHash,)
+        entry = (value, self._order[reference], reference)
+
+        bisect.insort(self._unspent.setdefault(asset_key, []), entry)
+        bisect.insort(self._unspent_by_address.setdefault(address_key, []), entry)
+        self._asset_totals[asset_key] = self._asset_totals.get(asset_key, 0) + value
+        self._address_totals[address_key] = self._address_totals.get(address_key, 0) + value
+
+    def _Unindex(self, reference, coin, state):
+        if state & CoinState.Confirmed == 0 or state & _UNAVAILABLE:
+            return
+
+        output = coin.Output
+        value = output.Value.value
+        asset_key = (output.AssetId, state & CoinState.WatchOnly)
+        address_key = asset_key + (output.ScriptHash,)
+        entry = (value, self._order[reference], reference)
+
+        for entries, totals, key in ((self._unspent, self._asset_totals, asset_key),
+                                     (self._unspent_by_address, self._address_totals, address_key)):
+            key_entries = entries[key]
+            del key_entries[bisect.bisect_left(key_entries, entry)]
+            if key_entries:
+                totals[key] -= value
+            else:
+                del entries[key]
+                del totals[key]
+
+
+class SortedCoins:
+    """
+    Unspent coins of an asset ordered by value (coins of the same value in the order they were added), see
+    `CoinStore.SortedUnspent`.
+
+    The coins are looked up while iterating, so only the coins iterated over are looked at. Don't change the coins of
+    the store while iterating.
+    """
+
+    def __init__(self, coins, entries, total, exclude=None, predicate=None):
+        self._coins = coins
+        self._entries = entries
+        self._total = total
+        self._exclude = exclude
+        self._predicate = predicate
+
+    @property
+    def Total(self):
+        """
+        Get the total value of the coins, which is an upper bound if the coins are filtered by a predicate.
+
+        Returns:
+            Fixed8:
+        """
+        return Fixed8(self._total)
+
+    def Ascending(self, min_value=0):
+        """
+        Iterate over the coins by increasing value.
+
+        Args:
+            min_value (int): (Optional) start at the first coin of at least this value (in Fixed8 units).
+
+        Returns:
+            generator: of neo.Wallets.Coin.
+        """
+        entries = self._entries
+        for index in range(bisect.bisect_left(entries, (min_value,)), len(entries)):
+            coin = self._Coin(entries[index])
+            if coin is not None:
+                yield coin
+
+    def Descending(self, max_value=None):
+        """
+        Iterate over the coins by decreasing value.
+
+        Args:
+            max_value (int): (Optional) start at the last coin of at most this value (in Fixed8 units).
+
+        Returns:
+            generator: of neo.Wallets.Coin.
+        """
+        entries = self._entries
+        stop = len(entries) if max_value is None else bisect.bisect_left(entries, (max_value + 1,))
+        for index in range(stop - 1, -1, -1):
+            coin = self._Coin(entries[index])
+            if coin is not None:
+                yield coin
+
+    def _Coin(self, entry):
+        reference = entry[2]
+        if self._exclude and reference in self._exclude:
+            return None
+
+        coin = self._coins[reference]
+        if self._predicate is not None and not self._predicate(coin):
+            return None
+        return coin
@@ -7,6 +7,7 @@ Usage:
 import traceback
 import hashlib
 import asyncio
+from contextlib import nullcontext
 from itertools import groupby
 from base58 import b58decode
 from decimal import Decimal
@@ -22,6 +23,8 @@ from neo.Core.Cryptography.Helper import scripthash_to_address
 from neo.Core.Cryptography.Crypto import Crypto
 from neo.Wallets.AddressState import AddressState
 from neo.Wallets.Coin import Coin
+from neo.Wallets.CoinStore import CoinStore
+from neo.Wallets.CoinSelection import DEFAULT_SELECTOR, DEFAULT_REVERSE_SELECTOR
 from neo.Core.KeyPair import KeyPair
 from neo.Wallets import NEP5Token
 from neo.Settings import settings
@@ -64,7 +67,7 @@ class Wallet:
             self._master_key = bytes(Random.get_random_bytes(32))
             self._keys = {}
             self._contracts = {}
-            self._coins = {}
+            self._coins = CoinStore()
 
             self._current_height = 0
 
@@ -106,7 +109,7 @@ class Wallet:
             self._contracts = self.LoadContracts()
             self._watch_only = self.LoadWatchOnly()
             self._tokens = self.LoadNEP5Tokens()
-            self._coins = self.LoadCoins()
+            self._coins = CoinStore(self.LoadCoins())
             try:
                 h = int(self.LoadStoredData('Height'))
                 self._current_height = h
@@ -364,37 +367,15 @@ class Wallet:
         Returns:
             list: a list of ``neo.Wallet.Coins`` in the wallet that are not spent.
         """
-        ret = []
-        for coin in self.GetCoins():
-            if coin.State & CoinState.Confirmed > 0 and \
-                    coin.State & CoinState.Spent == 0 and \
-                    coin.State & CoinState.Locked == 0 and \
-                    coin.State & CoinState.Frozen == 0 and \
-                    coin.State & CoinState.WatchOnly == watch_only_val:
-
-                do_exclude = False
-                if self._vin_exclude:
-                    for to_exclude in self._vin_exclude:
+        return self._FindUnspentCoins(None, from_addr, use_standard, watch_only_val)
 
-                        if coin.Reference.PrevIndex == to_exclude.PrevIndex and \
-                                coin.Reference.PrevHash == to_exclude.PrevHash:
-                            do_exclude = True
+    def _FindUnspentCoins(self, asset_id, from_addr, use_standard, watch_only_val):
+        coins = self._coins.Unspent(asset_id=asset_id, script_hash=from_addr, watch_only_val=watch_only_val, exclude=self._vin_exclude)
 
-                if do_exclude:
-                    continue
-
-                if from_addr is not None:
-                    if coin.Output.ScriptHash == from_addr:
-                        ret.append(coin)
-                elif use_standard:
-
-                    contract = self._contracts[coin.Output.ScriptHash.ToBytes()]
-                    if contract.IsStandard:
-                        ret.append(coin)
-                else:
-                    ret.append(coin)
+        if from_addr is None and use_standard:
+            coins = [coin for coin in coins if self._contracts[coin.Output.ScriptHash.ToBytes()].IsStandard]
 
-        return ret
+        return coins
 
     def FindUnspentCoinsByAsset(self, asset_id, from_addr=None, use_standard=False, watch_only_val=0):
         """
@@ -409,55 +390,41 @@ class Wallet:
         Returns:
             list: a list of ``neo.Wallet.Coin`` in the wallet that are not spent
         """
-        coins = self.FindUnspentCoins(from_addr=from_addr, use_standard=use_standard, watch_only_val=watch_only_val)
+        return self._FindUnspentCoins(asset_id, from_addr, use_standard, watch_only_val)
 
-        return [coin for coin in coins if coin.Output.AssetId == asset_id]
-
-    def FindUnspentCoinsByAssetAndTotal(self, asset_id, amount, from_addr=None, use_standard=False, watch_only_val=0, reverse=False):
+    def FindUnspentCoinsByAssetAndTotal(self, asset_id, amount, from_addr=None, use_standard=False, watch_only_val=0, reverse=False,
+                                        coin_selector=None):
         """
         Finds unspent coin objects totalling a requested value in the wallet limited to those of a certain asset type.
 
         Args:
             asset_id (UInt256): a bytearray (len 32) representing an asset on the blockchain.
-            amount (int): the amount of unspent coins that are being requested.
+            amount (Fixed8): the amount of unspent coins that are being requested.
             from_addr (UInt160): a bytearray (len 20) representing an address.
             use_standard (bool): whether or not to only include standard contracts ( i.e not a smart contract addr ).
             watch_only_val (int): a flag ( 0 or 64 ) indicating whether or not to find coins that are in 'watch only' addresses.
+            reverse (bool): whether to prefer the largest coins instead of the smallest ones, if no `coin_selector` is given.
+            coin_selector (neo.Wallets.CoinSelection.CoinSelector): (Optional) the strategy selecting the coins. By default a
+                single coin of the exact amount is used if there is one, otherwise the smallest (or largest) coins.
 
         Returns:
-            list: a list of ``neo.Wallet.Coin`` in the wallet that are not spent. this list is empty if there are not enough coins to satisfy the request.
+            list: a list of ``neo.Wallet.Coin`` in the wallet that are not spent. None if there are not enough coins to satisfy the request.
         """
-        coins = self.FindUnspentCoinsByAsset(asset_id, from_addr=from_addr,
-                                             use_standard=use_standard, watch_only_val=watch_only_val)
-
-        sum = Fixed8(0)
+        predicate = None
+        if from_addr is None and use_standard:
+            def predicate(coin):
+                return self._contracts[coin.Output.ScriptHash.ToBytes()].IsStandard
 
-        for coin in coins:
-            sum = sum + coin.Output.Value
+        coins = self._coins.SortedUnspent(asset_id, script_hash=from_addr, watch_only_val=watch_only_val,
+                                          exclude=self._vin_exclude, predicate=predicate)
 
-        if sum < amount:
+        if coins.Total < amount:
             return None
 
-        coins = sorted(coins, key=lambda coin: coin.Output.Value.value)
-
-        if reverse:
-            coins.reverse()
-
-        total = Fixed8(0)
-
-        # go through all coins, see if one is an exact match. then we'll use that
-        for coin in coins:
-            if coin.Output.Value == amount:
-                return [coin]
+        if coin_selector is None:
+            coin_selector = DEFAULT_REVERSE_SELECTOR if reverse else DEFAULT_SELECTOR
 
-        to_ret = []
-        for coin in coins:
-            total = total + coin.Output.Value
-            to_ret.append(coin)
-            if total >= amount:
-                break
-
-        return to_ret
+        return coin_selector.Select(coins, amount)
 
     def GetUnclaimedCoins(self):
         """
@@ -579,21 +546,10 @@ class Wallet:
         Returns:
             Fixed8: total balance.
         """
-        total = Fixed8(0)
-
         if type(asset_id) is NEP5Token.NEP5Token:
             return self.GetTokenBalance(asset_id, watch_only)
 
-        for coin in self.GetCoins():
-            if coin.Output.AssetId == asset_id:
-                if coin.State & CoinState.Confirmed > 0 and \
-                        coin.State & CoinState.Spent == 0 and \
-                        coin.State & CoinState.Locked == 0 and \
-                        coin.State & CoinState.Frozen == 0 and \
-                        coin.State & CoinState.WatchOnly == watch_only:
-                    total = total + coin.Output.Value
-
-        return total
+        return self._coins.Balance(asset_id, watch_only_val=watch_only)
 
     def SaveStoredData(self, key, value):
         # abstract
@@ -637,19 +593,20 @@ class Wallet:
         """
         self._lock.acquire()
         try:
-            blockcount = 0
-            while self._current_height < Blockchain.Default().Height and (block_limit == 0 or blockcount < block_limit):
+            with self.BlockProcessingBatch():
+                blockcount = 0
+                while self._current_height < Blockchain.Default().Height and (block_limit == 0 or blockcount < block_limit):
 
-                block = Blockchain.Default().GetBlockByHeight(self._current_height)
+                    block = Blockchain.Default().GetBlockByHeight(self._current_height)
 
-                if block is not None:
-                    self.ProcessNewBlock(block)
-                else:
-                    break
+                    if block is not None:
+                        self.ProcessNewBlock(block)
+                    else:
+                        break
 
-                blockcount += 1
+                    blockcount += 1
 
-            self.SaveStoredData("Height", self._current_height)
+                self.SaveStoredData("Height", self._current_height)
         except Exception as e:
             logger.warn("Could not process ::: %s " % e)
         finally:
@@ -742,9 +699,20 @@ class Wallet:
         Sets the current height to 0 and now `ProcessBlocks` will start from
         the beginning of the blockchain.
         """
-        self._coins = {}
+        self._coins = CoinStore()
         self._current_height = start_block
 
+    def BlockProcessingBatch(self):
+        """
+        Get a context manager grouping the changes persisted while `ProcessBlocks` processes a chunk of blocks, e.g. into
+        a single database transaction. An implementation discarding the persisted changes when processing the chunk fails
+        has to restore the wallet height and coins as well, so that the blocks are processed again.
+
+        Returns:
+            a context manager, which does nothing by default.
+        """
+        return nullcontext()
+
     def OnProcessNewBlock(self, block, added, changed, deleted):
         # abstract
         pass
@@ -941,10 +909,7 @@ class Wallet:
         Returns:
             list: of UInt256 asset id's.
         """
-        assets = set()
-        for coin in self.GetCoins():
-            assets.add(coin.Output.AssetId)
-        return list(assets)
+        return self._coins.Assets()
 
     def GetCoins(self):
         """
@@ -986,7 +951,8 @@ class Wallet:
                         use_standard=False,
                         watch_only_val=0,
                         exclude_vin=None,
-                        use_vins_for_asset=None):
+                        use_vins_for_asset=None,
+                        coin_selector=None):
         """
         This method is used to to calculate the necessary TransactionInputs (CoinReferences) and TransactionOutputs to
         be used when creating a transaction that involves an exchange of system assets, ( NEO, Gas, etc ).
@@ -1000,6 +966,7 @@ class Wallet:
             watch_only_val (int): 0 or CoinState.WATCH_ONLY, if present only choose coins that are in a WatchOnly address.
             exclude_vin (list): A list of CoinReferences to NOT use in the making of this tx.
             use_vins_for_asset (list): A list of CoinReferences to use.
+            coin_selector (neo.Wallets.CoinSelection.CoinSelector): (Optional) the strategy selecting the coins to pay with.
 
         Returns:
             tx: (Transaction) Returns the transaction with updated inputs and outputs.
@@ -1038,7 +1005,7 @@ class Wallet:
 
         paycoins = {}
 
-        self._vin_exclude = exclude_vin
+        self._vin_exclude = set(exclude_vin) if exclude_vin else None
 
         for assetId, amount in paytotal.items():
 
@@ -1046,7 +1013,8 @@ class Wallet:
                 paycoins[assetId] = self.FindCoinsByVins(use_vins_for_asset[0])
             else:
                 paycoins[assetId] = self.FindUnspentCoinsByAssetAndTotal(
-                    assetId, amount, from_addr=from_addr, use_standard=use_standard, watch_only_val=watch_only_val)
+                    assetId, amount, from_addr=from_addr, use_standard=use_standard, watch_only_val=watch_only_val,
+                    coin_selector=coin_selector)
 
         self._vin_exclude = None
 
@@ -1108,18 +1076,12 @@ class Wallet:
         Returns:
             bool: True is successfully processes, otherwise False if input is not in the coin list, already spent or not confirmed.
         """
-        coins = self.GetCoins()
         changed = []
         added = []
         deleted = []
         found_coin = False
         for input in tx.inputs:
-            coin = None
-
-            for coinref in coins:
-                test_coin = coinref.Reference
-                if test_coin == input:
-                    coin = coinref
+            coin = self._coins.get(input, None)
 
             if coin is None:
                 return False
@@ -0,0 +1,72 @@
+from neo.Utils.NeoTestCase import NeoTestCase
+from neo.Core.CoinReference import CoinReference
+from neo.Core.TX.Transaction import TransactionOutput
+from neo.Core.State.CoinState import CoinState
+from neo.Core.Fixed8 import Fixed8
+from neo.Core.UInt160 import UInt160
+from neo.Core.UInt256 import UInt256
+from neo.Wallets.Coin import Coin
+from neo.Wallets.CoinStore import CoinStore
+from neo.Wallets.CoinSelection import ExactMatch, SmallestFirst, LargestFirst, BranchAndBound, FirstOf, DEFAULT_SELECTOR
+
+
+class CoinSelectionTestCase(NeoTestCase):
+    asset = UInt256(data=bytearray(b'\x01' * 32))
+    addr1 = UInt160(data=bytearray(b'\x01' * 20))
+    addr2 = UInt160(data=bytearray(b'\x02' * 20))
+
+    def coins(self, *values, addr=None):
+        coins = []
+        for index, value in enumerate(values):
+            reference = CoinReference(UInt256(data=bytearray(b'\xaa' * 32)), index)
+            output = TransactionOutput(self.asset, Fixed8.FromDecimal(value), addr or self.addr1)
+            coins.append(Coin.CoinFromRef(reference, output, CoinState.Confirmed))
+        self.store = CoinStore({coin.Reference: coin for coin in coins})
+        return coins
+
+    def select(self, selector, amount, **kwargs):
+        return selector.Select(self.store.SortedUnspent(self.asset, **kwargs), Fixed8.FromDecimal(amount))
+
+    def test_sorted_unspent(self):
+        coins = self.coins(5, 1, 3, 1, 8)
+        sorted_coins = self.store.SortedUnspent(self.asset)
+
+        self.assertEqual(sorted_coins.Total, Fixed8.FromDecimal(18))
+        self.assertEqual(list(sorted_coins.Ascending()), [coins[1], coins[3], coins[2], coins[0], coins[4]])
+        self.assertEqual(list(sorted_coins.Ascending(Fixed8.FromDecimal(3).value)), [coins[2], coins[0], coins[4]])
+        self.assertEqual(list(sorted_coins.Descending(Fixed8.FromDecimal(4).value)), [coins[2], coins[3], coins[1]])
+
+        sorted_coins = self.store.SortedUnspent(self.asset, exclude={coins[4].Reference, coins[1].Reference})
+        self.assertEqual(sorted_coins.Total, Fixed8.FromDecimal(9))
+        self.assertEqual(list(sorted_coins.Descending()), [coins[0], coins[2], coins[3]])
+
+        self.assertEqual(self.store.SortedUnspent(self.asset, script_hash=self.addr2).Total, Fixed8(0))
+
+    def test_strategies(self):
+        coins = self.coins(5, 1, 3, 1, 8)
+
+        self.assertEqual(self.select(ExactMatch(), 3), [coins[2]])
+        self.assertEqual(self.select(ExactMatch(), 1), [coins[1]])
+        self.assertEqual(self.select(ExactMatch(reverse=True), 1), [coins[3]])
+        self.assertIsNone(self.select(ExactMatch(), 4))
+
+        self.assertEqual(self.select(SmallestFirst(), 4), [coins[1], coins[3], coins[2]])
+        self.assertEqual(self.select(LargestFirst(), 10), [coins[4], coins[0]])
+        self.assertIsNone(self.select(SmallestFirst(), 19))
+
+        # 12 = 8 + 3 + 1, no change needed
+        selection = self.select(BranchAndBound(), 12)
+        self.assertEqual(sum(coin.Output.Value.value for coin in selection), Fixed8.FromDecimal(12).value)
+        self.assertIsNone(self.select(BranchAndBound(), 19))
+        self.assertIsNone(self.select(BranchAndBound(max_tries=1), 12))
+
+        self.assertEqual(self.select(FirstOf(ExactMatch(), LargestFirst()), 8), [coins[4]])
+        self.assertEqual(self.select(FirstOf(ExactMatch(), LargestFirst()), 2), [coins[4]])
+        self.assertEqual(self.select(DEFAULT_SELECTOR, 2), [coins[1], coins[3]])
+
+    def test_predicate(self):
+        coins = self.coins(1, 2, 4)
+
+        selector = FirstOf(BranchAndBound(), SmallestFirst())
+        self.assertEqual(self.select(selector, 3, predicate=lambda coin: coin is not coins[0]), [coins[1], coins[2]])
+        self.assertEqual(self.select(selector, 3, exclude={coins[1].Reference}), [coins[0], coins[2]])
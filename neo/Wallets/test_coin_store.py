@@ -0,0 +1,97 @@
+from neo.Utils.NeoTestCase import NeoTestCase
+from neo.Core.CoinReference import CoinReference
+from neo.Core.TX.Transaction import TransactionOutput
+from neo.Core.State.CoinState import CoinState
+from neo.Core.Fixed8 import Fixed8
+from neo.Core.UInt160 import UInt160
+from neo.Core.UInt256 import UInt256
+from neo.Wallets.Coin import Coin
+from neo.Wallets.CoinStore import CoinStore
+
+
+class CoinStoreTestCase(NeoTestCase):
+    asset1 = UInt256(data=bytearray(b'\x01' * 32))
+    asset2 = UInt256(data=bytearray(b'\x02' * 32))
+    addr1 = UInt160(data=bytearray(b'\x01' * 20))
+    addr2 = UInt160(data=bytearray(b'\x02' * 20))
+
+    def coin(self, index, asset, addr, value, state=CoinState.Confirmed):
+        reference = CoinReference(UInt256(data=bytearray(b'\xaa' * 32)), index)
+        return Coin.CoinFromRef(reference, TransactionOutput(asset, Fixed8.FromDecimal(value), addr), state)
+
+    def store(self, coins):
+        return CoinStore({coin.Reference: coin for coin in coins})
+
+    def test_unspent(self):
+        coins = [
+            self.coin(0, self.asset1, self.addr1, 1),
+            self.coin(1, self.asset2, self.addr1, 2),
+            self.coin(2, self.asset1, self.addr2, 3),
+            self.coin(3, self.asset1, self.addr1, 4, CoinState.Unconfirmed),
+            self.coin(4, self.asset1, self.addr1, 5, CoinState.Confirmed | CoinState.Spent),
+            self.coin(5, self.asset1, self.addr2, 6, CoinState.Confirmed | CoinState.WatchOnly),
+            self.coin(6, self.asset1, self.addr1, 7),
+        ]
+        store = self.store(coins)
+
+        self.assertEqual(len(store), 7)
+        self.assertIn(coins[3].Reference, store)
+        self.assertEqual(list(store.values()), coins)
+
+        # in the order the coins were added
+        self.assertEqual(store.Unspent(), [coins[0], coins[1], coins[2], coins[6]])
+        self.assertEqual(store.Unspent(asset_id=self.asset1), [coins[0], coins[2], coins[6]])
+        self.assertEqual(store.Unspent(asset_id=self.asset1, script_hash=self.addr1), [coins[0], coins[6]])
+        self.assertEqual(store.Unspent(script_hash=self.addr1), [coins[0], coins[1], coins[6]])
+        self.assertEqual(store.Unspent(watch_only_val=CoinState.WatchOnly), [coins[5]])
+        self.assertEqual(store.Unspent(asset_id=self.asset1, exclude={coins[0].Reference}), [coins[2], coins[6]])
+        self.assertEqual(store.Unspent(asset_id=UInt256(data=bytearray(32))), [])
+
+        self.assertEqual(store.Balance(self.asset1), Fixed8.FromDecimal(11))
+        self.assertEqual(store.Balance(self.asset1, script_hash=self.addr1), Fixed8.FromDecimal(8))
+        self.assertEqual(store.Balance(self.asset1, watch_only_val=CoinState.WatchOnly), Fixed8.FromDecimal(6))
+        self.assertEqual(store.Balance(self.asset2, script_hash=self.addr2), Fixed8(0))
+
+        self.assertEqual(set(store.Assets()), {self.asset1, self.asset2})
+
+    def test_changes(self):
+        coins = [
+            self.coin(0, self.asset1, self.addr1, 1, CoinState.Unconfirmed),
+            self.coin(1, self.asset1, self.addr1, 2),
+            self.coin(2, self.asset2, self.addr2, 3),
+        ]
+        store = self.store(coins)
+        self.assertEqual(store.Unspent(), [coins[1], coins[2]])
+
+        # changing the state of a stored coin updates the index
+        coins[0].State |= CoinState.Confirmed
+        self.assertEqual(store.Unspent(), coins)
+        self.assertEqual(store.Balance(self.asset1), Fixed8.FromDecimal(3))
+
+        coins[1].State |= CoinState.Spent
+        self.assertEqual(store.Unspent(asset_id=self.asset1), [coins[0]])
+        self.assertEqual(store.Balance(self.asset1), Fixed8.FromDecimal(1))
+
+        coins[0].State |= CoinState.WatchOnly
+        self.assertEqual(store.Balance(self.asset1), Fixed8(0))
+        self.assertEqual(store.Balance(self.asset1, watch_only_val=CoinState.WatchOnly), Fixed8.FromDecimal(1))
+
+        del store[coins[2].Reference]
+        self.assertEqual(store.Unspent(), [])
+        self.assertEqual(store.Balance(self.asset2), Fixed8(0))
+        self.assertEqual(store.Assets(), [self.asset1])
+
+        # removed coins don't change the index anymore
+        coins[2].State = CoinState.Confirmed
+        self.assertEqual(store.Unspent(), [])
+
+        # replacing a coin keeps its position
+        replacement = self.coin(0, self.asset1, self.addr1, 10)
+        coin = self.coin(3, self.asset1, self.addr1, 4)
+        store[coin.Reference] = coin
+        store[replacement.Reference] = replacement
+        self.assertEqual(store.Unspent(), [replacement, coin])
+        self.assertEqual(store.Balance(self.asset1, script_hash=self.addr1), Fixed8.FromDecimal(14))
+
+        coins[0].State = CoinState.Confirmed
+        self.assertEqual(store.Balance(self.asset1, script_hash=self.addr1), Fixed8.FromDecimal(14))
@@ -228,6 +228,13 @@ class JsonRpcApi:
 
         elif method == "getblock":
             # this should work for either str or int
+            if len(params) < 2 or not params[1]:
+                # serialized from the stored data, without deserializing the block
+                raw_block = Blockchain.Default().GetRawBlock(params[0])
+                if raw_block is None:
+                    raise JsonRpcError(-100, "Unknown block")
+                return raw_block.hex()
+
             block = Blockchain.Default().GetBlock(params[0])
             if not block:
                 raise JsonRpcError(-100, "Unknown block")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+from neo.Settings import settings
+from neo.Storage.Common.Migration import migrateDatabaseAt
+from prompt_toolkit import prompt
+from tqdm import tqdm
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a blockchain database to the current (binary) schema")
+    parser.add_argument("-m", "--mainnet", action="store_true", default=False,
+                        help="use MainNet instead of the default TestNet")
+    parser.add_argument("-c", "--config", action="store", help="Use a specific config file")
+
+    parser.add_argument("-s", "--skipconfirm", action="store_true", default=False,
+                        help="Bypass the confirmation prompt")
+
+    parser.add_argument("-k", "--keep-legacy", action="store_true", default=False,
+                        help="Keep the original database in a '.legacy' directory when finished")
+
+    # Where to store stuff
+    parser.add_argument("--datadir", action="store",
+                        help="Absolute path to use for database directories")
+
+    args = parser.parse_args()
+
+    if args.mainnet and args.config:
+        print("Cannot use both --config and --mainnet parameters, please use only one.")
+        exit(1)
+
+    # Setting the datadir must come before setting the network, else the wrong path is checked at net setup.
+    if args.datadir:
+        settings.set_data_dir(args.datadir)
+
+    # Setup depending on command line arguments. By default, the testnet settings are already loaded.
+    if args.config:
+        settings.setup(args.config)
+    elif args.mainnet:
+        settings.setup_mainnet()
+
+    path = settings.chain_leveldb_path
+
+    if not args.skipconfirm:
+        print("This will convert the database in %s, make sure no other process is using it.\nType 'confirm' to continue" % path)
+        try:
+            confirm = prompt("[confirm]> ", is_password=False)
+        except KeyboardInterrupt:
+            confirm = False
+        if not confirm == 'confirm':
+            print("Cancelled operation")
+            return False
+
+    with tqdm(desc='Migrating records', unit=' Record') as pbar:
+        def progress(count):
+            pbar.update(count - pbar.n)
+
+        migrated = migrateDatabaseAt(path, keep_legacy=args.keep_legacy, progress=progress)
+
+    if migrated:
+        print("Successfully migrated %s" % path)
+    else:
+        print("Nothing to migrate, %s does not contain a database with the previous schema" % path)
+
+    return migrated
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,7 @@ setup(
             'np-sign=neo.bin.sign_message:main',
             'np-export=neo.bin.export_blocks:main',
             'np-import=neo.bin.import_blocks:main',
+            'np-migrate-db=neo.bin.migrate_db:main',
             'np-utils=neo.Core.bin.cli:main',
         ],
     },